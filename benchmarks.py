@@ -0,0 +1,404 @@
+"""Benchmarks of the BoardModel hot paths and of BoardView.draw_board, across grid sizes and
+pokemon densities. The bitboard_ benchmarks run the same paths on BitboardModel, to compare
+the two engines size for size.
+
+Each benchmark builds its game outside the timed section, then times one run of the path
+being measured, several times over; the best and median times are reported along with the
+best time per cell, which makes super-linear growth easy to spot between sizes. Results are
+written as JSON. Given a baseline written by an earlier run, any benchmark slower than the
+baseline by more than the tolerance is reported and the exit status is 1.
+
+The draw_board benchmarks need a display. If there is none and Xvfb is installed, one is
+started for the run, otherwise they are skipped.
+
+The startup benchmarks time a cold interpreter importing each of STARTUP_MODULES, and
+report from -X importtime the cumulative import time and the heaviest modules it loads.
+
+Usage:
+    python benchmarks.py --output baseline.json
+    python benchmarks.py --compare baseline.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from bitboard import BitboardModel
+from board_model import BoardModel, FLAG, UNEXPOSED, neighbour_indexes, place_pokemons
+
+GRID_SIZES = (10, 100, 1000)
+QUICK_GRID_SIZES = (10, 100)
+DENSITIES = (0.01, 0.15, 0.5, 0.9)
+# Drawing creates a canvas item per cell, bigger boards take minutes on the first draw.
+MAX_DRAW_GRID_SIZE = 200
+# Modules imported from a cold start by the startup benchmarks: the engine alone, the game
+# module headless code imports, and the whole GUI.
+STARTUP_MODULES = ('board_model', 'minesweeper', 'gui')
+# Heaviest imports listed per startup benchmark.
+STARTUP_REPORT_SIZE = 10
+# Times below this are too noisy to count as a regression.
+NOISE_FLOOR = 0.0005
+
+def _layout(grid_size, density, safe_index=None):
+    """Places pokemons for a benchmark, the same for every run.
+
+    Returns:
+        (tuple<int>): Pokemon indexes.
+    """
+    cell_count = grid_size ** 2
+    num_pokemon = min(int(cell_count * density), cell_count - 9)
+    excluded = ()
+    if safe_index is not None:
+        excluded = [safe_index] + list(neighbour_indexes(safe_index, grid_size))
+    return place_pokemons(cell_count, num_pokemon, random.Random(grid_size), excluded)
+
+def _model(grid_size, density, safe_index=None, engine=BoardModel):
+    """Builds a fresh game for a benchmark, on BoardModel or BitboardModel."""
+    locations = _layout(grid_size, density, safe_index)
+    return engine(grid_size, len(locations), seed=grid_size, pokemon_locations=locations)
+
+def _sample(grid_size, count=10000):
+    """Spreads up to count indexes evenly over the board."""
+    cell_count = grid_size ** 2
+    return range(0, cell_count, max(1, cell_count // count))
+
+def bench_generate_pokemons(grid_size, density):
+    """Draws a new pokemon layout with a safe first click."""
+    model = _model(grid_size, density)
+    safe_index = grid_size ** 2 // 2
+    return lambda: model.generate_pokemons(seed=1, safe_index=safe_index)
+
+def bench_replace_character_at_index(grid_size, density):
+    """Flags and unflags a sample of cells, then rebuilds the game string once."""
+    model = _model(grid_size, density)
+    indexes = _sample(grid_size)
+
+    def run():
+        for index in indexes:
+            model.replace_character_at_index(index, FLAG)
+        for index in indexes:
+            model.replace_character_at_index(index, UNEXPOSED)
+        model.get_game()
+    return run
+
+def bench_number_at_cell(grid_size, density):
+    """Counts the pokemons next to a sample of cells."""
+    model = _model(grid_size, density)
+    indexes = _sample(grid_size)
+    return lambda: [model.number_at_cell(index) for index in indexes]
+
+def bench_set_pokemon_locations(grid_size, density, engine=BoardModel):
+    """Places a layout, counting the pokemons next to every cell."""
+    model = _model(grid_size, density, engine=engine)
+    locations = model.get_pokemon_locations()
+    return lambda: model.set_pokemon_locations(locations)
+
+def bench_first_click(grid_size, density, engine=BoardModel):
+    """Reveals from a first click guaranteed to be safe, on a game that has not searched its
+    openings yet."""
+    safe_index = grid_size * (grid_size // 2) + grid_size // 2
+    model = _model(grid_size, density, safe_index, engine)
+    return lambda: model.reveal_Cells(safe_index)
+
+def bench_empty_board_click(grid_size, density, engine=BoardModel):
+    """Worst case of big_fun_search: a board with no pokemons opens in one click."""
+    model = engine(grid_size, 0, pokemon_locations=())
+    return lambda: model.big_fun_search(0)
+
+def bench_check_win(grid_size, density, engine=BoardModel):
+    """Checks for a win and a loss after every one of a sample of flags."""
+    model = _model(grid_size, density, engine=engine)
+    indexes = _sample(grid_size, 1000)
+
+    def run():
+        for index in indexes:
+            model.flag_cell(index)
+            model.check_win()
+            model.check_loss()
+    return run
+
+def bench_bitboard_set_pokemon_locations(grid_size, density):
+    """set_pokemon_locations on BitboardModel."""
+    return bench_set_pokemon_locations(grid_size, density, BitboardModel)
+
+def bench_bitboard_first_click(grid_size, density):
+    """first_click on BitboardModel."""
+    return bench_first_click(grid_size, density, BitboardModel)
+
+def bench_bitboard_empty_board_click(grid_size, density):
+    """empty_board_click on BitboardModel."""
+    return bench_empty_board_click(grid_size, density, BitboardModel)
+
+def bench_bitboard_check_win(grid_size, density):
+    """check_win on BitboardModel."""
+    return bench_check_win(grid_size, density, BitboardModel)
+
+MODEL_BENCHMARKS = {
+    'generate_pokemons': bench_generate_pokemons,
+    'set_pokemon_locations': bench_set_pokemon_locations,
+    'replace_character_at_index': bench_replace_character_at_index,
+    'number_at_cell': bench_number_at_cell,
+    'first_click': bench_first_click,
+    'check_win': bench_check_win,
+    'bitboard_set_pokemon_locations': bench_bitboard_set_pokemon_locations,
+    'bitboard_first_click': bench_bitboard_first_click,
+    'bitboard_check_win': bench_bitboard_check_win,
+}
+# Benchmarks that do not depend on the density, run once per grid size.
+SIZE_BENCHMARKS = {
+    'empty_board_click': bench_empty_board_click,
+    'bitboard_empty_board_click': bench_bitboard_empty_board_click,
+}
+
+def time_benchmark(setup, repeats):
+    """Times a benchmark, building its game again before each run.
+
+    Parameters:
+        setup (callable): Builds the game and returns the function to time.
+        repeats (int): Number of timed runs.
+
+    Returns:
+        (tuple<float, float>): Best and median seconds.
+    """
+    times = []
+    for _ in range(repeats):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+def _result(name, grid_size, density, best, median, repeats):
+    """Formats one benchmark result."""
+    return {'name': name, 'grid_size': grid_size, 'density': density, 'best': best,
+            'median': median, 'repeats': repeats, 'per_cell_ns': best / grid_size ** 2 * 1e9}
+
+def run_model_benchmarks(grid_sizes, densities, repeats, only=None):
+    """Runs the BoardModel benchmarks.
+
+    Yields:
+        (dict): One result per benchmark, size and density.
+    """
+    for grid_size in grid_sizes:
+        # Big boards are slow to build for every run, a few runs are enough.
+        size_repeats = repeats if grid_size < 1000 else min(repeats, 3)
+        for name, bench in SIZE_BENCHMARKS.items():
+            if only is None or name in only:
+                best, median = time_benchmark(lambda: bench(grid_size, 0.0), size_repeats)
+                yield _result(name, grid_size, 0.0, best, median, size_repeats)
+        for density in densities:
+            for name, bench in MODEL_BENCHMARKS.items():
+                if only is None or name in only:
+                    best, median = time_benchmark(lambda: bench(grid_size, density), size_repeats)
+                    yield _result(name, grid_size, density, best, median, size_repeats)
+
+def _start_virtual_display():
+    """Starts Xvfb if there is no display and it is installed.
+
+    Returns:
+        (subprocess.Popen): The Xvfb process, None if none was started.
+    """
+    if os.environ.get('DISPLAY') or shutil.which('Xvfb') is None:
+        return None
+    display = ':%d' % (90 + os.getpid() % 100)
+    process = subprocess.Popen(['Xvfb', display, '-screen', '0', '1024x768x24'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    if process.poll() is not None:
+        return None
+    os.environ['DISPLAY'] = display
+    return process
+
+def run_draw_benchmarks(grid_sizes, densities, repeats, only=None):
+    """Runs the draw_board benchmarks of both board views: the first draw of a board, and
+    the redraw after a first click.
+
+    Yields:
+        (dict): One result per benchmark, size and density, or one skipped entry if there is
+        no display.
+    """
+    names = ('draw_board', 'draw_board_images')
+    if only is not None and not any(name in only for name in names):
+        return
+    xvfb = _start_virtual_display()
+    try:
+        try:
+            import tkinter as tk
+            import gui
+            root = tk.Tk()
+        except Exception as e:
+            yield {'name': 'draw_board', 'skipped': str(e) or type(e).__name__}
+            return
+        root.withdraw()
+        try:
+            views = {'draw_board': gui.BoardView, 'draw_board_images': gui.ImageBoardView}
+            for grid_size in grid_sizes:
+                if grid_size > MAX_DRAW_GRID_SIZE:
+                    continue
+                for density in densities:
+                    for name, view_class in views.items():
+                        if only is not None and name not in only:
+                            continue
+                        safe_index = grid_size * (grid_size // 2) + grid_size // 2
+                        for phase in ('first', 'click'):
+                            times = []
+                            for _ in range(repeats):
+                                view = view_class(root, grid_size, board_width=600)
+                                model = _model(grid_size, density, safe_index)
+                                if phase == 'click':
+                                    view.draw_board(model.get_game(), model.drain_dirty())
+                                    model.reveal_Cells(safe_index)
+                                start = time.perf_counter()
+                                view.draw_board(model.get_game(), model.drain_dirty())
+                                root.update_idletasks()
+                                times.append(time.perf_counter() - start)
+                                view.destroy()
+                            yield _result(f'{name}_{phase}', grid_size, density, min(times),
+                                          statistics.median(times), repeats)
+        finally:
+            root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+def import_times(module):
+    """Imports a module in a fresh interpreter under -X importtime.
+
+    Parameters:
+        module (str): Module to import.
+
+    Returns:
+        (dict<str, int>): Cumulative microseconds spent importing each module loaded.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                             cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True,
+                             text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+def run_startup_benchmarks(repeats, only=None):
+    """Times a cold start importing each of STARTUP_MODULES: the whole interpreter run,
+    several times over, then one -X importtime run for the import breakdown.
+
+    Yields:
+        (dict): One result per module, with the modules it loads that matter for startup.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for module in STARTUP_MODULES:
+        name = f'startup_{module}'
+        if only is not None and name not in only:
+            continue
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', f'import {module}'], cwd=directory, check=True)
+            times.append(time.perf_counter() - start)
+        imports = import_times(module)
+        heaviest = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:STARTUP_REPORT_SIZE]
+        yield {'name': name, 'grid_size': 0, 'density': 0.0, 'best': min(times),
+               'median': statistics.median(times), 'repeats': repeats,
+               'import_ms': imports.get(module, 0) / 1000, 'modules_loaded': len(imports),
+               'loads_tkinter': 'tkinter' in imports, 'loads_pil': 'PIL' in imports,
+               'heaviest_ms': [[imported, cumulative / 1000] for imported, cumulative in heaviest]}
+
+def _key(result):
+    return (result['name'], result['grid_size'], result['density'])
+
+def compare(results, baseline, tolerance):
+    """Compares results against a baseline.
+
+    Parameters:
+        results (list<dict>): Results of this run.
+        baseline (list<dict>): Results of the baseline run.
+        tolerance (float): Allowed slowdown, 0.25 for 25%.
+
+    Returns:
+        (list<str>): A description of each regression.
+    """
+    previous = {_key(result): result for result in baseline if 'skipped' not in result}
+    regressions = []
+    for result in results:
+        if 'skipped' in result or _key(result) not in previous:
+            continue
+        before = previous[_key(result)]['best']
+        after = result['best']
+        if after > NOISE_FLOOR and after > before * (1 + tolerance):
+            regressions.append('%s grid %d density %.2f: %.6fs -> %.6fs (%+.0f%%)'
+                               % (*_key(result), before, after, (after / before - 1) * 100))
+    return regressions
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the board model and views.")
+    parser.add_argument('--grid-sizes', type=int, nargs='+', default=None)
+    parser.add_argument('--densities', type=float, nargs='+', default=DENSITIES)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--quick', action='store_true', help="skip the 1000x1000 boards")
+    parser.add_argument('--only', nargs='+', default=None, help="benchmark names to run")
+    parser.add_argument('--no-draw', action='store_true', help="skip the draw_board benchmarks")
+    parser.add_argument('--no-startup', action='store_true', help="skip the startup benchmarks")
+    parser.add_argument('--output', help="file to write the JSON results to, default stdout")
+    parser.add_argument('--compare', help="baseline JSON to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    grid_sizes = args.grid_sizes or (QUICK_GRID_SIZES if args.quick else GRID_SIZES)
+    only = set(args.only) if args.only else None
+    results = []
+    for result in run_model_benchmarks(grid_sizes, args.densities, args.repeats, only):
+        results.append(result)
+        print('%(name)s grid %(grid_size)d density %(density).2f: %(best).6fs' % result, file=sys.stderr)
+    if not args.no_draw:
+        for result in run_draw_benchmarks(grid_sizes, args.densities, args.repeats, only):
+            results.append(result)
+            if 'skipped' in result:
+                print('%(name)s skipped: %(skipped)s' % result, file=sys.stderr)
+            else:
+                print('%(name)s grid %(grid_size)d density %(density).2f: %(best).6fs' % result, file=sys.stderr)
+
+    if not args.no_startup:
+        for result in run_startup_benchmarks(args.repeats, only):
+            results.append(result)
+            print('%(name)s: %(best).6fs, imports %(import_ms).1fms, %(modules_loaded)d modules, tkinter %(loads_tkinter)s'
+                  % result, file=sys.stderr)
+            for imported, cumulative in result['heaviest_ms']:
+                print('    %8.1fms %s' % (cumulative, imported), file=sys.stderr)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    text = json.dumps(report, indent=1)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print('REGRESSION ' + regression, file=sys.stderr)
+        if regressions:
+            return 1
+        print('No regressions against ' + args.compare, file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
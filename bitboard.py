@@ -0,0 +1,621 @@
+"""Bitboard engine: the board held as Python integers, one bit per cell.
+
+BitboardModel keeps the pokemons, revealed cells, flags and exposed pokemons as four
+arbitrary precision integers, bit i standing for cell i, and has the same interface as
+BoardModel. Every whole board operation is a handful of integer operations, which run in
+C over 30 bits per step instead of a Python loop per cell:
+
+    neighbour counts  the eight neighbour-shifted pokemon boards, masked at the grid's
+                      edges, added up bit-sliced into four count planes
+    openings          the clicked cell dilated (shifted ORs masked at the edges) and
+                      masked by the unflagged zero cells until it stops growing
+    counts and wins   int.bit_count of the boards and comparisons of whole boards
+
+Revealed cells always show their neighbour count, and only the characters of the cell
+kinds (unexposed, flag, numbers and pokemon) can be written. Per-cell characters are only
+built, for the whole board at once, when the game string is asked for.
+"""
+import random
+
+from board_model import (POKEMON, FLAG, UNEXPOSED, UP, DOWN, LEFT, RIGHT, REVEAL, FLAG_MOVE, MoveResult,
+                         KIND_UNEXPOSED, KIND_FLAG, KIND_REVEALED, KIND_POKEMON,
+                         _CELL_BYTES, _CELL_KINDS, _FROM_CELL_BYTES, _TO_CELL_BYTES,
+                         _FLAG, _UNEXPOSED, _POKEMON, _DIGITS, check_seed, neighbour_indexes, place_pokemons)
+from savefile import _CELL_STATES, _STATE_CELLS, _pack, _unpack
+
+# Cell state to its low and high bit, see savefile.
+_LOW_STATE_BIT = bytes(state & 1 for state in range(256))
+_HIGH_STATE_BIT = bytes(state >> 1 & 1 for state in range(256))
+
+class BitboardModel:
+    """Model class that holds the game as bitboards."""
+
+    def __init__(self, grid_size, num_pokemon, seed=None, rng=None, pokemon_locations=None):
+        """Construct a game, see BoardModel.
+
+        Parameters:
+            grid_size (int): size of grid(game board will always be square)
+            num_pokemon (int): number of pokemons in game.
+            seed (int): Seed of the first board, drawn from rng if not given.
+            rng (random.Random): Generator that seeds new boards, a fresh one if not given.
+            pokemon_locations (tuple<int>): Places the first board's pokemons here instead
+                of generating them.
+        """
+        check_seed(seed)
+        self._grid_size = grid_size
+        self._num_pokemon = num_pokemon
+        self._rng = rng if rng is not None else random.Random()
+        self._cell_count = cell_count = grid_size ** 2
+        self._full = (1 << cell_count) - 1
+        first_col = bytearray(cell_count)
+        first_col[::grid_size] = bytes([1]) * grid_size
+        last_col = bytearray(cell_count)
+        last_col[grid_size - 1::grid_size] = bytes([1]) * grid_size
+        self._not_first_col = self._full & ~self._from_cells(first_col)
+        self._not_last_col = self._full & ~self._from_cells(last_col)
+        self._revealed = 0
+        self._flags = 0
+        self._exposed = 0
+        self._dirty = 0
+        self._changes = None
+        self._game_string = None
+        if pokemon_locations is None:
+            self.new_pokemons(seed)
+        else:
+            self.set_pokemon_locations(pokemon_locations, seed)
+
+    def _from_cells(self, cells):
+        """Packs one 0 or 1 byte per cell into a bitboard."""
+        return int.from_bytes(_pack(cells, 1), 'little')
+
+    def _to_cells(self, bits):
+        """Unpacks a bitboard into one 0 or 1 byte per cell."""
+        return _unpack(bits.to_bytes(-(-self._cell_count // 8), 'little'), 1, self._cell_count)
+
+    def _indexes(self, bits):
+        """Lists the cells set in a bitboard, in index order."""
+        cells = self._to_cells(bits)
+        indexes = []
+        index = cells.find(1)
+        while index != -1:
+            indexes.append(index)
+            index = cells.find(1, index + 1)
+        return indexes
+
+    def _neighbour_boards(self, bits):
+        """Shifts a bitboard onto each of the eight neighbours of its cells.
+
+        Returns:
+            (list<int>): For each direction, the cells whose neighbour that way is set.
+        """
+        grid_size = self._grid_size
+        full = self._full
+        # Bit i of left is cell i - 1, of right cell i + 1, never wrapping across rows.
+        left = bits << 1 & self._not_first_col
+        right = bits >> 1 & self._not_last_col
+        boards = [left, right]
+        for row in (bits, left, right):
+            boards.append(row << grid_size & full)
+            boards.append(row >> grid_size)
+        return boards
+
+    def _dilate(self, bits):
+        """Grows a bitboard onto the eight neighbours of its cells."""
+        grid_size = self._grid_size
+        row = bits | bits << 1 & self._not_first_col | bits >> 1 & self._not_last_col
+        return (row | row << grid_size | row >> grid_size) & self._full
+
+    def generate_pokemons(self, seed=None, safe_index=None):
+        """Generates new pokemon locations, see BoardModel.generate_pokemons.
+
+            Parameters:
+                seed (int): Seed of the board, drawn from the model's generator if not given.
+                safe_index (int): Index of a first click; it and its neighbours stay free of pokemons.
+
+            Returns:
+                (tuple<int>): Indexes of the generated pokemons."""
+        if seed is None:
+            seed = self._rng.getrandbits(64)
+        excluded = ()
+        if safe_index is not None:
+            excluded = [safe_index] + self.neighbour_directions(safe_index)
+        return place_pokemons(self._cell_count, self._num_pokemon, random.Random(seed), excluded)
+
+    def new_pokemons(self, seed=None, safe_index=None):
+        """Generates and places new pokemon locations, see generate_pokemons."""
+        if seed is None:
+            seed = self._rng.getrandbits(64)
+        self.set_pokemon_locations(self.generate_pokemons(seed, safe_index), seed, safe_index, seeded=True)
+
+    def set_pokemon_locations(self, pokemon_locations, seed=None, first_click=None, seeded=False):
+        """Places the pokemons and counts the pokemons next to every cell, for the whole
+        board at once.
+
+        Parameters:
+            pokemon_locations (tuple<int>): Indexes of pokemons in game string.
+            seed (int): Seed the locations were generated from, if known.
+            first_click (int): Safe first click the locations were generated for, if any.
+            seeded (bool): Whether the locations are exactly what generate_pokemons gives for
+                seed and first_click, see is_seeded.
+        """
+        self._seed = seed
+        self._first_click = first_click
+        self._seeded = seeded and seed is not None
+        self._pokemon_locations = tuple(pokemon_locations)
+        cells = bytearray(self._cell_count)
+        for index in self._pokemon_locations:
+            cells[index] = 1
+        self._pokemons = pokemons = self._from_cells(cells)
+
+        # Bit-sliced addition of the eight neighbour boards: planes[k] holds bit k of
+        # every cell's count.
+        planes = []
+        for board in self._neighbour_boards(pokemons):
+            for plane, value in enumerate(planes):
+                planes[plane], board = value ^ board, value & board
+                if not board:
+                    break
+            if board:
+                planes.append(board)
+        counts = 0
+        any_count = 0
+        for plane, value in enumerate(planes):
+            counts |= int.from_bytes(self._to_cells(value), 'little') << plane
+            any_count |= value
+        # One byte per cell holding its count, shifted into place for get_game.
+        self._counts = counts
+        self._adjacent = counts.to_bytes(self._cell_count, 'little')
+        self._zeros = self._full & ~pokemons & ~any_count
+
+    def get_grid_size(self):
+        """Returns the size of the grid.
+
+        Returns:
+            (int): Number of rows (and columns) of the board.
+        """
+        return self._grid_size
+
+    def get_pokemon_locations(self):
+        """Returns the pokemon locations.
+
+        Returns:
+            (tuple<int>): Indexes of pokemons in game string.
+        """
+        return self._pokemon_locations
+
+    def get_num_pokemon(self):
+        """Returns the number of pokemons on the board.
+
+        Returns:
+            (int): Number of pokemons.
+        """
+        return len(self._pokemon_locations)
+
+    def get_seed(self):
+        """Returns the seed the current pokemon locations were generated from.
+
+        Returns:
+            (int): Seed of the board, None if the locations were not generated from a seed.
+        """
+        return self._seed
+
+    def get_first_click(self):
+        """Returns the index of the first click the pokemons were placed away from.
+
+        Returns:
+            (int): Index in game string, None if the placement had no safe first click.
+        """
+        return self._first_click
+
+    def is_seeded(self):
+        """Returns whether the pokemons were generated from get_seed() and get_first_click()."""
+        return self._seeded
+
+    def is_pokemon(self, index):
+        """Checks if there is a pokemon at specified index.
+
+        Returns:
+            (bool): True if a pokemon is hidden at index.
+        """
+        return self._pokemons >> index & 1 == 1
+
+    def position_to_index(self, position):
+        """Converts row, column coordinate in grid to game strings index.
+
+        Parameters:
+            position (tuple<int, int>): Row, column position of cell on grid.
+
+        Returns:
+            (int): Index of cell on game string.
+        """
+        row, col = position
+        return row * self._grid_size + col
+
+    def index_in_direction(self, index, direction):
+        """Index of the cell next to index in a direction, see BoardModel.index_in_direction.
+
+        Parameters:
+            index (int): The index on game string.
+            direction (str): Direction of adjacent cell.
+
+        Returns:
+            (int): Index of the adjacent cell, None if it is off the board.
+        """
+        col = index % self._grid_size
+        row = index // self._grid_size
+        if RIGHT in direction:
+            col += 1
+        elif LEFT in direction:
+            col -= 1
+        if UP in direction:
+            row -= 1
+        elif DOWN in direction:
+            row += 1
+        if not (0 <= col < self._grid_size and 0 <= row < self._grid_size):
+            return None
+        return self.position_to_index((row, col))
+
+    def neighbour_directions(self, index):
+        """Indexes of the cells next to index.
+
+        Returns:
+            (list<int>): Indexes of the neighbouring cells.
+        """
+        return neighbour_indexes(index, self._grid_size)
+
+    def get_cell(self, index):
+        """Returns the character of one cell.
+
+        Returns:
+            (str): Character at index.
+        """
+        bit = 1 << index
+        if self._revealed & bit:
+            return str(self._adjacent[index])
+        if self._flags & bit:
+            return FLAG
+        if self._exposed & bit:
+            return POKEMON
+        return UNEXPOSED
+
+    def _kind(self, bit):
+        """Returns the kind of the cell of a one bit board, one of the KIND_ constants."""
+        if self._revealed & bit:
+            return KIND_REVEALED
+        if self._flags & bit:
+            return KIND_FLAG
+        if self._exposed & bit:
+            return KIND_POKEMON
+        return KIND_UNEXPOSED
+
+    def replace_character_at_index(self, index, character):
+        """Replace the character of a cell. A revealed cell shows its neighbour count
+        whichever number is written.
+
+        Parameters:
+            index (int): Index of the cell.
+            character (str): Unexposed, flag, pokemon or a number.
+        """
+        code = _CELL_BYTES.get(character)
+        if code is None:
+            code = ord(character)
+        kind = _CELL_KINDS[code] if code < 256 else None
+        if kind not in (KIND_UNEXPOSED, KIND_REVEALED, KIND_FLAG, KIND_POKEMON):
+            raise ValueError(f"The bitboard engine can't hold {character!r}")
+        bit = 1 << index
+        old = self._kind(bit)
+        self._revealed &= ~bit
+        self._flags &= ~bit
+        self._exposed &= ~bit
+        if kind == KIND_REVEALED:
+            self._revealed |= bit
+        elif kind == KIND_FLAG:
+            self._flags |= bit
+        elif kind == KIND_POKEMON:
+            self._exposed |= bit
+        if kind != old:
+            self._dirty |= bit
+            self._game_string = None
+
+    def reset_game(self):
+        """Sets every cell back to unexposed, keeping the pokemon locations."""
+        changed = self._revealed | self._flags | self._exposed
+        if changed:
+            self._revealed = self._flags = self._exposed = 0
+            self._dirty |= changed
+            self._game_string = None
+
+    def set_game(self, game):
+        """Replaces the whole game string, e.g. when a saved game is loaded. Revealed cells
+        show their neighbour count whichever number the string holds.
+
+        Parameters:
+            game (str): New game string, one character per cell.
+        """
+        states = game.translate(_TO_CELL_BYTES).encode('ascii').translate(_CELL_STATES)
+        low = self._from_cells(states.translate(_LOW_STATE_BIT))
+        high = self._from_cells(states.translate(_HIGH_STATE_BIT))
+        self._flags = low & ~high
+        self._revealed = high & ~low
+        self._exposed = low & high
+        self._dirty = self._full
+        self._game_string = None
+
+    def count_cells(self):
+        """Counts every kind of cell, see BoardModel.count_cells. Each count is a bit count
+        of one board, so nothing is kept up to date.
+
+        Returns:
+            (list<int>): Number of cells of each kind, indexed by the KIND_ constants.
+        """
+        counts = [0] * 5
+        counts[KIND_UNEXPOSED] = self.get_num_unexposed()
+        counts[KIND_FLAG] = self._flags.bit_count()
+        counts[KIND_REVEALED] = self._revealed.bit_count()
+        counts[KIND_POKEMON] = self._exposed.bit_count()
+        return counts
+
+    def check_counters(self):
+        """Debug check that the boards are consistent: no cell is in two of them and none is
+        past the end of the board.
+
+        Returns:
+            (bool): True if the boards are consistent.
+        """
+        revealed, flags, exposed = self._revealed, self._flags, self._exposed
+        return (not (revealed & flags or revealed & exposed or flags & exposed)
+                and (revealed | flags | exposed) & ~self._full == 0)
+
+    def start_changes(self):
+        """Starts logging the previous value of every cell written, for undo (see history).
+        The boards are immutable integers, so starting is only keeping the current ones."""
+        self._changes = (self._revealed, self._flags, self._exposed)
+
+    def take_changes(self):
+        """Stops logging changes and returns them, found by comparing the boards with those
+        kept by start_changes.
+
+        Returns:
+            (list<tuple<int, int>>): Index and previous cell byte of each cell changed, once
+            per cell, in index order.
+        """
+        if self._changes is None:
+            return []
+        revealed, flags, exposed = self._changes
+        self._changes = None
+        changed = (revealed ^ self._revealed) | (flags ^ self._flags) | (exposed ^ self._exposed)
+        changes = []
+        for index in self._indexes(changed):
+            bit = 1 << index
+            if revealed & bit:
+                old = _DIGITS[self._adjacent[index]]
+            elif flags & bit:
+                old = _FLAG
+            elif exposed & bit:
+                old = _POKEMON
+            else:
+                old = _UNEXPOSED
+            changes.append((index, old))
+        return changes
+
+    def fork(self, game=None):
+        """Makes an independent copy of the game, see BoardModel.fork. The boards are
+        immutable integers, so the copy shares them until either game is played.
+
+        Parameters:
+            game (bytes): Cell bytes to give the copy instead of the current ones.
+
+        Returns:
+            (BitboardModel): The copy.
+        """
+        copy = BitboardModel.__new__(BitboardModel)
+        copy.__dict__.update(self.__dict__)
+        copy._rng = random.Random(self._rng.getrandbits(64))
+        copy._changes = None
+        if game is not None:
+            copy.set_game(bytes(game).decode('ascii'))
+        copy._dirty = 0
+        return copy
+
+    def drain_dirty(self):
+        """Returns the indexes changed since the last call and clears them.
+
+        Returns:
+            (set<int>): Indexes in game string whose character has changed.
+        """
+        dirty = self._dirty
+        self._dirty = 0
+        return set(self._indexes(dirty))
+
+    def get_game(self):
+        """Builds the game string from the bitboards, for the whole board at once, and
+        keeps it until the game changes.
+
+        Returns:
+            (str): Current game string.
+        """
+        if self._game_string is None:
+            # One byte per cell, state << 4 | count, mapped to the cell byte as savefile does.
+            low = int.from_bytes(self._to_cells(self._flags | self._exposed), 'little')
+            high = int.from_bytes(self._to_cells(self._revealed | self._exposed), 'little')
+            combined = low << 4 | high << 5 | self._counts
+            cells = combined.to_bytes(self._cell_count, 'little').translate(_STATE_CELLS)
+            self._game_string = cells.decode('ascii').translate(_FROM_CELL_BYTES)
+        return self._game_string
+
+    def flag_cell(self, index):
+        """Toggle flag on if the cell is unexposed, off if it is flagged.
+
+        Parameters:
+            index (int): Index of the cell.
+        """
+        bit = 1 << index
+        if self._flags & bit:
+            self._flags ^= bit
+        elif not (self._revealed | self._exposed) & bit:
+            self._flags |= bit
+        else:
+            return
+        self._dirty |= bit
+        self._game_string = None
+
+    def number_at_cell(self, index):
+        """Returns the number of pokemons next to a cell.
+
+        Parameters:
+            index (int): Index of the cell.
+
+        Returns:
+            (int): Number to be displayed at the cell.
+        """
+        return self._adjacent[index]
+
+    def _opening(self, bit):
+        """Grows the opening of a zero cell through the unflagged zero cells, a ring of
+        neighbours per step, as BoardModel.big_fun_search does.
+
+        Returns:
+            (int): Bitboard of the opening's zero cells.
+        """
+        passable = self._zeros & ~self._flags
+        region = bit
+        while True:
+            grown = self._dilate(region) & passable
+            if grown == region:
+                return region
+            region = grown
+
+    def reveal_Cells(self, index):
+        """Reveals the cell at index and, if it has no adjacent pokemon, its opening and the
+        cells bordering it, flags excepted.
+
+        Parameters:
+            index (int): index of selected cell to have its neighbours revealed.
+        """
+        bit = 1 << index
+        shown = bit
+        if self._zeros & bit and not self._flags & bit:
+            shown |= self._dilate(self._opening(bit)) & ~self._flags
+        changed = shown & ~self._revealed
+        if changed:
+            self._revealed |= shown
+            # A flag on the clicked cell itself is revealed over, as BoardModel does.
+            self._flags &= ~bit
+            self._dirty |= changed
+            self._game_string = None
+
+    def big_fun_search(self, index):
+        """Finds the cells opened by revealing index, see BoardModel.big_fun_search.
+
+        Parameters:
+            index (int): Index of currently selected cell.
+
+        Returns:
+            (list<int>): List of cells to turn visible.
+        """
+        bit = 1 << index
+        if self._flags & bit or not self._zeros & bit:
+            return [index]
+        return self._indexes(self._dilate(self._opening(bit)) & ~self._flags)
+
+    def expose_pokemons(self):
+        """Shows every pokemon on the board, used when the game is lost."""
+        changed = self._pokemons & ~self._exposed
+        if changed:
+            self._exposed |= self._pokemons
+            self._flags &= ~self._pokemons
+            self._revealed &= ~self._pokemons
+            self._dirty |= changed
+            self._game_string = None
+
+    def apply_move(self, action, index):
+        """Applies one move, see BoardModel.apply_move.
+
+        Parameters:
+            action (str): REVEAL or FLAG_MOVE.
+            index (int): Index of the cell.
+        """
+        if action == FLAG_MOVE:
+            self.flag_cell(index)
+        elif self.is_pokemon(index):
+            self.expose_pokemons()
+        elif not (self._revealed | self._flags | self._exposed) >> index & 1:
+            self.reveal_Cells(index)
+
+    def apply_moves(self, moves):
+        """Applies a batch of moves as one transaction, see BoardModel.apply_moves.
+
+        Returns:
+            (MoveResult): Indexes changed by the batch, and whether the game is won or lost.
+        """
+        dirty, self._dirty = self._dirty, 0
+        try:
+            for action, index in moves:
+                self.apply_move(action, index)
+        finally:
+            changed = self._dirty
+            self._dirty = dirty | changed
+        return MoveResult(set(self._indexes(changed)), self.check_win(), self.check_loss())
+
+    def chord_moves(self, index):
+        """Finds the moves of a chord on a revealed number, see BoardModel.chord_moves.
+
+        Returns:
+            (list<tuple<str, int>>): Reveal moves, empty if the chord does not apply.
+        """
+        if not self._revealed >> index & 1:
+            return []
+        neighbours = self.neighbour_directions(index)
+        if sum(self._flags >> neighbour & 1 for neighbour in neighbours) != self._adjacent[index]:
+            return []
+        return [(REVEAL, neighbour) for neighbour in neighbours if self.get_cell(neighbour) == UNEXPOSED]
+
+    def check_win(self):
+        """Checking if game has been won: no cell is unexposed and there are as many flags
+        as pokemons.
+
+        Returns:
+            (bool): True if player has won the game, false if not.
+        """
+        return ((self._revealed | self._flags | self._exposed) == self._full
+                and self._flags.bit_count() == len(self._pokemon_locations))
+
+    def check_loss(self):
+        """Checking if game has been lost.
+
+        Returns:
+            (bool): True if player has lost the game, false if not.
+        """
+        return self._exposed != 0
+
+    def get_num_attempted_catches(self):
+        """Returns the number of flags placed.
+
+        Returns:
+            (int): Number of flags placed.
+        """
+        return self._flags.bit_count()
+
+    def get_num_unexposed(self):
+        """Returns the number of unexposed cells, not counting flags.
+
+        Returns:
+            (int): Number of unexposed cells.
+        """
+        return self._cell_count - (self._revealed | self._flags | self._exposed).bit_count()
+
+    def get_num_revealed(self):
+        """Returns the number of cells revealed with a number.
+
+        Returns:
+            (int): Number of revealed cells.
+        """
+        return self._revealed.bit_count()
+
+    def get_num_exposed_pokemons(self):
+        """Returns the number of pokemons exposed on the board.
+
+        Returns:
+            (int): Number of exposed pokemons.
+        """
+        return self._exposed.bit_count()
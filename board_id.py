@@ -0,0 +1,179 @@
+"""Board IDs: a few bytes that fully describe a board.
+
+Pokemon placement is deterministic given the grid size, the pokemon count, the seed and
+the safe first click, if any (see BoardModel.generate_pokemons: a random.Random seeded
+with an integer draws the same numbers on every run, process and platform). A board ID
+is those values plus a format version, so a deal can be shared, a benchmark case re-run
+or a board stored without storing where its pokemons are.
+
+Packed, an ID is the version byte, then the grid size, pokemon count, seed and first
+click + 1 (0 for none) as unsigned LEB128 varints, then a CRC32 byte of what comes
+before, catching most typos. As text it is the packed bytes in lowercase base32, split
+into groups of five characters; case, spaces and dashes are ignored when it is read.
+"""
+import base64
+import random
+import zlib
+from collections import namedtuple
+
+from board_model import BoardModel, check_seed, neighbour_indexes, place_pokemons
+
+# Version 1: pokemons placed by place_pokemons with random.Random(seed).
+VERSION = 1
+GROUP_SIZE = 5
+
+BoardId = namedtuple('BoardId', ('grid_size', 'num_pokemon', 'seed', 'first_click'))
+
+def _write_varint(value, data):
+    """Appends a non-negative integer as an unsigned LEB128 varint."""
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            data.append(byte | 0x80)
+        else:
+            data.append(byte)
+            return
+
+def _read_varint(data, position):
+    """Reads an unsigned LEB128 varint.
+
+    Returns:
+        (tuple<int, int>): The value and the position after it.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Board ID is truncated")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+def to_bytes(board):
+    """Packs a board ID.
+
+    Parameters:
+        board (BoardId): Board to pack.
+
+    Returns:
+        (bytes): The packed ID, about 15 bytes with a 64 bit seed.
+    """
+    grid_size, num_pokemon, seed, first_click = board
+    if grid_size < 1 or num_pokemon < 0:
+        raise ValueError("Board IDs need a positive grid size and pokemon count")
+    check_seed(seed)
+    if first_click is not None and not 0 <= first_click < grid_size ** 2:
+        raise ValueError(f"First click {first_click} is off the board")
+    data = bytearray([VERSION])
+    for value in (grid_size, num_pokemon, seed, 0 if first_click is None else first_click + 1):
+        _write_varint(value, data)
+    data.append(zlib.crc32(data) & 0xff)
+    return bytes(data)
+
+def from_bytes(data):
+    """Unpacks a board ID packed by to_bytes.
+
+    Parameters:
+        data (bytes): The packed ID.
+
+    Returns:
+        (BoardId): The board.
+    """
+    if len(data) < 2 or zlib.crc32(data[:-1]) & 0xff != data[-1]:
+        raise ValueError("Not a valid board ID")
+    if data[0] != VERSION:
+        raise ValueError(f"Unsupported board ID version {data[0]}")
+    values = []
+    position = 1
+    for _ in range(4):
+        value, position = _read_varint(data, position)
+        values.append(value)
+    if position != len(data) - 1:
+        raise ValueError("Not a valid board ID")
+    grid_size, num_pokemon, seed, first_click = values
+    check_seed(seed)
+    board = BoardId(grid_size, num_pokemon, seed, first_click - 1 if first_click else None)
+    if grid_size < 1 or (board.first_click is not None and board.first_click >= grid_size ** 2):
+        raise ValueError("Not a valid board ID")
+    return board
+
+def encode(board):
+    """Writes a board ID as text, e.g. 'aefa6-bzyvu' for a 10 by 10 board with
+    15 pokemons, seed 7 and a first click at 55.
+
+    Parameters:
+        board (BoardId): Board to write.
+
+    Returns:
+        (str): The ID.
+    """
+    text = base64.b32encode(to_bytes(board)).decode('ascii').rstrip('=').lower()
+    return '-'.join(text[i:i + GROUP_SIZE] for i in range(0, len(text), GROUP_SIZE))
+
+def decode(text):
+    """Reads a board ID written by encode.
+
+    Parameters:
+        text (str): The ID.
+
+    Returns:
+        (BoardId): The board.
+    """
+    text = ''.join(text.split()).replace('-', '').upper()
+    try:
+        data = base64.b32decode(text + '=' * (-len(text) % 8))
+    except ValueError:
+        raise ValueError("Not a valid board ID") from None
+    return from_bytes(data)
+
+def of_model(model):
+    """Finds the ID of a game's board.
+
+    Parameters:
+        model (BoardModel): Game whose board is wanted.
+
+    Returns:
+        (BoardId): The board, None if its pokemons were not placed from a seed, e.g. a game
+        loaded from an old save.
+    """
+    seed = model.get_seed()
+    if seed is None:
+        return None
+    board = BoardId(model.get_grid_size(), model.get_num_pokemon(), seed, model.get_first_click())
+    if model.is_seeded():
+        return board
+    # Pokemons can be given with a seed they were not drawn from; such boards have no ID.
+    if sorted(pokemon_locations(board)) != sorted(model.get_pokemon_locations()):
+        return None
+    return board
+
+def pokemon_locations(board):
+    """Places the pokemons of a board.
+
+    Parameters:
+        board (BoardId): The board.
+
+    Returns:
+        (tuple<int>): Indexes of its pokemons.
+    """
+    excluded = ()
+    if board.first_click is not None:
+        excluded = [board.first_click] + neighbour_indexes(board.first_click, board.grid_size)
+    return place_pokemons(board.grid_size ** 2, board.num_pokemon, random.Random(board.seed), excluded)
+
+def new_model(board):
+    """Starts an unplayed game on a board.
+
+    Parameters:
+        board (BoardId): The board.
+
+    Returns:
+        (BoardModel): The game.
+    """
+    model = BoardModel(board.grid_size, board.num_pokemon, pokemon_locations=())
+    model.set_pokemon_locations(pokemon_locations(board), board.seed, board.first_click, seeded=True)
+    return model
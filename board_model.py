@@ -0,0 +1,731 @@
+"""Game engine of the pokemon game: the board model and its lookup tables. Only uses the
+standard library so it can be imported without a display."""
+import random
+from collections import namedtuple
+
+POKEMON = "☺"
+FLAG = "f"
+UNEXPOSED = "~"
+UP = "up"
+DOWN = "down"
+LEFT = "left"
+RIGHT = "right"
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT,
+              f"{UP}-{LEFT}", f"{UP}-{RIGHT}",
+              f"{DOWN}-{LEFT}", f"{DOWN}-{RIGHT}")
+# Kinds of move a player can make on a cell.
+REVEAL = 'reveal'
+FLAG_MOVE = 'flag'
+# Outcome of BoardModel.apply_moves: the indexes changed by the batch and the game state after it.
+MoveResult = namedtuple('MoveResult', ('changed', 'won', 'lost'))
+# Seeds are unsigned 64 bit integers, the size save files, journals and board IDs hold.
+MAX_SEED = 2 ** 64 - 1
+
+# The game is held as a bytearray of ASCII codes. POKEMON is not ASCII so it is
+# stored as _POKEMON_CODE and only translated back when the string is materialised.
+_POKEMON_CODE = "*"
+_CELL_BYTES = {character: ord(character) for character in (FLAG, UNEXPOSED) + tuple("012345678")}
+_CELL_BYTES[POKEMON] = ord(_POKEMON_CODE)
+_FROM_CELL_BYTES = str.maketrans(_POKEMON_CODE, POKEMON)
+_TO_CELL_BYTES = str.maketrans(POKEMON, _POKEMON_CODE)
+_FLAG = _CELL_BYTES[FLAG]
+_UNEXPOSED = _CELL_BYTES[UNEXPOSED]
+_POKEMON = _CELL_BYTES[POKEMON]
+_DIGITS = tuple(_CELL_BYTES[digit] for digit in "012345678")
+
+# Kinds of cell kept as running counts by BoardModel, indexed by cell byte.
+KIND_UNEXPOSED, KIND_FLAG, KIND_REVEALED, KIND_POKEMON, KIND_OTHER = range(5)
+_CELL_KINDS = [KIND_OTHER] * 256
+_CELL_KINDS[_UNEXPOSED] = KIND_UNEXPOSED
+_CELL_KINDS[_FLAG] = KIND_FLAG
+_CELL_KINDS[_POKEMON] = KIND_POKEMON
+for _digit in _DIGITS:
+    _CELL_KINDS[_digit] = KIND_REVEALED
+_CELL_KINDS = tuple(_CELL_KINDS)
+
+_NEIGHBOUR_TABLES = {}
+
+def neighbour_offsets(grid_size):
+    """Builds (once per grid size) the index offsets of the neighbours of a cell, in the
+    order of DIRECTIONS. Cells are keyed by which edges of the grid they touch, so the
+    table only has 16 entries whatever the grid size.
+
+    Parameters:
+        grid_size (int): Size of grid.
+
+    Returns:
+        (tuple<tuple<int>>): Offsets for each edge key, see _edge_key.
+    """
+    table = _NEIGHBOUR_TABLES.get(grid_size)
+    if table is None:
+        steps = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+        table = []
+        for key in range(16):
+            top, bottom, left, right = key & 1, key & 2, key & 4, key & 8
+            offsets = []
+            for row_step, col_step in steps:
+                if (row_step < 0 and top) or (row_step > 0 and bottom):
+                    continue
+                if (col_step < 0 and left) or (col_step > 0 and right):
+                    continue
+                offsets.append(row_step * grid_size + col_step)
+            table.append(tuple(offsets))
+        table = _NEIGHBOUR_TABLES[grid_size] = tuple(table)
+    return table
+
+def place_pokemons(cell_count, num_pokemon, rng, excluded=()):
+    """Picks pokemon locations by sampling cell indexes without replacement.
+
+    random.Random.sample draws from a set of picks for sparse boards and runs a partial
+    Fisher-Yates shuffle of the candidate indexes for dense ones, so placement is linear
+    in the number of pokemons (or cells) instead of retrying on collisions.
+
+    Parameters:
+        cell_count (int): Number of cells on the board.
+        num_pokemon (int): Number of pokemons to place, capped by the free cells.
+        rng (random.Random): Random number generator to draw from.
+        excluded (iterable<int>): Indexes that must stay free of pokemons.
+
+    Returns:
+        (tuple<int>): Indexes of the placed pokemons.
+    """
+    excluded = sorted(set(excluded))
+    available = cell_count - len(excluded)
+    picks = rng.sample(range(available), min(num_pokemon, max(available, 0)))
+    if excluded:
+        # Map each pick from the free cells back onto the board by stepping over the
+        # excluded indexes below it.
+        for i, index in enumerate(picks):
+            for skipped in excluded:
+                if skipped > index:
+                    break
+                index += 1
+            picks[i] = index
+    return tuple(picks)
+
+def check_seed(seed):
+    """Checks that a seed fits in 0..MAX_SEED.
+
+    Parameters:
+        seed (int): Seed of a board, or None.
+
+    Raises:
+        ValueError: If the seed is given and out of range.
+    """
+    if seed is not None and not 0 <= seed <= MAX_SEED:
+        raise ValueError(f"Seed {seed} is out of range, seeds are 0 to {MAX_SEED}")
+
+def _edge_key(index, grid_size):
+    """Key into the neighbour_offsets table for the cell at index."""
+    row, col = divmod(index, grid_size)
+    last = grid_size - 1
+    return (row == 0) | (row == last) << 1 | (col == 0) << 2 | (col == last) << 3
+
+def neighbour_indexes(index, grid_size):
+    """Indexes of the cells next to index, for code that has a game string but no BoardModel.
+
+    Parameters:
+        index (int): Index in game string.
+        grid_size (int): Size of grid.
+
+    Returns:
+        (list<int>): Indexes of the neighbouring cells.
+    """
+    return [index + offset for offset in neighbour_offsets(grid_size)[_edge_key(index, grid_size)]]
+
+class BoardModel:
+    """Model class that updates game string and other informations"""
+
+    def __init__(self, grid_size, num_pokemon, seed=None, rng=None, pokemon_locations=None):
+        """
+        Construct a game string. 
+
+        Parameters:
+            grid_size (int): size of grid(game board will always be square)
+            num_pokemon (int):number of pokemons in game.
+            seed (int): Seed of the first board, drawn from rng if not given.
+            rng (random.Random): Generator that seeds new boards, a fresh one if not given.
+            pokemon_locations (tuple<int>): Places the first board's pokemons here instead
+                of generating them, e.g. for a loaded game.
+        """
+        check_seed(seed)
+        self._grid_size = grid_size
+        self._num_pokemon = num_pokemon
+        self._rng = rng if rng is not None else random.Random()
+        self._game = bytearray(UNEXPOSED * grid_size ** 2, 'ascii')
+        self._game_string = None
+        self._dirty = set()
+        self._changes = None
+        self._counts = self.count_cells()
+        self._offsets = neighbour_offsets(grid_size)
+        if pokemon_locations is None:
+            self.new_pokemons(seed)
+        else:
+            self.set_pokemon_locations(pokemon_locations, seed)
+
+    def generate_pokemons(self, seed=None, safe_index=None):
+        """Generates new pokemon locations
+
+            Parameters:
+                seed (int): Seed of the board, drawn from the model's generator if not given.
+                safe_index (int): Index of a first click; it and its neighbours stay free of pokemons.
+
+            Returns:
+                (tuple<int>): Returns a tuple containing indexes of generated pokemons for game string"""
+        if seed is None:
+            seed = self._rng.getrandbits(64)
+        excluded = ()
+        if safe_index is not None:
+            excluded = [safe_index] + self.neighbour_directions(safe_index)
+        return place_pokemons(self._grid_size ** 2, self._num_pokemon, random.Random(seed), excluded)
+
+    def new_pokemons(self, seed=None, safe_index=None):
+        """Generates and places new pokemon locations, see generate_pokemons.
+
+        Parameters:
+            seed (int): Seed of the board, drawn from the model's generator if not given.
+            safe_index (int): Index of a first click that must not be near a pokemon.
+        """
+        if seed is None:
+            seed = self._rng.getrandbits(64)
+        self.set_pokemon_locations(self.generate_pokemons(seed, safe_index), seed, safe_index, seeded=True)
+
+    def get_grid_size(self):
+        """Returns the size of the grid.
+
+        Returns:
+            (int): Number of rows (and columns) of the board.
+        """
+        return self._grid_size
+
+    def get_pokemon_locations(self):
+        """Returns the pokemon locations.
+
+        Returns:
+            (tuple<int>): Indexes of pokemons in game string.
+        """
+        return self._pokemon_locations
+
+    def get_num_pokemon(self):
+        """Returns the number of pokemons on the board.
+
+        Returns:
+            (int): Number of pokemons.
+        """
+        return len(self._pokemon_locations)
+
+    def get_seed(self):
+        """Returns the seed the current pokemon locations were generated from.
+
+        Returns:
+            (int): Seed of the board, None if the locations were not generated from a seed.
+        """
+        return self._seed
+
+    def get_first_click(self):
+        """Returns the index of the first click the pokemons were placed away from.
+
+        Returns:
+            (int): Index in game string, None if the placement had no safe first click.
+        """
+        return self._first_click
+
+    def is_seeded(self):
+        """Returns whether the pokemons are known to be where generate_pokemons places them
+        for the seed and first click, so they can be dealt again from those alone.
+
+        Returns:
+            (bool): True if the locations were generated from get_seed() and get_first_click().
+        """
+        return self._seeded
+
+    def set_pokemon_locations(self, pokemon_locations, seed=None, first_click=None, seeded=False):
+        """Places the pokemons and builds the per-cell adjacency counts for them.
+
+        Parameters:
+            pokemon_locations (tuple<int>): Indexes of pokemons in game string.
+            seed (int): Seed the locations were generated from, if known.
+            first_click (int): Safe first click the locations were generated for, if any.
+            seeded (bool): Whether the locations are exactly what generate_pokemons gives for
+                seed and first_click, see is_seeded.
+        """
+        self._seed = seed
+        self._first_click = first_click
+        self._seeded = seeded and seed is not None
+        cell_count = self._grid_size ** 2
+        grid_size = self._grid_size
+        offsets = self._offsets
+        self._pokemon_locations = tuple(pokemon_locations)
+        self._pokemons = bytearray(cell_count)
+        self._adjacent = bytearray(cell_count)
+        for index in self._pokemon_locations:
+            self._pokemons[index] = 1
+            for offset in offsets[_edge_key(index, grid_size)]:
+                self._adjacent[index + offset] += 1
+        self._openings = None
+        self._opening_labels = None
+
+    def is_pokemon(self, index):
+        """Checks if there is a pokemon at specified index.
+
+        Parameters:
+            index (int): Index in game string.
+
+        Returns:
+            (bool): True if a pokemon is hidden at index.
+        """
+        return self._pokemons[index] == 1
+
+    def position_to_index(self, position):
+        """Converts row, column coordinate in grid to game strings index.
+
+        Parameters:
+            position (tuple<int, int>): Row, column position of cell on grid.
+
+        Returns:
+            (int): Index of cell on game string.
+        """
+        x, y = position
+        return x * self._grid_size + y
+
+    def replace_character_at_index(self, index, character):
+        """Replace the character at specified index with new specified character in game string
+        
+        Parameters:
+            index (int): Index position in game string where character will be replaced.
+            character (str): New character that will replace old character.
+        """
+        code = _CELL_BYTES.get(character)
+        if code is None:
+            code = ord(character)
+        old = self._game[index]
+        if old != code:
+            if self._changes is not None:
+                self._changes.append((index, old))
+            self._game[index] = code
+            self._game_string = None
+            self._dirty.add(index)
+            self._counts[_CELL_KINDS[old]] -= 1
+            self._counts[_CELL_KINDS[code]] += 1
+
+    def reset_game(self):
+        """Sets every cell in game string back to unexposed, keeping the pokemon locations."""
+        changed = [i for i, code in enumerate(self._game) if code != _UNEXPOSED]
+        if self._changes is not None:
+            self._changes.extend((i, self._game[i]) for i in changed)
+        if changed:
+            self._game[:] = bytes((_UNEXPOSED,)) * len(self._game)
+            self._game_string = None
+            self._dirty.update(changed)
+            self._counts = self.count_cells()
+
+    def set_game(self, game):
+        """Replaces the whole game string, e.g. when a saved game is loaded.
+
+        Parameters:
+            game (str): New game string, one character per cell.
+        """
+        new_game = bytearray(game.translate(_TO_CELL_BYTES), 'ascii')
+        if self._changes is not None and len(new_game) == len(self._game):
+            old_game = self._game
+            self._changes.extend((i, old_game[i]) for i in range(len(old_game)) if old_game[i] != new_game[i])
+        self._game = new_game
+        self._game_string = None
+        self._dirty.update(range(len(self._game)))
+        self._counts = self.count_cells()
+
+    def count_cells(self):
+        """Counts every kind of cell from scratch. BoardModel keeps these counts up to date
+        on every write, so this is only needed to (re)initialise them or to check them.
+
+        Returns:
+            (list<int>): Number of cells of each kind, indexed by the KIND_ constants.
+        """
+        game = self._game
+        counts = [0] * 5
+        counts[KIND_UNEXPOSED] = game.count(_UNEXPOSED)
+        counts[KIND_FLAG] = game.count(_FLAG)
+        counts[KIND_REVEALED] = sum(game.count(digit) for digit in _DIGITS)
+        counts[KIND_POKEMON] = game.count(_POKEMON)
+        counts[KIND_OTHER] = len(game) - sum(counts)
+        return counts
+
+    def check_counters(self):
+        """Debug check that the running cell counts match a recount of the game string.
+
+        Returns:
+            (bool): True if the counts are consistent.
+        """
+        return self._counts == self.count_cells()
+
+    def start_changes(self):
+        """Starts logging the previous value of every cell written, for undo (see history).
+        Changes are logged until take_changes is called."""
+        self._changes = []
+
+    def take_changes(self):
+        """Stops logging changes and returns them.
+
+        Returns:
+            (list<tuple<int, int>>): Index and previous cell byte of each write, in order.
+        """
+        changes = self._changes
+        self._changes = None
+        return changes if changes is not None else []
+
+    def fork(self, game=None):
+        """Makes an independent copy of the game, e.g. to try out moves. The pokemons and
+        the tables derived from them are never written to, so they are shared.
+
+        Parameters:
+            game (bytes): Cell bytes to give the copy instead of the current ones.
+
+        Returns:
+            (BoardModel): The copy.
+        """
+        copy = BoardModel.__new__(BoardModel)
+        copy.__dict__.update(self.__dict__)
+        copy._game = bytearray(self._game if game is None else game)
+        copy._game_string = None if game is not None else self._game_string
+        copy._dirty = set()
+        copy._changes = None
+        copy._counts = copy.count_cells() if game is not None else list(self._counts)
+        copy._rng = random.Random(self._rng.getrandbits(64))
+        return copy
+
+    def drain_dirty(self):
+        """Returns the indexes changed since the last call and clears them.
+
+        Returns:
+            (set<int>): Indexes in game string whose character has changed.
+        """
+        dirty = self._dirty
+        self._dirty = set()
+        return dirty
+
+    def flag_cell(self, index):
+        """Toggle flag on if character at index is a unexposed. Toggle flag off if character at 
+        index is flag.
+
+        Parameters: 
+            index (int): Index in game string where flag is toggled. 
+        """
+        if self._game[index] == _FLAG:
+            self.replace_character_at_index(index, UNEXPOSED)
+
+        elif self._game[index] == _UNEXPOSED:
+            self.replace_character_at_index(index, FLAG)
+
+    def index_in_direction(self, index, direction):
+        """The specified index position in game string is used with direction to calculate the
+        new position index of an adjacent cell.
+
+        For example:
+          | 1 | 2 | 3 |
+        A | i | j | k |
+        B | l | m | n |
+        C | o | p | q |
+
+        The index of m is 4 in the game string.
+        if the direction specified is "up" then:
+        the updated position corresponds with j which has the index of 1 in the game string.
+
+        Parameters:
+            index (int): The index on game string.
+            direction (str): Direction of adjacent cell.
+
+        Returns:
+            (int): New index of one adjacent cell to cell at specified index in game string.
+            
+            None for invalid direction.
+        """
+        col = index % self._grid_size
+        row = index // self._grid_size
+        if RIGHT in direction:
+            col += 1
+        elif LEFT in direction:
+            col -= 1
+        # Notice the use of if, not elif here
+        if UP in direction:
+            row -= 1
+        elif DOWN in direction:
+            row += 1
+        if not (0 <= col < self._grid_size and 0 <= row < self._grid_size):
+            return None
+
+        return self.position_to_index((row,col))
+        
+    def neighbour_directions(self, index):
+        """Seek out all directions that has a neighbouring cell.
+
+        Parameters:
+            index (int): Index in game string.
+        
+        Returns:
+            (list<int>): A list of index that has a neighouring cells.
+        """
+        return [index + offset for offset in self._offsets[_edge_key(index, self._grid_size)]]
+
+    def number_at_cell(self, index):
+        """Calculates the number that should be displayed on a cell at specified index based
+        on pokemon locations.
+
+        Parameters: 
+            index (int): Index of currently selected cell in game string.
+        
+        Returns:
+            (int): Number to be displayed at given index in game string.
+        """
+        if self._game[index] != _UNEXPOSED:
+            return int(chr(self._game[index]))
+        return self._adjacent[index]
+
+    def check_win(self):
+        """Checking if game has been won.
+
+        Returns:
+            (bool): True if player has won the game, false if not.
+        """
+        counts = self._counts
+        return counts[KIND_UNEXPOSED] == 0 and counts[KIND_FLAG] == len(self._pokemon_locations)
+
+    def check_loss(self):
+        """Checking if game has been lost.
+
+        Returns:
+            (bool): True if player has lost the game, false if not.
+        """
+        return self._counts[KIND_POKEMON] > 0
+
+    def reveal_Cells(self, index):
+        """Reveals all neighouring cells at specified index and repeats for all cells that 
+        had 0 adjacent pokemon.
+
+        Parameters:
+            index (int): index of selected cell to have its neighbours revealed.
+        """
+        number = self.number_at_cell(index)
+        self.replace_character_at_index(index, str(number))
+        clear = self.big_fun_search(index)
+        for i in clear:
+            if self._game[i] != _FLAG:
+                number = self.number_at_cell(i)
+                self.replace_character_at_index(i, str(number))
+        
+    def big_fun_search(self, index):
+        """Searching adjacent cells to see if there any Pokemon's present.
+        Find all cells which should be revealed when a cell is selected.
+
+        For cells which have a zero value (i.e. no neighbouring pokemons) all the cell"s
+        neighbours are revealed. If one of the neighbouring cells is also zero then
+        all of that cell"s neighbours are also revealed. This repeats until no
+        zero value neighbours exist.
+
+        For cells which have a non-zero value (i.e. cells with neighbour pokemons), only
+        the cell itself is revealed.
+
+        Parameters:
+            index (int): Index of currently selected cell.
+        
+        Returns:
+            (list<int>): List of cells to turn visible.
+    """
+        if self._game[index] == _FLAG:
+            return [index]
+
+        number = self.number_at_cell(index)
+        if number != 0:
+            return [index]
+
+        if self._openings is None:
+            self._build_openings()
+        region = self._opening_labels[index]
+        if region != -1:
+            cells, zero_count = self._openings[region]
+            game = self._game
+            # A flag on a zero cell stops the fill there, so the precomputed region
+            # only applies while none of its zero cells are flagged. Flags on its border
+            # stay hidden.
+            if not any(game[cells[i]] == _FLAG for i in range(zero_count)):
+                return [cell for cell in cells if game[cell] != _FLAG]
+        return self._search_openings(index)
+
+    def _search_openings(self, index):
+        """Depth first search used by big_fun_search when its precomputed region can't be
+        used, i.e. when flags are in the way.
+
+        Parameters:
+            index (int): Index of a zero cell.
+
+        Returns:
+            (list<int>): List of cells to turn visible.
+        """
+        queue = [index]
+        discovered = {index}
+        visible = [index]
+        while queue:
+            node = queue.pop()
+            for neighbour in self.neighbour_directions(node):
+                if neighbour in discovered:
+                    continue
+
+                discovered.add(neighbour)
+                if self._game[neighbour] == _FLAG:
+                    continue
+                if self.number_at_cell(neighbour) == 0:
+                    queue.append(neighbour)
+                visible.append(neighbour)
+        return visible
+
+    def _build_openings(self):
+        """Labels every connected region of zero cells in one pass. Each region is stored
+        as its zero cells followed by the numbered cells bordering it, so revealing any
+        zero cell of the region is a single lookup.
+        """
+        cell_count = self._grid_size ** 2
+        grid_size = self._grid_size
+        offsets = self._offsets
+        adjacent = self._adjacent
+        pokemons = self._pokemons
+        labels = [-1] * cell_count
+        openings = []
+
+        start = adjacent.find(0)
+        while start != -1:
+            if labels[start] == -1 and not pokemons[start]:
+                region = len(openings)
+                labels[start] = region
+                zeros = [start]
+                border = set()
+                stack = [start]
+                while stack:
+                    node = stack.pop()
+                    for offset in offsets[_edge_key(node, grid_size)]:
+                        neighbour = node + offset
+                        if adjacent[neighbour]:
+                            border.add(neighbour)
+                        elif labels[neighbour] == -1:
+                            labels[neighbour] = region
+                            zeros.append(neighbour)
+                            stack.append(neighbour)
+                openings.append((tuple(zeros) + tuple(border), len(zeros)))
+            start = adjacent.find(0, start + 1)
+
+        self._opening_labels = labels
+        self._openings = openings
+
+    def get_game(self):
+        """Returns current game string. The string is only rebuilt from the game buffer
+        after the game has changed.
+
+        Returns:
+            (str): updated game string.
+        """
+        if self._game_string is None:
+            self._game_string = self._game.decode('ascii').translate(_FROM_CELL_BYTES)
+        return self._game_string
+    
+    def get_cell(self, index):
+        """Returns the character of one cell without building the game string.
+
+        Parameters:
+            index (int): Index in game string.
+
+        Returns:
+            (str): Character at index.
+        """
+        code = self._game[index]
+        return POKEMON if code == _POKEMON else chr(code)
+
+    def apply_move(self, action, index):
+        """Applies one move the way PokemonGame does for a mouse click: revealing a pokemon
+        exposes every pokemon, revealing a flagged or already revealed cell does nothing.
+
+        Parameters:
+            action (str): REVEAL or FLAG_MOVE.
+            index (int): Index of the cell.
+        """
+        if action == FLAG_MOVE:
+            self.flag_cell(index)
+        elif self.is_pokemon(index):
+            self.expose_pokemons()
+        elif self._game[index] == _UNEXPOSED:
+            self.reveal_Cells(index)
+
+    def apply_moves(self, moves):
+        """Applies a batch of moves in order as one transaction, e.g. a chord or a scripted
+        sequence. Reveals inside an opening an earlier reveal of the batch has already
+        flooded are skipped, and the win and loss checks run once at the end.
+
+        Parameters:
+            moves (iterable<tuple<str, int>>): (action, index) pairs, see apply_move.
+
+        Returns:
+            (MoveResult): Indexes changed by the batch, and whether the game is won or lost.
+        """
+        changed = set()
+        dirty, self._dirty = self._dirty, changed
+        try:
+            for action, index in moves:
+                self.apply_move(action, index)
+        finally:
+            dirty.update(changed)
+            self._dirty = dirty
+        return MoveResult(changed, self.check_win(), self.check_loss())
+
+    def chord_moves(self, index):
+        """Finds the moves of a chord on a revealed number: once as many of its neighbours
+        are flagged as the number says, every other unexposed neighbour is revealed.
+
+        Parameters:
+            index (int): Index of the cell chorded on.
+
+        Returns:
+            (list<tuple<str, int>>): Reveal moves, empty if the cell is not a number with
+            exactly that many flags around it.
+        """
+        code = self._game[index]
+        if code not in _DIGITS:
+            return []
+        neighbours = self.neighbour_directions(index)
+        game = self._game
+        if sum(game[neighbour] == _FLAG for neighbour in neighbours) != _DIGITS.index(code):
+            return []
+        return [(REVEAL, neighbour) for neighbour in neighbours if game[neighbour] == _UNEXPOSED]
+
+    def expose_pokemons(self):
+        """Shows every pokemon on the board, used when the game is lost."""
+        for index in self._pokemon_locations:
+            self.replace_character_at_index(index, POKEMON)
+
+    def get_num_attempted_catches(self):
+        """Search for the number of flags placed in game string.
+
+        Returns:
+            (int): Number of flags placed.
+        """
+        return self._counts[KIND_FLAG]
+
+    def get_num_unexposed(self):
+        """Returns the number of unexposed cells, not counting flags.
+
+        Returns:
+            (int): Number of unexposed cells.
+        """
+        return self._counts[KIND_UNEXPOSED]
+
+    def get_num_revealed(self):
+        """Returns the number of cells revealed with a number.
+
+        Returns:
+            (int): Number of revealed cells.
+        """
+        return self._counts[KIND_REVEALED]
+
+    def get_num_exposed_pokemons(self):
+        """Returns the number of pokemons exposed on the board.
+
+        Returns:
+            (int): Number of exposed pokemons.
+        """
+        return self._counts[KIND_POKEMON]
@@ -0,0 +1,184 @@
+"""Boards generated ahead of time so new games start instantly.
+
+A BoardPool keeps a bounded queue of ready boards for each (grid size, pokemon count,
+no-guess) kind asked for, filled by a worker process so generation never runs on the Tk
+thread. No-guess boards are boards the solver can clear from their first click without
+ever guessing; finding one can take many attempts, which is why they are made ahead.
+Only the board model and solver are imported.
+"""
+import multiprocessing
+import random
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import solver
+from board_model import BoardModel, REVEAL, FLAG_MOVE, UNEXPOSED
+
+# A ready board: its seed, where its pokemons are and the cell to open it with. The first
+# click is safe on every board, and on no-guess boards it is where solving starts from.
+Board = namedtuple('Board', ('seed', 'pokemon_locations', 'first_click'))
+
+# Seeds tried before a no-guess board is given up on.
+MAX_NO_GUESS_ATTEMPTS = 200
+
+def is_no_guess(model, first_click, time_budget=0.05):
+    """Checks if a board can be cleared from its first click by only revealing cells the
+    solver proves safe and flagging cells it proves hold a pokemon.
+
+    Parameters:
+        model (BoardModel): Unplayed game with its pokemons placed. It is played out.
+        first_click (int): Index of the first cell revealed.
+        time_budget (float): Seconds the solver may spend per step.
+
+    Returns:
+        (bool): True if no guess is ever needed.
+    """
+    grid_size = model.get_grid_size()
+    num_pokemon = model.get_num_pokemon()
+    model.apply_move(REVEAL, first_click)
+    while not model.check_win():
+        if model.check_loss():
+            return False
+        solution = solver.solve(model.get_game(), grid_size, num_pokemon, time_budget)
+        moves = [(REVEAL, cell) for cell in solution.safe if model.get_cell(cell) == UNEXPOSED]
+        moves += [(FLAG_MOVE, cell) for cell in solution.mines if model.get_cell(cell) == UNEXPOSED]
+        if not moves:
+            return False
+        model.apply_moves(moves)
+    return True
+
+def make_board(grid_size, num_pokemon, no_guess, seed):
+    """Generates a board with a safe first click in the middle.
+
+    Parameters:
+        grid_size (int): Size of grid.
+        num_pokemon (int): Number of pokemons.
+        no_guess (bool): Whether the board must be solvable without guessing. If no seed
+            gives one within MAX_NO_GUESS_ATTEMPTS, the last board tried is returned.
+        seed (int): Seed of the first board tried, the next ones follow on.
+
+    Returns:
+        (Board): The board.
+    """
+    first_click = grid_size * (grid_size // 2) + grid_size // 2
+    model = BoardModel(grid_size, num_pokemon, pokemon_locations=())
+    attempts = MAX_NO_GUESS_ATTEMPTS if no_guess else 1
+    for attempt in range(attempts):
+        board_seed = seed + attempt
+        locations = model.generate_pokemons(board_seed, safe_index=first_click)
+        if not no_guess:
+            break
+        candidate = BoardModel(grid_size, num_pokemon, seed=board_seed, pokemon_locations=locations)
+        if is_no_guess(candidate, first_click):
+            break
+    return Board(board_seed, locations, first_click)
+
+class BoardPool:
+    """Queues of boards made ahead of time by a worker process."""
+
+    def __init__(self, size=4, seed=None):
+        """Construct an empty pool. The worker process is started on first use.
+
+        Parameters:
+            size (int): Boards kept ready for each kind of board.
+            seed (int): Seed of the generator drawing the boards' seeds.
+        """
+        self._size = size
+        self._rng = random.Random(seed)
+        self._ready = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _key(self, grid_size, num_pokemon, no_guess):
+        return (grid_size, num_pokemon, bool(no_guess))
+
+    def fill(self, grid_size, num_pokemon, no_guess=False):
+        """Starts making boards of a kind until the pool holds size of them.
+
+        Parameters:
+            grid_size (int): Size of grid.
+            num_pokemon (int): Number of pokemons.
+            no_guess (bool): Whether the boards must be solvable without guessing.
+        """
+        key = self._key(grid_size, num_pokemon, no_guess)
+        futures = []
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+            ready = self._ready.setdefault(key, deque())
+            pending = self._pending.get(key, 0)
+            try:
+                for _ in range(self._size - len(ready) - pending):
+                    futures.append(self._executor.submit(make_board, *key, self._rng.getrandbits(63)))
+                    pending += 1
+            except BrokenProcessPool:
+                # The worker died; a new one is started on the next fill.
+                self._executor = None
+            self._pending[key] = pending
+        # A future that is already done runs its callback straight away, and _made takes
+        # the lock, so callbacks are only added once it is released.
+        for future in futures:
+            future.add_done_callback(lambda future, key=key: self._made(key, future))
+
+    def _made(self, key, future):
+        """Queues a board the worker has finished, called on the executor's thread."""
+        with self._lock:
+            self._pending[key] -= 1
+            if not future.cancelled() and future.exception() is None:
+                self._ready[key].append(future.result())
+
+    def take(self, grid_size, num_pokemon, no_guess=False):
+        """Takes a ready board and starts making its replacement. If none is ready one is
+        made on the spot, which for no-guess boards can take a while.
+
+        Parameters:
+            grid_size (int): Size of grid.
+            num_pokemon (int): Number of pokemons.
+            no_guess (bool): Whether the board must be solvable without guessing.
+
+        Returns:
+            (Board): The board.
+        """
+        key = self._key(grid_size, num_pokemon, no_guess)
+        with self._lock:
+            ready = self._ready.get(key)
+            board = ready.popleft() if ready else None
+            seed = self._rng.getrandbits(63) if board is None else None
+        if board is None:
+            board = make_board(grid_size, num_pokemon, no_guess, seed)
+        self.fill(grid_size, num_pokemon, no_guess)
+        return board
+
+    def take_ready(self, grid_size, num_pokemon, no_guess=False):
+        """Takes a ready board without ever making one on the spot, and starts making
+        boards of its kind, e.g. to poll for a board from the Tk thread.
+
+        Parameters:
+            grid_size (int): Size of grid.
+            num_pokemon (int): Number of pokemons.
+            no_guess (bool): Whether the board must be solvable without guessing.
+
+        Returns:
+            (Board): The board, None if none is ready yet.
+        """
+        key = self._key(grid_size, num_pokemon, no_guess)
+        with self._lock:
+            ready = self._ready.get(key)
+            board = ready.popleft() if ready else None
+        self.fill(grid_size, num_pokemon, no_guess)
+        return board
+
+    def ready_count(self, grid_size, num_pokemon, no_guess=False):
+        """Returns the number of boards of a kind ready to take."""
+        with self._lock:
+            return len(self._ready.get(self._key(grid_size, num_pokemon, no_guess), ()))
+
+    def close(self):
+        """Stops the worker process, dropping the boards it hasn't finished."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
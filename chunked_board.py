@@ -0,0 +1,483 @@
+"""Chunked board storage for effectively unbounded grids.
+
+The board is split into square chunks. A chunk is only created when a cell in it (or next
+to it) is looked at, and its pokemons are derived from a hash of the board seed and the
+chunk coordinates, so any chunk can be rebuilt identically at any time. Cell state is only
+allocated once a chunk is written to, and chunks that are back to fully unexposed can be
+evicted. ChunkedBoardModel has the same interface as BoardModel, so the game logic works
+unchanged on boards far too large to hold in memory.
+"""
+import hashlib
+import random
+from collections import OrderedDict
+
+from board_model import (POKEMON, FLAG, UNEXPOSED, UP, DOWN, LEFT, RIGHT, REVEAL, FLAG_MOVE, MoveResult,
+                         KIND_UNEXPOSED, KIND_FLAG, KIND_REVEALED, KIND_POKEMON,
+                         _CELL_BYTES, _CELL_KINDS, _POKEMON, _UNEXPOSED,
+                         neighbour_indexes, place_pokemons)
+
+CHUNK_SIZE = 64
+# get_game() refuses to build a game string longer than this.
+MAX_GAME_STRING = 4 * 1024 * 1024
+# Cells one reveal opens by default, the rest of an opening is left for later clicks, so a
+# click costs a bounded search (a couple of seconds at most) however big the opening.
+MAX_FLOOD = 64 * 1024
+
+class Chunk:
+    """One square tile of a chunked board."""
+    __slots__ = ('mines', 'cells', 'changed')
+
+    def __init__(self, mines):
+        """Construct an unmodified chunk.
+
+        Parameters:
+            mines (bytearray): 1 for each cell of the chunk holding a pokemon.
+        """
+        self.mines = mines
+        self.cells = None
+        self.changed = 0
+
+class ChunkedBoardModel:
+    """Board model that stores the board as lazily created chunks."""
+
+    def __init__(self, grid_size, num_pokemon, seed=None, chunk_size=CHUNK_SIZE, max_chunks=4096,
+                 max_flood=MAX_FLOOD):
+        """Construct a chunked board.
+
+        Parameters:
+            grid_size (int): size of grid(game board will always be square)
+            num_pokemon (int): number of pokemons wanted. Each chunk gets its share of the
+                density, so the board's total (get_num_pokemon) may differ by rounding.
+            seed (int): Seed of the board, random if not given.
+            chunk_size (int): Width and height of a chunk in cells.
+            max_chunks (int): Number of chunks kept before cold ones are evicted. A reveal
+                never loads chunks past this, its opening stops at their edge.
+            max_flood (int): Most cells one reveal may open. A cut off opening carries on
+                when one of its revealed zero cells is revealed again.
+        """
+        self._grid_size = grid_size
+        self._chunk_size = chunk_size
+        self._density = num_pokemon / grid_size ** 2
+        self._seed = seed if seed is not None else random.getrandbits(64)
+        self._max_chunks = max_chunks
+        self._max_flood = max_flood
+        self._chunks = OrderedDict()
+        self._dirty = set()
+        # Revealed zero cells whose neighbours a cut off opening has not searched yet.
+        self._frontier = set()
+        self._counts = [0] * 5
+        self._counts[KIND_UNEXPOSED] = grid_size ** 2
+        self._num_pokemon = self._count_board_pokemons()
+
+    def _chunk_pokemons(self, cell_count):
+        """Number of pokemons in a chunk with cell_count cells on the board."""
+        return min(round(cell_count * self._density), cell_count)
+
+    def _count_board_pokemons(self):
+        """Adds up the pokemons of every chunk without creating any of them."""
+        full, rest = divmod(self._grid_size, self._chunk_size)
+        sides = [(self._chunk_size, full)]
+        if rest:
+            sides.append((rest, 1))
+        return sum(rows * cols * self._chunk_pokemons(height * width)
+                   for height, rows in sides for width, cols in sides)
+
+    def _make_chunk(self, chunk_row, chunk_col):
+        """Builds a chunk, placing its pokemons from a hash of the seed and its coordinates."""
+        size = self._chunk_size
+        height = min(size, self._grid_size - chunk_row * size)
+        width = min(size, self._grid_size - chunk_col * size)
+        digest = hashlib.blake2b(f"{self._seed}:{chunk_row}:{chunk_col}".encode(), digest_size=8).digest()
+        rng = random.Random(int.from_bytes(digest, 'big'))
+        mines = bytearray(size * size)
+        for local in place_pokemons(height * width, self._chunk_pokemons(height * width), rng):
+            row, col = divmod(local, width)
+            mines[row * size + col] = 1
+        return Chunk(mines)
+
+    def _chunk_key(self, index):
+        """Returns the (row, column) of the chunk holding a cell."""
+        row, col = divmod(index, self._grid_size)
+        return (row // self._chunk_size, col // self._chunk_size)
+
+    def _locate(self, index):
+        """Finds the chunk holding a cell, creating it if needed.
+
+        Returns:
+            (Chunk, int): The chunk and the cell's offset in it.
+        """
+        row, col = divmod(index, self._grid_size)
+        chunk_row, row = divmod(row, self._chunk_size)
+        chunk_col, col = divmod(col, self._chunk_size)
+        key = (chunk_row, chunk_col)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._chunks[key] = self._make_chunk(chunk_row, chunk_col)
+            if len(self._chunks) > self._max_chunks:
+                self.evict_cold_chunks(self._max_chunks)
+        else:
+            self._chunks.move_to_end(key)
+        return chunk, row * self._chunk_size + col
+
+    def evict_cold_chunks(self, max_chunks=0):
+        """Drops the least recently used chunks that are fully unexposed. They are rebuilt
+        identically from the seed if they are needed again.
+
+        Parameters:
+            max_chunks (int): Stop once no more than this many chunks are kept.
+
+        Returns:
+            (int): Number of chunks evicted.
+        """
+        cold = [key for key, chunk in self._chunks.items() if chunk.changed == 0]
+        # The most recently used chunk is never evicted, it is usually being worked on.
+        cold = cold[:max(len(self._chunks) - max_chunks, 0)]
+        newest = next(reversed(self._chunks), None)
+        evicted = 0
+        for key in cold:
+            if key != newest:
+                del self._chunks[key]
+                evicted += 1
+        return evicted
+
+    def get_num_loaded_chunks(self):
+        """Returns the number of chunks held in memory.
+
+        Returns:
+            (int): Number of chunks.
+        """
+        return len(self._chunks)
+
+    def position_to_index(self, position):
+        """Converts row, column coordinate in grid to game strings index.
+
+        Parameters:
+            position (tuple<int, int>): Row, column position of cell on grid.
+
+        Returns:
+            (int): Index of cell on game string.
+        """
+        x, y = position
+        return x * self._grid_size + y
+
+    def index_in_direction(self, index, direction):
+        """The index of the cell next to index in direction, see BoardModel.index_in_direction.
+
+        Returns:
+            (int): Index of the adjacent cell, None if it is off the board.
+        """
+        col = index % self._grid_size
+        row = index // self._grid_size
+        if RIGHT in direction:
+            col += 1
+        elif LEFT in direction:
+            col -= 1
+        if UP in direction:
+            row -= 1
+        elif DOWN in direction:
+            row += 1
+        if not (0 <= col < self._grid_size and 0 <= row < self._grid_size):
+            return None
+        return self.position_to_index((row, col))
+
+    def neighbour_directions(self, index):
+        """Seek out all directions that has a neighbouring cell.
+
+        Parameters:
+            index (int): Index in game string.
+
+        Returns:
+            (list<int>): A list of index that has a neighouring cells.
+        """
+        return neighbour_indexes(index, self._grid_size)
+
+    def is_pokemon(self, index):
+        """Checks if there is a pokemon at specified index.
+
+        Returns:
+            (bool): True if a pokemon is hidden at index.
+        """
+        chunk, offset = self._locate(index)
+        return chunk.mines[offset] == 1
+
+    def get_cell(self, index):
+        """Returns the character of one cell.
+
+        Returns:
+            (str): Character at index.
+        """
+        chunk, offset = self._locate(index)
+        if chunk.cells is None:
+            return UNEXPOSED
+        code = chunk.cells[offset]
+        return POKEMON if code == _POKEMON else chr(code)
+
+    def replace_character_at_index(self, index, character):
+        """Replace the character at specified index with new specified character.
+
+        Parameters:
+            index (int): Index of the cell.
+            character (str): New character of the cell.
+        """
+        code = _CELL_BYTES.get(character)
+        if code is None:
+            code = ord(character)
+        chunk, offset = self._locate(index)
+        if chunk.cells is None:
+            if code == _UNEXPOSED:
+                return
+            chunk.cells = bytearray(UNEXPOSED * self._chunk_size ** 2, 'ascii')
+        old = chunk.cells[offset]
+        if old != code:
+            chunk.cells[offset] = code
+            chunk.changed += (code != _UNEXPOSED) - (old != _UNEXPOSED)
+            self._dirty.add(index)
+            self._counts[_CELL_KINDS[old]] -= 1
+            self._counts[_CELL_KINDS[code]] += 1
+
+    def flag_cell(self, index):
+        """Toggle flag on if the cell is unexposed, off if it is flagged.
+
+        Parameters:
+            index (int): Index of the cell.
+        """
+        character = self.get_cell(index)
+        if character == FLAG:
+            self.replace_character_at_index(index, UNEXPOSED)
+        elif character == UNEXPOSED:
+            self.replace_character_at_index(index, FLAG)
+
+    def number_at_cell(self, index):
+        """Calculates the number that should be displayed on a cell.
+
+        Parameters:
+            index (int): Index of the cell.
+
+        Returns:
+            (int): Number of pokemons next to the cell.
+        """
+        character = self.get_cell(index)
+        if character != UNEXPOSED:
+            return int(character)
+        return sum(self.is_pokemon(neighbour) for neighbour in self.neighbour_directions(index))
+
+    def reveal_Cells(self, index):
+        """Reveals the cell at index and, if it has no adjacent pokemon, its opening.
+
+        Parameters:
+            index (int): index of selected cell to have its neighbours revealed.
+        """
+        number = self.number_at_cell(index)
+        self.replace_character_at_index(index, str(number))
+        self._reveal(self.big_fun_search(index))
+
+    def _reveal(self, cells):
+        """Reveals cells found by a search, flags excepted."""
+        for i in cells:
+            if self.get_cell(i) != FLAG:
+                self.replace_character_at_index(i, str(self.number_at_cell(i)))
+
+    def continue_opening(self):
+        """Carries on the openings cut off by max_flood or max_chunks, from the zero cells
+        they stopped at."""
+        queue = list(self._frontier)
+        self._frontier = set()
+        self._reveal(self._flood(queue))
+
+    def big_fun_search(self, index):
+        """Finds the cells opened by revealing index, see BoardModel.big_fun_search. Chunks
+        are created as the search reaches them. It stops after max_flood cells, or where
+        it would load more than max_chunks chunks; the zero cells it stopped at are kept
+        for continue_opening.
+
+        Parameters:
+            index (int): Index of currently selected cell.
+
+        Returns:
+            (list<int>): List of cells to turn visible.
+        """
+        if self.get_cell(index) == FLAG or self.number_at_cell(index) != 0:
+            return [index]
+        self._frontier.discard(index)
+        return self._flood([index])
+
+    def _flood(self, queue):
+        """Depth first search of an opening from the zero cells in queue, see big_fun_search.
+
+        Returns:
+            (list<int>): List of cells to turn visible.
+        """
+        discovered = set(queue)
+        visible = []
+        # Chunks the opening has reached, it is revealed into all of them at once.
+        reached = {self._chunk_key(node) for node in queue}
+        while queue and len(visible) < self._max_flood:
+            node = queue.pop()
+            neighbours = self.neighbour_directions(node)
+            keys = {self._chunk_key(neighbour) for neighbour in neighbours} - reached
+            if keys and len(reached) + len(keys) >= self._max_chunks:
+                # Searching on would reach more chunks than can be kept.
+                self._frontier.add(node)
+                continue
+            reached |= keys
+            for neighbour in neighbours:
+                if neighbour in discovered:
+                    continue
+                discovered.add(neighbour)
+                if self.get_cell(neighbour) != FLAG and self.number_at_cell(neighbour) == 0:
+                    queue.append(neighbour)
+                visible.append(neighbour)
+        self._frontier.update(queue)
+        return visible
+
+    def apply_move(self, action, index):
+        """Applies one move, see BoardModel.apply_move. Revealing a revealed zero cell
+        carries on any opening that was cut off, see continue_opening.
+
+        Parameters:
+            action (str): REVEAL or FLAG_MOVE.
+            index (int): Index of the cell.
+        """
+        if action == FLAG_MOVE:
+            self.flag_cell(index)
+        elif self.is_pokemon(index):
+            self.expose_pokemons()
+        elif self.get_cell(index) == UNEXPOSED:
+            self.reveal_Cells(index)
+        elif self._frontier and self.get_cell(index) == '0':
+            self.continue_opening()
+
+    def apply_moves(self, moves):
+        """Applies a batch of moves as one transaction, see BoardModel.apply_moves.
+
+        Returns:
+            (MoveResult): Indexes changed by the batch, and whether the game is won or lost.
+        """
+        changed = set()
+        dirty, self._dirty = self._dirty, changed
+        try:
+            for action, index in moves:
+                self.apply_move(action, index)
+        finally:
+            dirty.update(changed)
+            self._dirty = dirty
+        return MoveResult(changed, self.check_win(), self.check_loss())
+
+    def chord_moves(self, index):
+        """Finds the moves of a chord on a revealed number, see BoardModel.chord_moves.
+
+        Returns:
+            (list<tuple<str, int>>): Reveal moves, empty if the chord does not apply.
+        """
+        character = self.get_cell(index)
+        if not character.isdigit():
+            return []
+        neighbours = self.neighbour_directions(index)
+        cells = [self.get_cell(neighbour) for neighbour in neighbours]
+        if cells.count(FLAG) != int(character):
+            return []
+        return [(REVEAL, neighbour) for neighbour, cell in zip(neighbours, cells) if cell == UNEXPOSED]
+
+    def expose_pokemons(self):
+        """Shows the pokemons of every chunk in memory, used when the game is lost."""
+        size = self._chunk_size
+        for (chunk_row, chunk_col), chunk in list(self._chunks.items()):
+            offset = chunk.mines.find(1)
+            while offset != -1:
+                row, col = divmod(offset, size)
+                self.replace_character_at_index((chunk_row * size + row) * self._grid_size
+                                                + chunk_col * size + col, POKEMON)
+                offset = chunk.mines.find(1, offset + 1)
+
+    def check_win(self):
+        """Checking if game has been won.
+
+        Returns:
+            (bool): True if player has won the game, false if not.
+        """
+        return self.get_num_unexposed() == 0 and self._counts[KIND_FLAG] == self._num_pokemon
+
+    def check_loss(self):
+        """Checking if game has been lost.
+
+        Returns:
+            (bool): True if player has lost the game, false if not.
+        """
+        return self._counts[KIND_POKEMON] > 0
+
+    def get_game(self):
+        """Builds the whole game string. Only possible for boards up to MAX_GAME_STRING cells.
+
+        Returns:
+            (str): Current game string.
+        """
+        size = self._grid_size
+        if size ** 2 > MAX_GAME_STRING:
+            raise ValueError(f"A {size}x{size} board is too large to build a game string for")
+        return ''.join(self.get_cell(index) for index in range(size ** 2))
+
+    def drain_dirty(self):
+        """Returns the indexes changed since the last call and clears them.
+
+        Returns:
+            (set<int>): Indexes whose character has changed.
+        """
+        dirty = self._dirty
+        self._dirty = set()
+        return dirty
+
+    def get_grid_size(self):
+        """Returns the size of the grid.
+
+        Returns:
+            (int): Number of rows (and columns) of the board.
+        """
+        return self._grid_size
+
+    def get_num_pokemon(self):
+        """Returns the number of pokemons on the whole board.
+
+        Returns:
+            (int): Number of pokemons.
+        """
+        return self._num_pokemon
+
+    def get_seed(self):
+        """Returns the seed the chunks are derived from.
+
+        Returns:
+            (int): Seed of the board.
+        """
+        return self._seed
+
+    def get_num_attempted_catches(self):
+        """Returns the number of flags placed.
+
+        Returns:
+            (int): Number of flags placed.
+        """
+        return self._counts[KIND_FLAG]
+
+    def get_num_unexposed(self):
+        """Returns the number of unexposed cells, not counting flags.
+
+        Returns:
+            (int): Number of unexposed cells.
+        """
+        return self._counts[KIND_UNEXPOSED]
+
+    def get_num_revealed(self):
+        """Returns the number of cells revealed with a number.
+
+        Returns:
+            (int): Number of revealed cells.
+        """
+        return self._counts[KIND_REVEALED]
+
+    def get_num_exposed_pokemons(self):
+        """Returns the number of pokemons exposed on the board.
+
+        Returns:
+            (int): Number of exposed pokemons.
+        """
+        return self._counts[KIND_POKEMON]
@@ -0,0 +1,1491 @@
+"""Tkinter GUI of the pokemon game. It is imported by minesweeper the first time one of its
+names is looked up there, so code that only needs the game engine never loads tkinter.
+PIL is only imported once the first image is decoded.
+"""
+import random
+import tkinter as tk
+from tkinter import messagebox, filedialog, simpledialog
+import os
+import queue
+import threading
+from collections import OrderedDict
+import board_id
+import board_pool
+import history
+import instrumentation
+import journal
+import savefile
+import solver
+from board_model import POKEMON, FLAG, UNEXPOSED, REVEAL, FLAG_MOVE, BoardModel
+
+TASK_ONE = 'TASK_ONE'
+TITLE = "Pokemon: Got 2 Find Them All!"
+TASK_TWO = 'TASK_TWO'
+CELL_COLOURS = {UNEXPOSED: 'dark green', FLAG: 'red', POKEMON: 'yellow'}
+REVEALED_COLOUR = 'light green'
+HINT_TAG = 'hint'
+HINT_COLOURS = {REVEAL: 'blue', FLAG_MOVE: 'red'}
+# Cells narrower than this are shown in a scrolling viewport instead of all at once.
+MIN_CELL_WIDTH = 12
+# Largest board a board ID may start a game on.
+MAX_GRID_SIZE = 1000
+
+IMAGES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+POKEMON_SPRITES = 'pokemon_sprites'
+ADJACENT_IMAGES = ('zero_adjacent.png', 'one_adjacent.png', 'two_adjacent.png', 'three_adjacent.png',
+                   'four_adjacent.png', 'five_adjacent.png', 'six_adjacent.png', 'seven_adjacent.png',
+                   'eight_adjacent.png')
+POKEBALL_IMAGE = 'pokeball.png'
+UNREVEALED_IMAGE = 'unrevealed.png'
+FULL_POKEBALL_IMAGE = 'full_pokeball.png'
+CLOCK_IMAGE = 'clock.png'
+
+class SpriteCache:
+    """Process-wide cache of decoded images keyed by (asset, cell width), evicting the least
+    recently used. Images are opened, decoded and resized on a background thread; only the
+    conversion to a Tk image happens on the Tk thread."""
+
+    def __init__(self, max_size=512):
+        """Construct an empty cache.
+
+        Parameters:
+            max_size (int): Number of (asset, width) entries kept before evicting.
+        """
+        self._max_size = max_size
+        self._images = OrderedDict()
+        self._pending = set()
+        self._listings = {}
+        self._lock = threading.Lock()
+        self._jobs = queue.Queue()
+        self._worker = None
+
+    def list_assets(self, folder):
+        """Lists the assets in a folder of the images directory.
+
+        Parameters:
+            folder (str): Folder relative to the images directory.
+
+        Returns:
+            (tuple<str>): Asset paths relative to the images directory, empty if the folder is missing.
+        """
+        assets = self._listings.get(folder)
+        if assets is None:
+            try:
+                names = sorted(os.listdir(os.path.join(IMAGES_PATH, folder)))
+            except OSError:
+                names = []
+            assets = self._listings[folder] = tuple(os.path.join(folder, name) for name in names)
+        return assets
+
+    def request(self, asset, width):
+        """Checks if an image is decoded, queuing it for the background thread if it isn't.
+
+        Parameters:
+            asset (str): Path of the image relative to the images directory.
+            width (int): Width and height to resize to, None to keep the original size.
+
+        Returns:
+            (bool): True if the image is cached, even if it could not be read.
+        """
+        key = (asset, width)
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                return True
+            if key not in self._pending:
+                self._pending.add(key)
+                self._jobs.put(key)
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._work, daemon=True)
+                    self._worker.start()
+        return False
+
+    def photo(self, asset, width):
+        """Returns the cached image as a Tk image. Must be called on the Tk thread.
+
+        Parameters:
+            asset (str): Path of the image relative to the images directory.
+            width (int): Width and height of the image, None for the original size.
+
+        Returns:
+            (ImageTk.PhotoImage): The image, None if it is not decoded yet or could not be read.
+        """
+        with self._lock:
+            entry = self._images.get((asset, width))
+            if entry is None or entry[0] is None:
+                return None
+            if entry[1] is None:
+                from PIL import ImageTk
+                entry[1] = ImageTk.PhotoImage(entry[0])
+            return entry[1]
+
+    def image(self, asset, width):
+        """Returns the cached image as decoded, e.g. to composite it. Safe on any thread.
+
+        Parameters:
+            asset (str): Path of the image relative to the images directory.
+            width (int): Width and height of the image, None for the original size.
+
+        Returns:
+            (Image.Image): The image, None if it is not decoded yet or could not be read.
+        """
+        with self._lock:
+            entry = self._images.get((asset, width))
+            return None if entry is None else entry[0]
+
+    def when_ready(self, widget, keys, callback, interval=30):
+        """Calls callback on the Tk thread once all the (asset, width) keys are decoded. If
+        they are all cached already it is called straight away.
+
+        Parameters:
+            widget (tk.Widget): Widget whose event loop polls the cache.
+            keys (list<tuple<str, int>>): Images to wait for.
+            callback (callable): Called with no arguments once the images are ready.
+            interval (int): Milliseconds between polls.
+        """
+        def poll():
+            if not widget.winfo_exists():
+                return
+            missing = [key for key in keys if not self.request(*key)]
+            if missing:
+                widget.after(interval, poll)
+            else:
+                callback()
+        poll()
+
+    def _work(self):
+        """Background thread that decodes and resizes queued images. An image that fails
+        for any reason, PIL missing included, is cached as unreadable, so the thread keeps
+        going and whoever waits for it stops waiting."""
+        while True:
+            asset, width = key = self._jobs.get()
+            try:
+                from PIL import Image
+                image = Image.open(os.path.join(IMAGES_PATH, asset))
+                image.load()
+                if width is not None:
+                    image = image.resize((width, width))
+            except Exception:
+                image = None
+            with self._lock:
+                self._pending.discard(key)
+                self._images[key] = [image, None]
+                while len(self._images) > self._max_size:
+                    self._images.popitem(last=False)
+
+SPRITE_CACHE = SpriteCache()
+
+class BoardView(tk.Canvas):
+    """View and GUI of the 2D pokemon game board"""
+
+    def __init__(self, master, grid_size, board_width=600, *args, **kwargs):
+        """Construct a board view from updated game string
+        
+        Parameters:
+            master (tk.Widget): Widget within which the game board is placed.
+            grid_size (int): size of game grid(always square, so length and width are the same)
+            board_width (int): Size of the board canvas.
+        """
+        super().__init__(master, *args, **kwargs)
+        self._master = master
+        self._board_width = board_width
+        self._grid_size = grid_size
+        self._width = self._board_width//self._grid_size
+        self._cell_items = []
+        self._text_items = {}
+        self._drawn = None
+        self.items_created = 0
+    
+    def draw_board(self, board, dirty=None):
+        """Construct the game board canvas using squares and text based on the current game 
+        string. If game character is unexposed, then square will be dark green. If character 
+        is a digit, then square is light green with digit placed insise. If the character is
+        a flag, square will be red and if character is pokemon, square will be yellow at that
+        cell location.
+
+        The canvas items are created on the first draw (see redraw). Later draws only
+        reconfigure the cells that changed.
+
+        Parameters:
+            board (str): Current game string.
+            dirty (iterable<int>): Indexes changed since the last draw. If not given they
+                are found by comparing board with the last drawn board.
+        """
+        self.delete(HINT_TAG)
+        last = self._drawn
+        if last is None or len(board) != len(last):
+            self.redraw(board)
+            return
+        if dirty is None:
+            dirty = [index for index in range(len(board)) if board[index] != last[index]]
+        for index in dirty:
+            self._update_cell(index, board[index])
+        self._drawn = board
+
+    def set_grid_size(self, grid_size):
+        """Changes the size of the grid, e.g. when a game of another size is loaded. The next
+        draw rebuilds every cell.
+
+        Parameters:
+            grid_size (int): size of game grid
+        """
+        self._grid_size = grid_size
+        self._width = self._board_width//self._grid_size
+        self._drawn = None
+
+    def redraw(self, board):
+        """Deletes every item on the canvas and creates the cells again from scratch.
+
+        Parameters:
+            board (str): Current game string.
+        """
+        self.delete("all")
+        self._text_items = {}
+        self._cell_items = [self._create_cell(index, character) for index, character in enumerate(board)]
+        self.items_created += len(board)
+        self._drawn = board
+
+    def highlight_cell(self, index, colour):
+        """Outlines one cell until the next draw, e.g. to show a hint.
+
+        Parameters:
+            index (int): Index of the cell in game string.
+            colour (str): Colour of the outline.
+        """
+        self.delete(HINT_TAG)
+        row, col = divmod(index, self._grid_size)
+        x1 = col * self._width
+        y1 = row * self._width
+        self.create_rectangle(x1, y1, x1 + self._width, y1 + self._width, outline=colour, width=3, tags=HINT_TAG)
+
+    def _cell_colour(self, character):
+        """Returns the fill colour of a cell showing character."""
+        if character.isdigit():
+            return REVEALED_COLOUR
+        return CELL_COLOURS.get(character, '')
+
+    def _create_cell(self, index, character):
+        """Creates the canvas items of one cell.
+
+        Returns:
+            (int): Id of the cell's square.
+        """
+        row, col = divmod(index, self._grid_size)
+        x1=(col* self._width) #Top left x of square
+        y1=(row * self._width) #Top left y of square
+        x2=(x1 + self._width) #Bottom right x of square
+        y2=(y1 + self._width) #Bottom right y of square
+        item = self.create_rectangle(x1,y1,x2,y2,fill=self._cell_colour(character))
+        if character.isdigit():
+            self._draw_number(index, character)
+        return item
+
+    def _update_cell(self, index, character):
+        """Reconfigures the existing canvas items of one cell."""
+        self.itemconfig(self._cell_items[index], fill=self._cell_colour(character))
+        if character.isdigit():
+            self._draw_number(index, character)
+        elif index in self._text_items:
+            self.itemconfig(self._text_items[index], text='')
+
+    def _draw_number(self, index, character):
+        """Shows the digit of a revealed cell, creating its text item the first time."""
+        item = self._text_items.get(index)
+        if item is None:
+            self._text_items[index] = self.create_text(self.position_to_pixel(divmod(index, self._grid_size)),
+                font="Arial", text=character)
+            self.items_created += 1
+        else:
+            self.itemconfig(item, text=character)
+
+    def win_message_task1(self):
+        """Message to be displayed after winning(task 1)."""
+        messagebox.showinfo(title="You Won", message= "Congrats! You've won the game")
+
+    def lose_message_task1(self):
+        """Message to be displayed after losing(task1)."""
+        messagebox.showinfo(title="Game over", message = "You lost! Better luck next time")
+
+    def win_message_task2(self):
+        """A yes/no message box to be displayed after winning(task2).
+
+        Returns:
+            (bool): True if response is yes, False if else.
+        """
+        yes_no = messagebox.askyesno(title="You Won", message = "You Won, Do you want to play again?")
+        response = None
+        if yes_no:
+            response = True
+        else:
+            response = False
+        return response
+
+    def lose_message_task2(self):
+        """A yes/no message box to be displayed after losing(task2).
+
+        Returns:
+            (bool): True if response is yes, False if else.
+        """
+        yes_no = messagebox.askyesno(title="Game over", message = "You lost, Do you want to play again?")
+        response = None
+        if yes_no:
+            response = True
+        else:
+            response = False
+        return response
+
+    def position_to_pixel(self, position):
+        """Converts the row, column of a cell on gameboard to the center pixel coordinates
+        of that cell.
+
+        Parameters:
+            position (tuple<int, int>): Row, column position of cell on 2D game board.
+
+        Returns:
+            (tuple<int, int>): Pixel coordinates of center position of cell.
+        """
+        pixel = ()
+        row,col = position
+        x = col * self._width + (self._width/2)
+        y = row * self._width + (self._width/2)
+        pixel = x,y
+        return pixel
+
+    def pixel_to_positions(self, pixel):
+        """Converts the pixel coordinates at any location within the cell to row, column
+        position on game board for that cell.
+
+        Parameters:
+            pixel (tuple<int, int>): Pixel coordinates within a cell.
+        
+        Returns:
+            (tuple<int, int): Row, column of a cell on 2D game board, None if the pixel is
+            off the board.
+        """
+        position = ()
+        x, y = pixel
+        col= x//self._width
+        row= y//self._width
+        if not (0 <= row < self._grid_size and 0 <= col < self._grid_size):
+            return None
+        position = row,col 
+        return position
+
+class ImageBoardView(BoardView):
+    """Images view of 2D game board. A subclass to the Boardview class"""
+    def __init__(self, master, grid_size, board_width=600, *args, **kwargs):
+        """Construct a board view with images displayed instead of rectangles.
+
+        Parameters(same as BoardView class):
+            master (tk.Widget): Widget within which the game board is placed.
+            grid_size (int): size of game grid(always square, so length and width are the same)
+            board_width (int): Size of the board canvas.
+        """
+        super().__init__(master, grid_size, board_width=board_width, *args, **kwargs)
+        self._load_sprites()
+
+    def set_grid_size(self, grid_size):
+        """Overriding set_grid_size method in BoardView class, the sprites are loaded again
+        at the new cell width."""
+        super().set_grid_size(grid_size)
+        self._load_sprites()
+
+    def _load_sprites(self):
+        """Shows placeholders and asks the sprite cache for the sprites at the cell width."""
+        # Solid colour placeholders are shown until the sprites are decoded.
+        self.all_pokemon = [self._placeholder(POKEMON)]
+        self.adjacent_numbers = [self._placeholder('0')] * 9
+        self._pokeball = self._placeholder(FLAG)
+        self._unrevealed = self._placeholder(UNEXPOSED)
+
+        self._pokemon_assets = SPRITE_CACHE.list_assets(POKEMON_SPRITES)
+        assets = self._pokemon_assets + ADJACENT_IMAGES + (POKEBALL_IMAGE, UNREVEALED_IMAGE)
+        SPRITE_CACHE.when_ready(self, [(asset, self._width) for asset in assets], self._sprites_loaded)
+
+    def _placeholder(self, character):
+        """Creates a solid image in the BoardView colour of a cell showing character."""
+        image = tk.PhotoImage(master=self, width=self._width, height=self._width)
+        image.put(self._cell_colour(character), to=(0, 0, self._width, self._width))
+        return image
+
+    def _sprites_loaded(self):
+        """Swaps the placeholders for the decoded sprites and updates the drawn cells."""
+        def photo(asset, placeholder):
+            image = SPRITE_CACHE.photo(asset, self._width)
+            return placeholder if image is None else image
+
+        all_pokemon = [SPRITE_CACHE.photo(asset, self._width) for asset in self._pokemon_assets]
+        all_pokemon = [image for image in all_pokemon if image is not None]
+        if all_pokemon:
+            self.all_pokemon = all_pokemon
+        self.adjacent_numbers = [photo(asset, image) for asset, image in zip(ADJACENT_IMAGES, self.adjacent_numbers)]
+        self._pokeball = photo(POKEBALL_IMAGE, self._pokeball)
+        self._unrevealed = photo(UNREVEALED_IMAGE, self._unrevealed)
+        if self._drawn is not None:
+            for index, character in enumerate(self._drawn):
+                self._update_cell(index, character)
+
+    def _create_cell(self, index, character):
+        """Overriding _create_cell method in BoardView class, cells are images. If game
+        character is unexposed, 'unrevealed' is displayed. If game character is a digit,
+        the appropriate digit image is displayed. If the game character is a flag,
+        a pokeball image is displayed and if the game character is a pokemon,
+        a randomised pokemon image is displayed at that cell location.
+
+        Returns:
+            (int): Id of the cell's image.
+        """
+        x,y = self.position_to_pixel(divmod(index, self._grid_size))
+        return self.create_image(x,y, image=self._cell_image(character))
+
+    def _update_cell(self, index, character):
+        """Overriding _update_cell method in BoardView class, swaps the cell's image."""
+        self.itemconfig(self._cell_items[index], image=self._cell_image(character))
+
+    def _cell_image(self, character):
+        """Returns the image of a cell showing character."""
+        if character == UNEXPOSED:
+            return self._unrevealed
+        elif character.isdigit():
+            return self.adjacent_numbers[int(character)]
+        elif character == FLAG:
+            return self._pokeball
+        elif character == POKEMON:
+            return random.choice(self.all_pokemon)
+        return ''
+
+class CompositeBoardView(ImageBoardView):
+    """Images view of 2D game board drawn as a single image. Cells are pasted as tiles
+    into a backing PIL image that is shown through one PhotoImage, so the canvas holds one
+    item whatever the grid size, and a draw only pastes the tiles of changed cells."""
+
+    def __init__(self, master, grid_size, board_width=600, *args, **kwargs):
+        """Construct a composited board view.
+
+        Parameters(same as BoardView class):
+            master (tk.Widget): Widget within which the game board is placed.
+            grid_size (int): size of game grid(always square, so length and width are the same)
+            board_width (int): Size of the board canvas.
+        """
+        self._backing = None
+        self._photo = None
+        self._board_item = None
+        super().__init__(master, grid_size, board_width=board_width, *args, **kwargs)
+
+    def _load_sprites(self):
+        """Builds the tile atlas from solid colour placeholders and asks the sprite cache for
+        the sprites at the cell width."""
+        self._width = max(1, self._width)
+        self._tiles = {character: [self._tile(None, character)] for character in (UNEXPOSED, FLAG, POKEMON)}
+        for digit in range(9):
+            self._tiles[str(digit)] = [self._tile(None, str(digit))]
+        self._pokemon_assets = SPRITE_CACHE.list_assets(POKEMON_SPRITES)
+        assets = self._pokemon_assets + ADJACENT_IMAGES + (POKEBALL_IMAGE, UNREVEALED_IMAGE)
+        SPRITE_CACHE.when_ready(self, [(asset, self._width) for asset in assets], self._sprites_loaded)
+
+    def _tile(self, asset, character):
+        """Makes the tile of a cell showing character: the sprite flattened onto the cell's
+        BoardView colour, or just the colour if there is no sprite.
+
+        Returns:
+            (Image.Image): An RGB tile, None if asset is given but not decoded.
+        """
+        from PIL import Image
+        tile = Image.new('RGB', (self._width, self._width), self._cell_colour(character) or 'white')
+        if asset is not None:
+            sprite = SPRITE_CACHE.image(asset, self._width)
+            if sprite is None:
+                return None
+            sprite = sprite.convert('RGBA')
+            tile.paste(sprite, (0, 0), sprite)
+        return tile
+
+    def _sprites_loaded(self):
+        """Swaps the placeholder tiles for the decoded sprites and repaints the board."""
+        sprites = {UNEXPOSED: UNREVEALED_IMAGE, FLAG: POKEBALL_IMAGE}
+        sprites.update((str(digit), asset) for digit, asset in enumerate(ADJACENT_IMAGES))
+        for character, asset in sprites.items():
+            tile = self._tile(asset, character)
+            if tile is not None:
+                self._tiles[character] = [tile]
+        pokemon = [self._tile(asset, POKEMON) for asset in self._pokemon_assets]
+        pokemon = [tile for tile in pokemon if tile is not None]
+        if pokemon:
+            self._tiles[POKEMON] = pokemon
+        if self._drawn is not None:
+            self.redraw(self._drawn)
+
+    def draw_board(self, board, dirty=None):
+        """Pastes the tiles of the changed cells, see BoardView.draw_board, then shows the
+        backing image if any changed."""
+        last = self._drawn
+        if last is None or len(board) != len(last):
+            # The board is redrawn whole, which shows the backing image itself.
+            super().draw_board(board, dirty)
+            return
+        if dirty is None:
+            dirty = [index for index in range(len(board)) if board[index] != last[index]]
+        super().draw_board(board, dirty)
+        if dirty:
+            self._photo.paste(self._backing)
+
+    def redraw(self, board):
+        """Pastes every tile into a new backing image and shows it as the only canvas item.
+
+        Parameters:
+            board (str): Current game string.
+        """
+        size = self._width * self._grid_size
+        if self._backing is None or self._backing.size != (size, size):
+            from PIL import Image, ImageTk
+            self._backing = Image.new('RGB', (size, size))
+            self.delete("all")
+            self._photo = ImageTk.PhotoImage(self._backing)
+            self._board_item = self.create_image(0, 0, anchor=tk.NW, image=self._photo)
+            self.items_created += 1
+        for index, character in enumerate(board):
+            self._update_cell(index, character)
+        self._drawn = board
+        self._photo.paste(self._backing)
+
+    def _update_cell(self, index, character):
+        """Pastes the tile of one cell into the backing image."""
+        tiles = self._tiles.get(character)
+        if tiles is None:
+            return
+        row, col = divmod(index, self._grid_size)
+        tile = tiles[0] if len(tiles) == 1 else random.choice(tiles)
+        self._backing.paste(tile, (col * self._width, row * self._width))
+
+class ViewportBoardView(BoardView):
+    """Board view for grids too large to show whole. The board scrolls and zooms inside a
+    fixed size canvas, and only the cells in view, plus a margin, have canvas items. Items
+    of cells scrolled out of view are reused for the cells scrolled in, so the number of
+    items depends on the size of the window, not of the board."""
+
+    def __init__(self, master, grid_size, board_width=600, cell_width=MIN_CELL_WIDTH, margin=2, *args, **kwargs):
+        """Construct a scrollable board view. master should be a frame holding nothing
+        else, the scrollbars are placed in it next to the canvas.
+
+        Parameters:
+            master (tk.Widget): Frame within which the game board is placed.
+            grid_size (int): size of game grid(always square, so length and width are the same)
+            board_width (int): Size of the visible canvas.
+            cell_width (int): Width of a cell at zoom 1.
+            margin (int): Rows and columns kept drawn beyond each edge of the view.
+        """
+        super().__init__(master, grid_size, board_width=board_width, *args, **kwargs)
+        self._cell_width = cell_width
+        self._zoom = 1.0
+        self._width = cell_width
+        self._margin = margin
+        self._slots = {}
+        self._free = []
+        self._shown = None
+        self._refresh_job = None
+
+        x_scrollbar = tk.Scrollbar(master, orient=tk.HORIZONTAL, command=self.xview)
+        y_scrollbar = tk.Scrollbar(master, orient=tk.VERTICAL, command=self.yview)
+        self.config(xscrollcommand=lambda *view: self._scrolled(x_scrollbar, view),
+                    yscrollcommand=lambda *view: self._scrolled(y_scrollbar, view))
+        self.grid(row=0, column=0, sticky='nsew')
+        y_scrollbar.grid(row=0, column=1, sticky='ns')
+        x_scrollbar.grid(row=1, column=0, sticky='ew')
+        master.grid_rowconfigure(0, weight=1)
+        master.grid_columnconfigure(0, weight=1)
+        self._update_scrollregion()
+
+        self.bind("<Configure>", lambda event: self._scrolled_view())
+        self.bind("<MouseWheel>", lambda event: self.yview_scroll(-1 if event.delta > 0 else 1, 'units'))
+        self.bind("<Shift-MouseWheel>", lambda event: self.xview_scroll(-1 if event.delta > 0 else 1, 'units'))
+        self.bind("<Button-4>", lambda event: self.yview_scroll(-1, 'units'))
+        self.bind("<Button-5>", lambda event: self.yview_scroll(1, 'units'))
+        self.bind("<Control-MouseWheel>", lambda event: self.zoom(1.25 if event.delta > 0 else 0.8, event.x, event.y))
+        self.bind("<Control-Button-4>", lambda event: self.zoom(1.25, event.x, event.y))
+        self.bind("<Control-Button-5>", lambda event: self.zoom(0.8, event.x, event.y))
+
+    def _scrolled(self, scrollbar, view):
+        """Moves a scrollbar to the new view and schedules the cells in view to be drawn."""
+        scrollbar.set(*view)
+        self._scrolled_view()
+
+    def _scrolled_view(self):
+        """Schedules the cells in view to be drawn once the view has settled."""
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self._refresh)
+
+    def _update_scrollregion(self):
+        """Sizes the scrollable area to the whole board at the current zoom."""
+        size = self._grid_size * self._width
+        self.config(scrollregion=(0, 0, size, size), xscrollincrement=self._width,
+                    yscrollincrement=self._width)
+
+    def zoom(self, factor, x=None, y=None):
+        """Zooms in or out, keeping the point under (x, y) in place.
+
+        Parameters:
+            factor (float): Change of zoom, above 1 to zoom in.
+            x, y (int): Window pixel to zoom around, the centre of the view if not given.
+        """
+        zoom = min(max(self._zoom * factor, 1 / self._cell_width), 64 / self._cell_width)
+        width = max(1, round(self._cell_width * zoom))
+        if width == self._width:
+            return
+        if x is None:
+            x, y = self.winfo_width() // 2, self.winfo_height() // 2
+        board_x = self.canvasx(x) / self._width
+        board_y = self.canvasy(y) / self._width
+        self._zoom = zoom
+        self._width = width
+        self._update_scrollregion()
+        size = self._grid_size * width
+        self.xview_moveto((board_x * width - x) / size)
+        self.yview_moveto((board_y * width - y) / size)
+        self._release_slots()
+        self._refresh()
+
+    def set_grid_size(self, grid_size):
+        """Changes the size of the grid, keeping the zoom.
+
+        Parameters:
+            grid_size (int): size of game grid
+        """
+        self._grid_size = grid_size
+        self._drawn = None
+        self._update_scrollregion()
+        self._release_slots()
+
+    def redraw(self, board):
+        """Draws the cells in view from scratch.
+
+        Parameters:
+            board (str): Current game string.
+        """
+        self._drawn = board
+        self._release_slots()
+        self._refresh()
+
+    def pixel_to_positions(self, pixel):
+        """Converts window pixel coordinates, e.g. of a click, to the row, column of the cell
+        under them, allowing for scrolling and zoom.
+
+        Parameters:
+            pixel (tuple<int, int>): Pixel coordinates in the window.
+
+        Returns:
+            (tuple<int, int): Row, column of a cell on 2D game board, None if the pixel is
+            off the board.
+        """
+        x, y = pixel
+        row, col = int(self.canvasy(y) // self._width), int(self.canvasx(x) // self._width)
+        if not (0 <= row < self._grid_size and 0 <= col < self._grid_size):
+            return None
+        return row, col
+
+    def _visible_range(self):
+        """Returns the first and last row and column drawn, margin included."""
+        last = self._grid_size - 1
+        first_row = max(0, int(self.canvasy(0) // self._width) - self._margin)
+        first_col = max(0, int(self.canvasx(0) // self._width) - self._margin)
+        last_row = min(last, int(self.canvasy(self.winfo_height()) // self._width) + self._margin)
+        last_col = min(last, int(self.canvasx(self.winfo_width()) // self._width) + self._margin)
+        return first_row, last_row, first_col, last_col
+
+    def _release_slots(self):
+        """Hides every cell's items, keeping them for reuse."""
+        for slot in self._slots.values():
+            self.itemconfig(slot[0], state=tk.HIDDEN)
+            self.itemconfig(slot[1], state=tk.HIDDEN)
+            self._free.append(slot)
+        self._slots = {}
+        self._shown = None
+
+    def _refresh(self):
+        """Gives the cells that came into view items, taken from the cells that left it."""
+        self._refresh_job = None
+        if self._drawn is None:
+            return
+        shown = self._visible_range()
+        if shown == self._shown:
+            return
+        self._shown = shown
+        first_row, last_row, first_col, last_col = shown
+        grid_size = self._grid_size
+        wanted = set()
+        for row in range(first_row, last_row + 1):
+            wanted.update(range(row * grid_size + first_col, row * grid_size + last_col + 1))
+        for index in [index for index in self._slots if index not in wanted]:
+            slot = self._slots.pop(index)
+            self.itemconfig(slot[0], state=tk.HIDDEN)
+            self.itemconfig(slot[1], state=tk.HIDDEN)
+            self._free.append(slot)
+        board = self._drawn
+        for index in wanted:
+            if index not in self._slots:
+                self._slots[index] = self._place_slot(index, board[index])
+
+    def _place_slot(self, index, character):
+        """Moves a free pair of items, or new ones if none are free, onto a cell.
+
+        Returns:
+            (tuple<int, int>): Ids of the cell's square and text.
+        """
+        row, col = divmod(index, self._grid_size)
+        x1 = col * self._width
+        y1 = row * self._width
+        if self._free:
+            square, text = slot = self._free.pop()
+            self.coords(square, x1, y1, x1 + self._width, y1 + self._width)
+            self.coords(text, x1 + self._width / 2, y1 + self._width / 2)
+        else:
+            square = self.create_rectangle(x1, y1, x1 + self._width, y1 + self._width)
+            text = self.create_text(x1 + self._width / 2, y1 + self._width / 2, font="Arial")
+            self.items_created += 2
+            slot = (square, text)
+        self.itemconfig(square, state=tk.NORMAL, fill=self._cell_colour(character))
+        self.itemconfig(text, state=tk.NORMAL, text=character if character.isdigit() else '')
+        return slot
+
+    def _update_cell(self, index, character):
+        """Reconfigures the items of a cell if it is in view."""
+        slot = self._slots.get(index)
+        if slot is not None:
+            self.itemconfig(slot[0], fill=self._cell_colour(character))
+            self.itemconfig(slot[1], text=character if character.isdigit() else '')
+
+class StatusBar(tk.Frame):
+    """Displays the status bar at the bottom of the game, including new game and restart button
+    and also showing numbers of attempted catches, pokeballs left and how long game has been
+    going for."""
+    def __init__(self, master, *args, **kwargs):
+        """Construct a new status bar frame.
+
+        Parameters:
+            master (tk.Widget): Widget within which to place the status bar.
+        """
+        super().__init__(master, *args, **kwargs)
+        self._master = master
+        # Everything is packed into this frame, so packing it places the whole bar.
+        self.full_pokeball = tk.PhotoImage(master=self)
+        self.clock_image = tk.PhotoImage(master=self)
+
+        self.button_frame = tk.Frame(self)
+        self.button_frame.pack(side=tk.RIGHT)
+        self.new_game_button = tk.Button(self.button_frame, text='New Game')
+        self.new_game_button.pack(padx=56, pady=5)
+        self.restart_game_button = tk.Button(self.button_frame,text='Restart Game')
+        self.restart_game_button.pack(padx=50, pady=5)
+        
+        self.time_clock_frame = tk.Frame(self)
+        self.time_clock_frame.pack(side=tk.RIGHT)
+        self.time_clock = tk.Label(self.time_clock_frame)
+        self.time_clock.pack(side=tk.RIGHT)
+        self.clock = tk.Label(self.time_clock_frame, image=self.clock_image)
+        self.clock.pack()
+    
+        self.pokeball_and_catches = tk.Frame(self)
+        self.pokeball_and_catches.pack(side=tk.RIGHT, padx=50)
+        self.attempted_catch = tk.Label(self.pokeball_and_catches)
+        self.pokeball = tk.Label(self.pokeball_and_catches)
+        self.pokeball_image = tk.Label(self.pokeball_and_catches, image=self.full_pokeball)
+        self.pokeball_image.pack(side=tk.LEFT)
+        SPRITE_CACHE.when_ready(self, [(FULL_POKEBALL_IMAGE, None), (CLOCK_IMAGE, None)], self._icons_loaded)
+
+    def _icons_loaded(self):
+        """Shows the pokeball and clock icons once they are decoded."""
+        full_pokeball = SPRITE_CACHE.photo(FULL_POKEBALL_IMAGE, None)
+        clock_image = SPRITE_CACHE.photo(CLOCK_IMAGE, None)
+        if full_pokeball is not None:
+            self.full_pokeball = full_pokeball
+            self.pokeball_image.config(image=full_pokeball)
+        if clock_image is not None:
+            self.clock_image = clock_image
+            self.clock.config(image=clock_image)
+
+    def time(self, second):
+        """Adding time elapsed to the status bar.
+        
+        Parameters:
+            second (int): Time elapsed in second since the game begun.
+        """
+        minute = second//60
+        seconds = second % 60
+        self.time_clock.config(text='Time elapsed\n' + str(minute) + 'm ' + str(seconds)+'s', font=("Arial", 9))
+
+class PokemonGame:
+    """Pokemon game application that manages the communication between board model, board view,
+    image board view and status bar. A file menu with following features was also implemented
+    here:
+        Save game: Saves the game to a file.
+        Load game: Loads the appropriate game file.
+        Record moves: Journals every move from here on, see journal.
+        Replay game: Replays a journal at a chosen speed.
+        Restart game: Restarts the game, keeping the same pokemon locations.
+        New game: New game with new pokemon locations.
+        New game from ID: New game on the board a board ID describes, see board_id.
+        Copy board ID: Shows the current board's ID and copies it to the clipboard.
+        Quit game: Exits the game.
+    """
+    def __init__(self, master, grid_size=10, num_pokemon=15, task=TASK_ONE, viewport=None, composite=False, no_guess=False):
+        """Construct a pokemon game app based on grid size and number of pokemon.
+
+        Parameters:
+            master (tk.Widget): The root window widget.
+            grid_size (int): Size of the 2D game board grid.
+            num_pokemon (int): Number of pokemons in the game.
+            task (str): Task to have the appropriate features displayed.
+            viewport (bool): Whether to show the board in a scrolling, zoomable viewport.
+                By default it is used when cells would be narrower than MIN_CELL_WIDTH.
+                Boards too big for a pixel per cell always use it.
+            composite (bool): Whether task two draws the board as one composited image
+                (CompositeBoardView) instead of an image item per cell. As the composited
+                image keeps one canvas item whatever the grid size, it takes precedence
+                over the default viewport, unless cells would be under a pixel wide.
+            no_guess (bool): Whether new games are boards that can be solved without guessing,
+                opened at their first click.
+        """
+        self._master = master
+        self._gridsize = grid_size
+        self._num_pokemon = num_pokemon
+        self._task = task
+        self.label_and_root_config()
+        self._BoardModel = BoardModel(self._gridsize,self._num_pokemon)
+        self._history = history.History(self._BoardModel)
+        self._journal = None
+        self._replay_job = None
+        self._render_job = None
+        self._status_dirty = False
+        self._no_guess = no_guess
+        self._board_pool = board_pool.BoardPool()
+        self._board_job = None
+        self._master.protocol("WM_DELETE_WINDOW", self.close_window)
+        
+        self._viewport = viewport
+        self._composite = composite
+        self._BoardView = None
+        self.create_board_view()
+        if self._task == TASK_TWO:
+            self._StatusBar = StatusBar(self._master)
+            self._StatusBar.pack(expand=1, fill=tk.BOTH)
+            self._StatusBar.restart_game_button.bind("<Button-1>", self.restart_game)
+            self._StatusBar.new_game_button.bind("<Button-1>", self.new_game)
+            self.attempted_catches_and_pokeballs_left()
+            self._timer = None
+            self._time = 0
+            self.update_clock()
+           
+            menu_bar = tk.Menu(self._master)
+            self._master.config(menu = menu_bar)
+
+            file_menu = tk.Menu(menu_bar, tearoff=False)
+            menu_bar.add_cascade(label="File", menu=file_menu)
+
+            file_menu.add_command(label="Save game", command = self.file_save_game)
+            file_menu.add_command(label="Load game", command = self.file_load_game)
+            file_menu.add_command(label="Restart game", command = self.reset)
+            file_menu.add_command(label="New game", command = self.file_new_game)
+            file_menu.add_command(label="New game from ID", command = self.file_new_game_from_id)
+            file_menu.add_command(label="Copy board ID", command = self.file_copy_board_id)
+            file_menu.add_command(label="Undo", command = self.undo, accelerator="Ctrl+Z")
+            file_menu.add_command(label="Redo", command = self.redo, accelerator="Ctrl+Y")
+            file_menu.add_command(label="Hint", command = self.show_hint)
+            file_menu.add_command(label="Record moves", command = self.file_record_game)
+            file_menu.add_command(label="Stop recording", command = self.stop_recording)
+            file_menu.add_command(label="Replay game", command = self.file_replay_game)
+            file_menu.add_command(label="Quit", command= self.file_quit_game)
+
+        self._master.bind("<Control-z>", lambda event: self.undo())
+        self._master.bind("<Control-y>", lambda event: self.redo())
+        self.bind_mouse()
+        self.schedule_render()
+        if self._task == TASK_TWO:
+            # Have the next boards made in the background while this one is played.
+            self._board_pool.fill(self._gridsize, self._num_pokemon, self._no_guess)
+            if self._no_guess:
+                self.start_new_board()
+
+    def file_save_game(self):
+        """Save the game to a file, see savefile for the format.
+        
+        Returns None if no files were selected.
+        """
+        try:
+            filename = filedialog.asksaveasfilename(defaultextension='.pkm', filetypes=(("Pokemon game", "*.pkm"),("All files", "*.*")))
+            if not filename:
+                return
+            savefile.save_game(filename, self._BoardModel, self._time)
+        except Exception as e:
+            messagebox.showerror(title='Error', message=str(e)) 
+            
+    @instrumentation.timed('file_load_game')
+    def file_load_game(self):
+        """Loading up the saved game, binary saves or text files from older versions.
+        
+        Returns None if no file were selected."""
+        try:
+            filename = filedialog.askopenfilename(filetypes=(("Pokemon game", "*.pkm"),("Text file", "*.txt"),("All files", "*.*")))
+            if not filename:
+                return
+            model, time = savefile.load_game(filename)
+
+            self.stop_recording()
+            self.cancel_replay()
+            self.set_model(model)
+            self._time = int(time)
+            self.schedule_render(status=True)
+         
+        except PermissionError:
+            messagebox.showerror(title='Permission error', message='You do not have permission') 
+        except Exception as e:
+            messagebox.showerror(title='Error', message=str(e))     
+
+    def set_model(self, model):
+        """Switches to another game, resizing the board view if its grid size differs.
+
+        Parameters:
+            model (BoardModel): Game to play.
+        """
+        self.cancel_board_wait()
+        self._BoardModel = model
+        self._history = history.History(model)
+        self._num_pokemon = model.get_num_pokemon()
+        if model.get_grid_size() != self._gridsize:
+            self._gridsize = model.get_grid_size()
+            if self.wants_viewport() == isinstance(self._BoardView, ViewportBoardView):
+                self._BoardView.set_grid_size(self._gridsize)
+            else:
+                self.create_board_view()
+                self.bind_mouse()
+
+    def wants_viewport(self):
+        """Returns whether the board is shown in a ViewportBoardView: as asked for, by
+        default when cells would be narrower than MIN_CELL_WIDTH and the board is not
+        composited, and always when the board has more cells a side than the canvas has
+        pixels."""
+        cell_width = 600 // self._gridsize
+        if self._viewport is None:
+            if self._composite and self._task == TASK_TWO:
+                return cell_width == 0
+            return cell_width < MIN_CELL_WIDTH
+        return self._viewport or cell_width == 0
+
+    def create_board_view(self):
+        """Creates the board view for the task and grid size, replacing the current one,
+        e.g. when a game too big to show whole is loaded."""
+        if self.wants_viewport():
+            view = ViewportBoardView(tk.Frame(self._master), self._gridsize, board_width=600)
+        elif self._task == TASK_ONE:
+            view = BoardView(self._master, grid_size = self._gridsize, board_width=600)
+        else:
+            view_class = CompositeBoardView if self._composite else ImageBoardView
+            view = view_class(self._master, self._gridsize, board_width=600)
+        old_view = self._BoardView
+        self._BoardView = view
+        self.boardview_config()
+        if old_view is not None:
+            old_view.destroy()
+            if isinstance(old_view, ViewportBoardView):
+                old_view.master.destroy()
+            if self._task == TASK_TWO:
+                # Keep the status bar below the board.
+                self._StatusBar.pack_forget()
+                self._StatusBar.pack(expand=1, fill=tk.BOTH)
+
+    def file_record_game(self):
+        """Starts journaling the moves played from the current position, see journal.
+
+        Returns None if no files were selected.
+        """
+        try:
+            filename = filedialog.asksaveasfilename(defaultextension='.pkj', filetypes=(("Pokemon journal", "*.pkj"),("All files", "*.*")))
+            if not filename:
+                return
+            self.stop_recording()
+            self._journal = journal.JournalWriter(filename, self._BoardModel)
+        except Exception as e:
+            messagebox.showerror(title='Error', message=str(e))
+
+    def stop_recording(self):
+        """Stops journaling moves, writing out the moves still buffered."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def record_move(self, action, index):
+        """Journals a move that has just been played, if recording.
+
+        Parameters:
+            action (str): REVEAL or FLAG_MOVE.
+            index (int): Index of the cell.
+        """
+        if self._journal is not None:
+            self._journal.record(action, index)
+
+    def file_replay_game(self):
+        """Replays a journal from its starting position, at the recorded pace times a chosen
+        speed. The game can be carried on from where the journal ends.
+
+        Returns None if no file were selected.
+        """
+        try:
+            filename = filedialog.askopenfilename(filetypes=(("Pokemon journal", "*.pkj"),("All files", "*.*")))
+            if not filename:
+                return
+            replay = journal.Replay(filename)
+        except Exception as e:
+            messagebox.showerror(title='Error', message=str(e))
+            return
+        speed = simpledialog.askfloat("Replay speed", "Speed (1 plays the moves as recorded):",
+                                      initialvalue=1.0, minvalue=0.01, parent=self._master)
+        if speed is None:
+            return
+
+        self.stop_recording()
+        self.cancel_replay()
+        self.unbind_mouse()
+        if self._timer is not None:
+            self._master.after_cancel(self._timer)
+            self._timer = None
+        self.set_model(replay.board_at(0))
+        self._time = 0
+        self.schedule_render(status=True)
+        self.schedule_replay_move(replay.moves, 0, speed)
+
+    def schedule_replay_move(self, moves, number, speed):
+        """Schedules a move of a replay after its recorded delay, or hands the game back to
+        the player once every move has been played.
+
+        Parameters:
+            moves (list<tuple<str, int, int>>): Moves of the replay, as (action, index,
+                milliseconds since the previous move).
+            number (int): Position of the move in moves.
+            speed (float): Replay speed.
+        """
+        if number == len(moves):
+            self._replay_job = None
+            self.bind_mouse()
+            self.update_clock()
+            return
+        delay = max(1, int(moves[number][2] / speed))
+        self._replay_job = self._master.after(delay, self.replay_move, moves, number, speed)
+
+    def replay_move(self, moves, number, speed):
+        """Plays a move of a replay and schedules the next one."""
+        action, index, _ = moves[number]
+        self._history.play(action, index)
+        self.schedule_render(status=True)
+        self.schedule_replay_move(moves, number + 1, speed)
+
+    def cancel_replay(self):
+        """Stops a replay in progress, handing the game back to the player."""
+        if self._replay_job is not None:
+            self._master.after_cancel(self._replay_job)
+            self._replay_job = None
+            self.bind_mouse()
+
+    def file_new_game(self):
+        """Start a new game"""
+        self.start_new_board()
+
+    def file_new_game_from_id(self):
+        """Starts a new game on the board a board ID describes. Like the boards of New game,
+        no-guess games are opened at the board's first click.
+
+        Returns None if no ID was entered."""
+        text = simpledialog.askstring("New game from ID", "Board ID:", parent=self._master)
+        if not text:
+            return
+        try:
+            board = board_id.decode(text)
+            if board.grid_size > MAX_GRID_SIZE or board.num_pokemon >= board.grid_size ** 2:
+                raise ValueError("The board of this ID is too big or too full to play")
+        except ValueError as e:
+            messagebox.showerror(title='Error', message=str(e))
+            return
+        self.stop_recording()
+        self.cancel_replay()
+        self.set_model(board_id.new_model(board))
+        self.reset()
+        if self._no_guess and board.first_click is not None:
+            self.reveal_cell(board.first_click)
+            self.schedule_render()
+
+    def file_copy_board_id(self):
+        """Shows the ID of the current board and copies it to the clipboard."""
+        board = board_id.of_model(self._BoardModel)
+        if board is None:
+            messagebox.showinfo(title="Board ID", message="This board was not dealt from a seed, so it has no ID.")
+            return
+        text = board_id.encode(board)
+        self._master.clipboard_clear()
+        self._master.clipboard_append(text)
+        messagebox.showinfo(title="Board ID", message=f"{text}\n\nCopied to the clipboard.")
+
+    def start_new_board(self):
+        """Starts a game on a board from the board pool, made in the background ahead of
+        time. No-guess boards are opened at their first click. They can take a while to
+        make, so if none is ready the game waits for one without blocking the window, see
+        wait_for_board."""
+        self.cancel_board_wait()
+        if self._no_guess:
+            board = self._board_pool.take_ready(self._gridsize, self._num_pokemon, self._no_guess)
+            if board is None:
+                self.wait_for_board()
+                return
+        else:
+            board = self._board_pool.take(self._gridsize, self._num_pokemon, self._no_guess)
+        self.play_board(board)
+
+    def wait_for_board(self, interval=100):
+        """Shows that a board is being generated and polls the board pool until it is ready.
+        The board can't be played meanwhile.
+
+        Parameters:
+            interval (int): Milliseconds between polls.
+        """
+        self.unbind_mouse()
+        self._label.config(text="Generating a new board…")
+
+        def poll():
+            board = self._board_pool.take_ready(self._gridsize, self._num_pokemon, self._no_guess)
+            if board is None:
+                self._board_job = self._master.after(interval, poll)
+            else:
+                self._board_job = None
+                self._label.config(text=TITLE)
+                self.play_board(board)
+        self._board_job = self._master.after(interval, poll)
+
+    def cancel_board_wait(self):
+        """Stops waiting for a board from the board pool, see wait_for_board, giving the
+        mouse back to the current board."""
+        if self._board_job is not None:
+            self._master.after_cancel(self._board_job)
+            self._board_job = None
+            self._label.config(text=TITLE)
+            self.bind_mouse()
+
+    def play_board(self, board):
+        """Starts a game on a board from the board pool, opening no-guess boards at their
+        first click.
+
+        Parameters:
+            board (board_pool.Board): The board.
+        """
+        self._BoardModel.set_pokemon_locations(board.pokemon_locations, board.seed, board.first_click, seeded=True)
+        self.reset()
+        if self._no_guess:
+            self.reveal_cell(board.first_click)
+            self.schedule_render()
+
+    def undo(self):
+        """Takes back the last move. A journal being recorded is stopped, as journals only
+        hold moves played forwards."""
+        self.step_history(self._history.undo)
+
+    def redo(self):
+        """Plays the last undone move again, see undo."""
+        self.step_history(self._history.redo)
+
+    def step_history(self, step):
+        """Runs an undo or redo and shows its result.
+
+        Parameters:
+            step (callable): History.undo or History.redo.
+        """
+        if self._replay_job is not None:
+            return
+        if self._journal is not None:
+            self.stop_recording()
+            messagebox.showinfo(title="Recording stopped", message="Undo and redo can't be recorded, the journal has been closed.")
+        if step() is not None:
+            self.bind_mouse()
+            self.schedule_render(status=True)
+
+    def show_hint(self):
+        """Outlines the cell the solver suggests playing next: blue to reveal, red to flag."""
+        move = solver.hint(self._BoardModel.get_game(), self._gridsize, self._num_pokemon)
+        if move is not None:
+            action, index, _ = move
+            self._BoardView.highlight_cell(index, HINT_COLOURS[action])
+
+    def file_quit_game(self):
+        """Quit the game. If yes, terminate. If no, do nothing"""
+        response = messagebox.askyesno(title="Quit game", message="Are you sure you want to quit?")
+        if response:
+            self.close_window()
+        else:
+            pass
+
+    def close_window(self):
+        """Writes out any journal being recorded, stops the board pool and closes the window."""
+        self.stop_recording()
+        self.cancel_board_wait()
+        self._board_pool.close()
+        self._master.destroy()
+
+    def bind_mouse(self):
+        """Binds mouse to game board. Button 2 is the right button on macOS and the middle
+        button elsewhere, where it chords like a double click."""
+        self._BoardView.bind("<Button-1>", self.left_click)
+        self._BoardView.bind("<Double-Button-1>", self.chord_click)
+        if self._master.tk.call('tk', 'windowingsystem') == 'aqua':
+            self._BoardView.bind("<Button-2>", self.right_click)
+        else:
+            self._BoardView.bind("<Button-2>", self.chord_click)
+        self._BoardView.bind("<Button-3>", self.right_click)
+
+    @instrumentation.timed('reset')
+    def reset(self):
+        """resets the game, same pokemon locations"""
+        if self._timer is not None:
+                self._master.after_cancel(self._timer)
+        self.stop_recording()
+        self.cancel_replay()
+        self.cancel_board_wait()
+        self._BoardModel.reset_game()
+        self._history.clear()
+        self._time = 0
+        self._timer = None
+        self.update_clock()
+        self.bind_mouse()
+        self.schedule_render(status=True)
+
+    def restart_game(self, event):
+        """Restart the game.
+
+        Parameters:
+            event (tk.event): Left mouse click.
+        """
+        self.reset()
+
+    def new_game(self, event):
+        """Restarts the game, new pokemon locations.
+        
+        Parameters:
+            event (tk.event): Left mouse click.
+        """
+        self.start_new_board()
+
+    def update_clock(self):
+        """Updates the time elapsed on status bar every second."""
+        self._StatusBar.time(self._time)
+        self._time += 1
+        self._timer = self._master.after(1000, self.update_clock)
+    
+    def label_and_root_config(self):
+        """Configures the PokemonGame label: "Pokemon: Got 2 Find Them All!" and packing it on
+        root window.
+        Configures the root window.
+        """
+        self._master.title(TITLE)
+        self._label = tk.Label(self._master, text = TITLE, bg='IndianRed2', fg='white', borderwidth=2.5, relief = "raised")
+        self._label.config(font=("Arial", 20))
+        self._label.pack(fill=tk.BOTH)
+        
+    def boardview_config(self):
+        """Configures the 2D gameboard and attaching it to root window."""
+        self._BoardView.config(width=self._BoardView._board_width, height=self._BoardView._board_width)
+        if isinstance(self._BoardView, ViewportBoardView):
+            # The viewport sits in a frame with its scrollbars.
+            self._BoardView.master.pack(expand=True, fill=tk.BOTH, side=tk.TOP)
+        else:
+            self._BoardView.pack(expand=True, side=tk.TOP)
+
+    def attempted_catches_and_pokeballs_left(self):
+        """Calculates the number of pokeballs left. Places both number of attempted catches
+        and pokeballs left on status bar."""
+        attempted_catches = self._BoardModel.get_num_attempted_catches()
+        pokeball_left = self._num_pokemon - attempted_catches
+        self._StatusBar.attempted_catch.config(text= str(attempted_catches) +' attempted catches', font=("Arial", 9))
+        self._StatusBar.attempted_catch.pack()
+        self._StatusBar.pokeball.config(text= str(pokeball_left) + ' pokeballs left', font=("Arial", 9))
+        self._StatusBar.pokeball.pack(side=tk.LEFT)
+
+    def schedule_render(self, status=False):
+        """Asks for the board, and the status bar if status is True, to be drawn once the
+        current event has been handled. However many changes an event makes, they are drawn
+        together in one pass.
+
+        Parameters:
+            status (bool): Whether the status bar counts have changed too.
+        """
+        self._status_dirty = self._status_dirty or status
+        if self._render_job is None:
+            self._render_job = self._master.after_idle(self.render)
+
+    def flush_render(self):
+        """Draws a scheduled render straight away, e.g. before a message box."""
+        if self._render_job is not None:
+            self._master.after_cancel(self._render_job)
+            self.render()
+
+    def render(self):
+        """Draws the changes scheduled by schedule_render."""
+        self._render_job = None
+        self.game_display()
+        if self._status_dirty and self._task == TASK_TWO:
+            self.attempted_catches_and_pokeballs_left()
+        self._status_dirty = False
+
+    @instrumentation.timed('game_display')
+    def game_display(self):
+        """Draws up the 2D game board based on current game string."""     
+        items_created = self._BoardView.items_created
+        dirty = self._BoardModel.drain_dirty()
+        self._BoardView.draw_board(self._BoardModel.get_game(), dirty)
+        if instrumentation.ENABLED:
+            instrumentation.count('cells_drawn', len(dirty))
+            instrumentation.count('canvas_items_created', self._BoardView.items_created - items_created)
+            # Tk paints the canvas when idle, time until then separately.
+            instrumentation.time_until_idle(self._master, 'tk_render')
+
+    def unbind_mouse(self):
+        """Unbinds mouse from game board."""
+        self._BoardView.unbind("<Button-1>")
+        self._BoardView.unbind("<Double-Button-1>")
+        self._BoardView.unbind("<Button-2>")
+        self._BoardView.unbind("<Button-3>")
+
+    def win_or_lose_task1(self):
+        """Displays win message if game is won, lose message if game is lost(task1). Also,
+        unbinds mouse on either condition."""
+        if self._BoardModel.check_win() or self._BoardModel.check_loss():
+            # Show the final board before the message box blocks the event loop.
+            self.flush_render()
+        if self._BoardModel.check_win():
+            self._BoardView.win_message_task1()
+            self.unbind_mouse()
+
+        if self._BoardModel.check_loss():
+            self._BoardView.lose_message_task1()
+            self.unbind_mouse()    
+
+    def win_or_lose_task2(self):
+        """Displays the win message and lose message appropriately. Unbinds mouse and stops
+        all elements on status bar. If player wants to play again, initialise new game, if
+        not, terminate."""
+        if self._BoardModel.check_win() or self._BoardModel.check_loss():
+            # Show the final board before the message box blocks the event loop.
+            self.flush_render()
+        if self._BoardModel.check_win():
+            self.unbind_mouse()
+            if self._timer is not None:
+                self._master.after_cancel(self._timer)
+            if self._BoardView.win_message_task2():
+                self.start_new_board()
+            else:
+                self.close_window()
+                
+        if self._BoardModel.check_loss():
+            self.unbind_mouse()
+            if self._timer is not None:
+                self._master.after_cancel(self._timer)
+            if self._BoardView.lose_message_task2():
+                self.start_new_board()
+            else:
+                self.close_window()
+                
+    @instrumentation.timed('left_click')
+    def left_click(self, event):
+        """Mouse left click 
+
+        Parameters:
+            event (tk.event): left clicking
+        """
+        x, y = event.x, event.y
+        position = self._BoardView.pixel_to_positions((x, y))
+        if position is None:
+            return
+        row, col = position
+        index = self._gridsize * row + col
+        if self.reveal_cell(index):
+            self.schedule_render()
+        if self._task == TASK_ONE:
+            self.win_or_lose_task1()
+        elif self._task == TASK_TWO:
+            self.win_or_lose_task2()
+
+    @instrumentation.timed('chord_click')
+    def chord_click(self, event):
+        """Mouse middle or double click. On a number with as many flags around it, reveals
+        all its other neighbours in one batch with a single redraw; anywhere else it acts as
+        a left click.
+
+        Parameters:
+            event (tk.event): middle or double clicking
+        """
+        position = self._BoardView.pixel_to_positions((event.x, event.y))
+        if position is None:
+            return
+        row, col = position
+        index = self._gridsize * row + col
+        moves = self._BoardModel.chord_moves(index)
+        if not moves:
+            self.left_click(event)
+            return
+        revealed = self._BoardModel.get_num_revealed()
+        self._history.play_moves(moves)
+        for action, move_index in moves:
+            self.record_move(action, move_index)
+        instrumentation.count('cells_revealed', self._BoardModel.get_num_revealed() - revealed)
+        self.schedule_render()
+        if self._task == TASK_ONE:
+            self.win_or_lose_task1()
+        elif self._task == TASK_TWO:
+            self.win_or_lose_task2()
+
+    @instrumentation.timed('reveal_cell')
+    def reveal_cell(self, index):
+        """Reveals a cell in the model, or every pokemon if the cell holds one, as an
+        undoable move.
+
+        Parameters:
+            index (int): Index of the cell.
+
+        Returns:
+            (bool): True if the move changed the board, False if the cell is off the board,
+            flagged or already revealed.
+        """
+        if not 0 <= index < self._gridsize ** 2:
+            return False
+        revealed = self._BoardModel.get_num_revealed()
+        if not self._history.play(REVEAL, index).changed:
+            return False
+        self.record_move(REVEAL, index)
+        instrumentation.count('cells_revealed', self._BoardModel.get_num_revealed() - revealed)
+        return True
+
+    @instrumentation.timed('right_click')
+    def right_click(self, event):
+        """Mouse left click 
+
+        Parameters:
+            event (tk.event): right clicking
+        """
+        pokeball_left = self._num_pokemon - self._BoardModel.get_num_attempted_catches()
+        x, y = event.x, event.y
+        position = self._BoardView.pixel_to_positions((x, y))
+        if position is None:
+            return
+        row, col = position
+        index = self._gridsize * row + col
+        if self._task == TASK_TWO:
+            self.win_or_lose_task2() 
+            if pokeball_left > 0 or self._BoardModel.get_cell(index) != UNEXPOSED:
+                self.flag_cell(index, status=True)
+        elif self._task == TASK_ONE:
+            self.win_or_lose_task1()
+            self.flag_cell(index)
+
+    def flag_cell(self, index, status=False):
+        """Toggles a flag as an undoable move, journaling it and scheduling a render only
+        if it changed the board, e.g. not on a revealed cell.
+
+        Parameters:
+            index (int): Index of the cell.
+            status (bool): Whether the status bar is rendered too.
+        """
+        if self._history.play(FLAG_MOVE, index).changed:
+            self.record_move(FLAG_MOVE, index)
+            self.schedule_render(status=status)
@@ -0,0 +1,180 @@
+"""Undo and redo of the moves of a game, from per-move deltas.
+
+Each move played through a History is stored as the cells it wrote: their indexes, their
+previous bytes and their new bytes, taken from BoardModel's change log. Undo writes the
+previous bytes back and redo the new ones, so both cost the size of the move whatever the
+size of the board. Every K moves the whole board is also kept as an immutable snapshot,
+which branch() starts from to rebuild any position in at most K moves. Snapshots are
+immutable bytes, never copied while they are only read; a branch gets its own copy of the
+cells when it is made. The number of moves kept is capped: the oldest moves and snapshots
+are dropped first, rolling a base board forward so the oldest kept position can still be
+rebuilt.
+"""
+from collections import deque
+
+from board_model import MoveResult
+
+class Delta:
+    """The cells written by one move."""
+
+    __slots__ = ('indexes', 'before', 'after')
+
+    def __init__(self, indexes, before, after):
+        """Construct a delta.
+
+        Parameters:
+            indexes (tuple<int>): Cells written, each once.
+            before (bytes): Cell bytes before the move, one per index.
+            after (bytes): Cell bytes after the move, one per index.
+        """
+        self.indexes = indexes
+        self.before = before
+        self.after = after
+
+class History:
+    """Undo and redo of the moves played on a game."""
+
+    def __init__(self, model, limit=1000, snapshot_every=50):
+        """Starts a history at the game's current position.
+
+        Parameters:
+            model (BoardModel): Game to play on.
+            limit (int): Moves kept for undo, older ones are forgotten.
+            snapshot_every (int): Moves between snapshots of the whole board.
+        """
+        self._model = model
+        self._limit = limit
+        self._snapshot_every = snapshot_every
+        self._undo = deque()
+        self._redo = []
+        # The board before the first kept move, which is move number self._first.
+        self._first = 0
+        self._base = bytearray(model._game)
+        self._snapshots = {}
+
+    def get_position(self):
+        """Returns the number of moves played since the history started, undone ones excluded."""
+        return self._first + len(self._undo)
+
+    def can_undo(self):
+        """Returns whether there is a move to undo."""
+        return bool(self._undo)
+
+    def can_redo(self):
+        """Returns whether there is an undone move to redo."""
+        return bool(self._redo)
+
+    def play_moves(self, moves):
+        """Plays a batch of moves as one undoable step, see BoardModel.apply_moves. Any
+        undone moves can no longer be redone.
+
+        Parameters:
+            moves (iterable<tuple<str, int>>): (action, index) pairs.
+
+        Returns:
+            (MoveResult): Indexes changed, and whether the game is won or lost.
+        """
+        model = self._model
+        model.start_changes()
+        try:
+            result = model.apply_moves(moves)
+        finally:
+            changes = model.take_changes()
+        if not changes:
+            return result
+        # A cell written twice in a move keeps its first previous value.
+        before = {}
+        for index, old in changes:
+            before.setdefault(index, old)
+        indexes = tuple(before)
+        game = model._game
+        self._push(Delta(indexes, bytes(before.values()), bytes(game[index] for index in indexes)))
+        return result
+
+    def play(self, action, index):
+        """Plays one move as an undoable step, see play_moves."""
+        return self.play_moves([(action, index)])
+
+    def _push(self, delta):
+        """Adds a played move, dropping the redo moves and anything past the limit."""
+        if self._redo:
+            self._redo.clear()
+            position = self.get_position()
+            for snapshot in [snapshot for snapshot in self._snapshots if snapshot > position]:
+                del self._snapshots[snapshot]
+        self._undo.append(delta)
+        position = self.get_position()
+        if position % self._snapshot_every == 0:
+            self._snapshots[position] = bytes(self._model._game)
+        while len(self._undo) > self._limit:
+            # Roll the base board forward over the forgotten move.
+            dropped = self._undo.popleft()
+            for index, value in zip(dropped.indexes, dropped.after):
+                self._base[index] = value
+            self._first += 1
+            self._snapshots.pop(self._first, None)
+
+    def _write(self, indexes, values):
+        """Writes cell bytes back to the game."""
+        replace = self._model.replace_character_at_index
+        for index, value in zip(indexes, values):
+            replace(index, chr(value))
+
+    def undo(self):
+        """Takes back the last move.
+
+        Returns:
+            (MoveResult): Indexes changed and the game state after, None if there is no move
+            to undo.
+        """
+        if not self._undo:
+            return None
+        delta = self._undo.pop()
+        self._write(delta.indexes, delta.before)
+        self._redo.append(delta)
+        return MoveResult(set(delta.indexes), self._model.check_win(), self._model.check_loss())
+
+    def redo(self):
+        """Plays the last undone move again.
+
+        Returns:
+            (MoveResult): Indexes changed and the game state after, None if there is no move
+            to redo.
+        """
+        if not self._redo:
+            return None
+        delta = self._redo.pop()
+        self._write(delta.indexes, delta.after)
+        self._undo.append(delta)
+        return MoveResult(set(delta.indexes), self._model.check_win(), self._model.check_loss())
+
+    def branch(self, position=None):
+        """Makes an independent copy of the game as it was after a number of moves, e.g. to
+        try moves out without touching the game being played.
+
+        Parameters:
+            position (int): Moves played, between the first kept move and the current
+                position. The current position if not given.
+
+        Returns:
+            (BoardModel): The copy.
+        """
+        current = self.get_position()
+        if position is None or position == current:
+            return self._model.fork()
+        if not self._first <= position <= current:
+            raise ValueError(f"Move {position} is not in the history")
+        start = max((snapshot for snapshot in self._snapshots if snapshot <= position), default=self._first)
+        game = bytearray(self._snapshots[start] if start != self._first else self._base)
+        for delta in list(self._undo)[start - self._first:position - self._first]:
+            for index, value in zip(delta.indexes, delta.after):
+                game[index] = value
+        return self._model.fork(game)
+
+    def clear(self):
+        """Forgets every move, starting again from the game's current position."""
+        self._undo.clear()
+        self._redo.clear()
+        self._first = 0
+        self._base = bytearray(self._model._game)
+        self._snapshots = {}
@@ -0,0 +1,183 @@
+"""Latency timers, counters and profiling hooks for the game's interactions.
+
+Instrumentation is off unless enable() is called or the POKEMON_METRICS environment
+variable names a file to dump the metrics to on exit. When it is off a timed function
+costs one extra call and a flag check. When it is on, each call's duration is added to a
+histogram for its operation; calls nested inside another timed call are timed too.
+
+profile_next(path) runs the next top level timed call under cProfile and writes its stats
+to path, e.g. to see where a slow click goes. POKEMON_PROFILE does the same for the first
+interaction after start up.
+"""
+import atexit
+import cProfile
+import functools
+import json
+import math
+import os
+import time
+from collections import deque
+
+# Samples kept per operation, the oldest are dropped first.
+MAX_SAMPLES = 10000
+
+ENABLED = False
+_histograms = {}
+_counters = {}
+_profile_path = None
+_depth = 0
+
+class Histogram:
+    """Durations of the most recent calls of one operation."""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        """Construct an empty histogram.
+
+        Parameters:
+            max_samples (int): Number of recent samples kept.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self._samples = deque(maxlen=max_samples)
+
+    def add(self, seconds):
+        """Records one duration."""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        self._samples.append(seconds)
+
+    def percentile(self, percent):
+        """Returns the duration in seconds below which percent of the kept samples fall, 0
+        if there are none."""
+        return _percentile(sorted(self._samples), percent)
+
+    def summary(self):
+        """Returns the count, mean, p50, p95, p99 and maximum in milliseconds."""
+        samples = sorted(self._samples)
+        return {'count': self.count, 'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+                'p50_ms': _percentile(samples, 50) * 1000, 'p95_ms': _percentile(samples, 95) * 1000,
+                'p99_ms': _percentile(samples, 99) * 1000, 'max_ms': self.maximum * 1000}
+
+def _percentile(samples, percent):
+    """Nearest rank percentile of sorted samples, 0 if there are none."""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, max(0, math.ceil(percent / 100 * len(samples)) - 1))]
+
+def enable(dump_path=None):
+    """Turns instrumentation on.
+
+    Parameters:
+        dump_path (str): File to write the metrics to when the program exits, if given.
+    """
+    global ENABLED
+    ENABLED = True
+    if dump_path:
+        atexit.register(dump, dump_path)
+
+def disable():
+    """Turns instrumentation off, keeping what was recorded."""
+    global ENABLED
+    ENABLED = False
+
+def reset():
+    """Forgets every recorded duration and counter."""
+    _histograms.clear()
+    _counters.clear()
+
+def record(name, seconds):
+    """Adds a duration to an operation's histogram."""
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = Histogram()
+    histogram.add(seconds)
+
+def count(name, amount=1):
+    """Adds to a counter, if instrumentation is on.
+
+    Parameters:
+        name (str): Counter, e.g. 'cells_revealed'.
+        amount (int): Amount to add.
+    """
+    if ENABLED:
+        _counters[name] = _counters.get(name, 0) + amount
+
+def profile_next(path):
+    """Runs the next top level timed call under cProfile, writing its stats to path.
+
+    Parameters:
+        path (str): File for the stats, readable with pstats.
+    """
+    global _profile_path
+    _profile_path = path
+
+def timed(name):
+    """Decorator timing every call of a function as the operation name.
+
+    Parameters:
+        name (str): Operation the calls are recorded under.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not ENABLED and _profile_path is None:
+                return function(*args, **kwargs)
+            return _call(name, function, args, kwargs)
+        return wrapper
+    return decorator
+
+def _call(name, function, args, kwargs):
+    """Runs an instrumented call, profiling it if a profile was asked for."""
+    global _depth, _profile_path
+    profile = None
+    if _profile_path is not None and _depth == 0:
+        path, _profile_path = _profile_path, None
+        profile = cProfile.Profile()
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        if profile is not None:
+            return profile.runcall(function, *args, **kwargs)
+        return function(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        _depth -= 1
+        if ENABLED:
+            record(name, elapsed)
+        if profile is not None:
+            profile.dump_stats(path)
+
+def time_until_idle(widget, name):
+    """Records the time from now until the Tk event loop is next idle, i.e. until the
+    redraws already scheduled have been painted, if instrumentation is on.
+
+    Parameters:
+        widget (tk.Widget): Any widget of the application.
+        name (str): Operation the time is recorded under.
+    """
+    if ENABLED:
+        start = time.perf_counter()
+        widget.after_idle(lambda: record(name, time.perf_counter() - start))
+
+def snapshot():
+    """Returns everything recorded so far.
+
+    Returns:
+        (dict): 'operations' mapping each operation to its summary (see Histogram.summary)
+        and 'counters' mapping each counter to its value.
+    """
+    return {'operations': {name: histogram.summary() for name, histogram in sorted(_histograms.items())},
+            'counters': dict(sorted(_counters.items()))}
+
+def dump(path):
+    """Writes snapshot() to a file as JSON."""
+    with open(path, 'w') as file:
+        json.dump(snapshot(), file, indent=1)
+
+if os.environ.get('POKEMON_METRICS'):
+    enable(os.environ['POKEMON_METRICS'])
+if os.environ.get('POKEMON_PROFILE'):
+    profile_next(os.environ['POKEMON_PROFILE'])
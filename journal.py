@@ -0,0 +1,179 @@
+"""Append-only journal of the moves of a game, and replay of journals.
+
+A journal starts with a header (magic b'PKMJ', format version, flags, grid size, pokemon
+count, board seed and checkpoint interval) followed by the pokemon bitmap of the board.
+Records are then appended as the game is played:
+
+    move        kind (1 reveal, 2 flag), cell index, milliseconds since the last move
+    checkpoint  kind 3, number of moves played, length, cell states packed as in savefile
+
+A checkpoint of the starting position is written first and another one every K moves, so
+a replay can jump to any move by restoring the checkpoint before it and playing the moves
+after it. Records are buffered and written in batches.
+"""
+import mmap
+import struct
+import time
+
+from board_model import BoardModel, REVEAL, FLAG_MOVE
+import savefile
+
+MAGIC = b'PKMJ'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIQI')
+HAS_SEED = 1
+RECORD = struct.Struct('<BQI')
+CHECKPOINT = struct.Struct('<BQI')
+
+KIND_REVEAL = 1
+KIND_FLAG = 2
+KIND_CHECKPOINT = 3
+_KINDS = {REVEAL: KIND_REVEAL, FLAG_MOVE: KIND_FLAG}
+_ACTIONS = {KIND_REVEAL: REVEAL, KIND_FLAG: FLAG_MOVE}
+
+class JournalWriter:
+    """Records the moves applied to a game."""
+
+    def __init__(self, path, model, checkpoint_every=100, flush_every=64):
+        """Creates the journal and records the game's current position as its start.
+
+        Parameters:
+            path (str): File to write, replaced if it exists.
+            model (BoardModel): Game being played. Moves must be recorded after they are
+                applied to it, as checkpoints are taken from it.
+            checkpoint_every (int): Moves between checkpoints.
+            flush_every (int): Records buffered before they are written.
+        """
+        self._model = model
+        self._checkpoint_every = checkpoint_every
+        self._flush_every = flush_every
+        self._moves = 0
+        self._buffered = 0
+        self._buffer = bytearray()
+        self._last = time.perf_counter()
+        seed = model.get_seed()
+        self._file = open(path, 'wb')
+        self._buffer += HEADER.pack(MAGIC, VERSION, HAS_SEED if seed is not None else 0,
+                                    model.get_grid_size(), model.get_num_pokemon(),
+                                    seed if seed is not None else 0, checkpoint_every)
+        self._buffer += savefile.pack_pokemons(model)
+        self._checkpoint()
+        self.flush()
+
+    def _checkpoint(self):
+        """Appends the current position of the game."""
+        cells = savefile.pack_cells(self._model)
+        self._buffer += CHECKPOINT.pack(KIND_CHECKPOINT, self._moves, len(cells))
+        self._buffer += cells
+
+    def record(self, action, index):
+        """Appends a move that has just been applied to the game.
+
+        Parameters:
+            action (str): REVEAL or FLAG_MOVE.
+            index (int): Index of the cell.
+        """
+        now = time.perf_counter()
+        delta = min(int((now - self._last) * 1000), 0xFFFFFFFF)
+        self._last = now
+        self._buffer += RECORD.pack(_KINDS[action], index, delta)
+        self._moves += 1
+        self._buffered += 1
+        if self._moves % self._checkpoint_every == 0:
+            self._checkpoint()
+        if self._buffered >= self._flush_every:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer = bytearray()
+        self._buffered = 0
+
+    def close(self):
+        """Writes the buffered records and closes the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+class Replay:
+    """A journal read back for replaying."""
+
+    def __init__(self, path):
+        """Reads a journal.
+
+        Parameters:
+            path (str): Journal file.
+        """
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, version, flags, grid_size, num_pokemon, seed, checkpoint_every = HEADER.unpack_from(data)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a pokemon game journal")
+            if version != VERSION:
+                raise ValueError(f"Unsupported journal format version {version}")
+            self._grid_size = grid_size
+            self._seed = seed if flags & HAS_SEED else None
+            cell_count = grid_size ** 2
+            offset = HEADER.size
+            bitmap_end = offset + -(-cell_count // 8)
+            self._pokemon_locations = savefile.unpack_pokemons(data[offset:bitmap_end], cell_count)
+            offset = bitmap_end
+
+            self.moves = []
+            self._checkpoints = {}
+            # A crashed game can leave a partly written record at the end, it is ignored.
+            while offset + RECORD.size <= len(data):
+                kind, value, extra = RECORD.unpack_from(data, offset)
+                offset += RECORD.size
+                if kind == KIND_CHECKPOINT:
+                    if offset + extra > len(data):
+                        break
+                    self._checkpoints[value] = data[offset:offset + extra]
+                    offset += extra
+                elif kind in _ACTIONS:
+                    self.moves.append((_ACTIONS[kind], value, extra))
+                else:
+                    raise ValueError(f"Journal is corrupt at byte {offset - RECORD.size}")
+        if 0 not in self._checkpoints:
+            raise ValueError("Journal has no starting position")
+        self._checkpoint_moves = sorted(self._checkpoints)
+
+    def __len__(self):
+        """Returns the number of moves in the journal."""
+        return len(self.moves)
+
+    def board_at(self, move):
+        """Rebuilds the game as it was after a number of moves, starting from the closest
+        checkpoint before it.
+
+        Parameters:
+            move (int): Number of moves played, 0 for the starting position.
+
+        Returns:
+            (BoardModel): The game at that point.
+        """
+        move = max(0, min(move, len(self.moves)))
+        start = max(checkpoint for checkpoint in self._checkpoint_moves if checkpoint <= move)
+        model = BoardModel(self._grid_size, len(self._pokemon_locations), seed=self._seed,
+                           pokemon_locations=self._pokemon_locations)
+        savefile.restore_cells(model, self._checkpoints[start])
+        for action, index, _ in self.moves[start:move]:
+            model.apply_move(action, index)
+        return model
+
+    def play(self, start=0):
+        """Replays the game move by move.
+
+        Parameters:
+            start (int): Number of moves to skip to before replaying.
+
+        Yields:
+            (BoardModel, tuple<str, int, int>): The game after each move (the same model,
+            updated in place) and the move as (action, index, milliseconds since the last move).
+        """
+        model = self.board_at(start)
+        for move in self.moves[start:]:
+            model.apply_move(move[0], move[1])
+            yield model, move
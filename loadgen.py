@@ -0,0 +1,142 @@
+"""Load generator for server.py: many concurrent clients playing random games.
+
+Each client opens a connection, creates a session and reveals random unexposed cells until
+the game ends, then starts another, for the given duration. Throughput and latency
+percentiles of every request are printed as JSON at the end, along with the clients that
+stopped on an error, e.g. a refused connection. Percentiles are null if no request
+finished.
+
+Usage:
+    python loadgen.py --clients 200 --duration 10
+    python loadgen.py --serve --clients 200   (runs a server in the same process)
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import Counter
+
+import server
+
+class Client:
+    """One connection to the server, sending a request at a time."""
+
+    def __init__(self, reader, writer, latencies):
+        self._reader = reader
+        self._writer = writer
+        self._latencies = latencies
+        self._next_id = 0
+
+    async def request(self, **request):
+        """Sends a request and waits for its response.
+
+        Returns:
+            (dict): The response.
+        """
+        self._next_id += 1
+        request['id'] = self._next_id
+        start = time.perf_counter()
+        self._writer.write(json.dumps(request, separators=(',', ':')).encode() + b'\n')
+        response = json.loads(await self._reader.readline())
+        self._latencies.append(time.perf_counter() - start)
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error'))
+        return response
+
+    def close(self):
+        self._writer.close()
+
+async def play(connect, grid_size, num_pokemon, deadline, latencies, games, seed):
+    """Plays random games on one connection until the deadline."""
+    reader, writer = await connect()
+    client = Client(reader, writer, latencies)
+    rng = random.Random(seed)
+    try:
+        while time.perf_counter() < deadline:
+            session = (await client.request(cmd='create', grid_size=grid_size, num_pokemon=num_pokemon,
+                                            seed=rng.getrandbits(32)))['session']
+            unexposed = list(range(grid_size ** 2))
+            rng.shuffle(unexposed)
+            hidden = set(unexposed)
+            while unexposed and time.perf_counter() < deadline:
+                index = unexposed.pop()
+                if index not in hidden:
+                    continue
+                response = await client.request(cmd='reveal', session=session, index=index)
+                hidden.difference_update(cell for cell, _ in response['cells'])
+                if response['won'] or response['lost']:
+                    break
+            await client.request(cmd='close', session=session)
+            games.append(session)
+    finally:
+        client.close()
+
+def milliseconds(seconds):
+    """Converts a latency to milliseconds, keeping None for no latency."""
+    return None if seconds is None else seconds * 1000
+
+async def run(args):
+    """Runs the clients and returns the report."""
+    listener = None
+    if args.serve:
+        listener = await server.start_server(server.GameServer(), args.host, 0, args.unix)
+        if args.unix is None:
+            args.port = listener.sockets[0].getsockname()[1]
+
+    if args.unix is not None:
+        connect = lambda: asyncio.open_unix_connection(args.unix, limit=server.MAX_LINE)
+    else:
+        connect = lambda: asyncio.open_connection(args.host, args.port, limit=server.MAX_LINE)
+
+    latencies = []
+    games = []
+    start = time.perf_counter()
+    deadline = start + args.duration
+    results = await asyncio.gather(*(play(connect, args.grid_size, args.pokemons, deadline, latencies, games, seed)
+                                     for seed in range(args.clients)), return_exceptions=True)
+    errors = Counter(type(result).__name__ for result in results if isinstance(result, Exception))
+    elapsed = time.perf_counter() - start
+    if listener is not None:
+        listener.close()
+        await listener.wait_closed()
+
+    latencies.sort()
+    if not latencies:
+        percentiles = [None] * 999
+    elif len(latencies) == 1:
+        percentiles = latencies * 999
+    else:
+        percentiles = statistics.quantiles(latencies, n=1000)
+    return {
+        'clients': args.clients,
+        'failed_clients': sum(errors.values()),
+        'errors': dict(errors),
+        'requests': len(latencies),
+        'games': len(games),
+        'seconds': elapsed,
+        'requests_per_second': len(latencies) / elapsed,
+        'p50_ms': milliseconds(percentiles[499]),
+        'p95_ms': milliseconds(percentiles[949]),
+        'p99_ms': milliseconds(percentiles[989]),
+        'p999_ms': milliseconds(percentiles[998]),
+        'max_ms': milliseconds(latencies[-1] if latencies else None),
+    }
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Load test the pokemon game server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="Unix socket path of the server")
+    parser.add_argument('--serve', action='store_true', help="run a server in this process")
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--grid-size', type=int, default=10)
+    parser.add_argument('--pokemons', type=int, default=15)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), indent=1))
+
+if __name__ == '__main__':
+    main()
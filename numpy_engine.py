@@ -0,0 +1,256 @@
+"""NumPy engine playing a batch of games at once, e.g. to evaluate many boards when tuning
+the difficulty.
+
+A BatchBoard holds every game of the batch as one (board, row, column) array of the same
+cell bytes BoardModel uses, and the pokemons and adjacency counts as arrays of the same
+shape. Adjacency counts come from one shifted sum over the whole batch, and each move
+is a vectorized step across all boards: one cell per board is revealed or flagged, the
+openings grow from the revealed cells together, and the win and loss checks run on every
+board at once. Boards are built from the same seeds and the same placement as BoardModel,
+so a batch plays exactly like a BoardModel per board.
+
+NumPy is optional. Only the board model is imported, never tkinter or PIL.
+"""
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from board_model import (BoardModel, REVEAL, FLAG_MOVE, _FLAG, _UNEXPOSED, _POKEMON, _DIGITS,
+                         place_pokemons, neighbour_indexes)
+
+# Index of a board that sits a move out.
+NO_MOVE = -1
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The NumPy engine needs numpy, install it with 'pip install numpy'")
+
+def _neighbour_sum(mask):
+    """Counts the set cells next to each cell of every board, in one shifted sum.
+
+    Parameters:
+        mask (np.ndarray): (board, row, column) array of booleans.
+
+    Returns:
+        (np.ndarray): uint8 array of the same shape.
+    """
+    boards, rows, cols = mask.shape
+    padded = np.zeros((boards, rows + 2, cols + 2), np.uint8)
+    padded[:, 1:-1, 1:-1] = mask
+    total = np.zeros(mask.shape, np.uint8)
+    for row_step in range(3):
+        for col_step in range(3):
+            if row_step != 1 or col_step != 1:
+                total += padded[:, row_step:row_step + rows, col_step:col_step + cols]
+    return total
+
+def _dilate(mask):
+    """Grows the set cells of every board onto their eight neighbours.
+
+    Parameters:
+        mask (np.ndarray): (board, row, column) array of booleans.
+
+    Returns:
+        (np.ndarray): The grown mask, the cells themselves included.
+    """
+    grown = mask.copy()
+    grown[:, 1:, :] |= mask[:, :-1, :]
+    grown[:, :-1, :] |= mask[:, 1:, :]
+    rows = grown.copy()
+    grown[:, :, 1:] |= rows[:, :, :-1]
+    grown[:, :, :-1] |= rows[:, :, 1:]
+    return grown
+
+class BatchBoard:
+    """A batch of games of the same size, played a move per board at a time."""
+
+    def __init__(self, grid_size, num_pokemon, seeds=None, pokemon_locations=None, safe_index=None):
+        """Construct a batch of unplayed games.
+
+        Parameters:
+            grid_size (int): Size of grid.
+            num_pokemon (int): Number of pokemons in each game.
+            seeds (iterable<int>): Seed of each board, placed as BoardModel places them.
+            pokemon_locations (iterable<tuple<int>>): Pokemon indexes of each board,
+                instead of seeds.
+            safe_index (int): Index of a first click that every seeded board keeps free of
+                pokemons, see BoardModel.generate_pokemons.
+        """
+        _require_numpy()
+        if (seeds is None) == (pokemon_locations is None):
+            raise ValueError("Give either seeds or pokemon locations")
+        cell_count = grid_size ** 2
+        self._grid_size = grid_size
+        self._seeds = None
+        if seeds is not None:
+            self._seeds = list(seeds)
+            excluded = ()
+            if safe_index is not None:
+                excluded = [safe_index] + neighbour_indexes(safe_index, grid_size)
+            pokemon_locations = [place_pokemons(cell_count, num_pokemon, random.Random(seed), excluded)
+                                 for seed in self._seeds]
+        self._pokemon_locations = [tuple(locations) for locations in pokemon_locations]
+        boards = len(self._pokemon_locations)
+
+        pokemons = np.zeros((boards, cell_count), bool)
+        for board, locations in enumerate(self._pokemon_locations):
+            pokemons[board, list(locations)] = True
+        self._pokemons = pokemons.reshape(boards, grid_size, grid_size)
+        self._num_pokemon = pokemons.sum(axis=1)
+        self._adjacent = _neighbour_sum(self._pokemons)
+        # Cells an opening spreads through: no pokemon and none next to it.
+        self._zeros = (self._adjacent == 0) & ~self._pokemons
+        self._digits = np.array(_DIGITS, np.uint8)[self._adjacent.clip(0, 8)]
+        self._game = np.full((boards, grid_size, grid_size), _UNEXPOSED, np.uint8)
+
+    def __len__(self):
+        return len(self._pokemon_locations)
+
+    def get_grid_size(self):
+        """Returns the size of the grid."""
+        return self._grid_size
+
+    def get_seeds(self):
+        """Returns the seed of each board, None if the boards were given as locations."""
+        return self._seeds
+
+    def get_pokemon_locations(self, board):
+        """Returns the pokemon indexes of one board."""
+        return self._pokemon_locations[board]
+
+    def get_adjacent(self):
+        """Returns the number of pokemons next to each cell of every board.
+
+        Returns:
+            (np.ndarray): (board, row, column) uint8 array, read only by convention.
+        """
+        return self._adjacent
+
+    def get_game(self, board):
+        """Returns the cell bytes of one board, as BoardModel holds them.
+
+        Returns:
+            (bytes): One byte per cell.
+        """
+        return self._game[board].tobytes()
+
+    def to_model(self, board):
+        """Builds a BoardModel holding one board of the batch as it is now, e.g. to check
+        the engine against it or to carry on a game there.
+
+        Returns:
+            (BoardModel): The game.
+        """
+        seed = self._seeds[board] if self._seeds is not None else None
+        model = BoardModel(self._grid_size, len(self._pokemon_locations[board]), seed=seed,
+                           pokemon_locations=self._pokemon_locations[board])
+        return model.fork(self.get_game(board))
+
+    def _cells(self, indexes):
+        """Splits one index per board into the boards moving and their rows and columns."""
+        indexes = np.asarray(indexes, np.int64)
+        if indexes.shape != (len(self),):
+            raise ValueError(f"Expected one index per board, {len(self)} in all")
+        boards = np.flatnonzero(indexes != NO_MOVE)
+        rows, cols = np.divmod(indexes[boards], self._grid_size)
+        return boards, rows, cols
+
+    def apply_move(self, action, indexes):
+        """Applies one move on every board, as BoardModel.apply_move does per board.
+
+        Parameters:
+            action (str): REVEAL or FLAG_MOVE.
+            indexes (sequence<int>): Index of the cell moved on in each board, NO_MOVE for
+                boards that sit this move out.
+        """
+        if action == FLAG_MOVE:
+            self.flag(indexes)
+        elif action == REVEAL:
+            self.reveal(indexes)
+        else:
+            raise ValueError(f"Unknown action {action!r}")
+
+    def flag(self, indexes):
+        """Toggles a flag on one unexposed or flagged cell per board.
+
+        Parameters:
+            indexes (sequence<int>): Index of the cell in each board, or NO_MOVE.
+        """
+        boards, rows, cols = self._cells(indexes)
+        cells = self._game[boards, rows, cols]
+        toggled = np.where(cells == _FLAG, _UNEXPOSED, np.where(cells == _UNEXPOSED, _FLAG, cells))
+        self._game[boards, rows, cols] = toggled
+
+    def reveal(self, indexes):
+        """Reveals one cell per board. Revealing a pokemon exposes every pokemon of its
+        board, revealing a cell that is not unexposed does nothing, and revealing a cell
+        with no pokemon next to it opens the unflagged cells connected to it, stopping at
+        flags, exactly as BoardModel.big_fun_search does.
+
+        Parameters:
+            indexes (sequence<int>): Index of the cell in each board, or NO_MOVE.
+        """
+        boards, rows, cols = self._cells(indexes)
+        game = self._game
+
+        hit = self._pokemons[boards, rows, cols]
+        lost = boards[hit]
+        if len(lost):
+            game[lost] = np.where(self._pokemons[lost], _POKEMON, game[lost])
+
+        safe = ~hit & (game[boards, rows, cols] == _UNEXPOSED)
+        boards, rows, cols = boards[safe], rows[safe], cols[safe]
+        game[boards, rows, cols] = self._digits[boards, rows, cols]
+
+        # Only the boards whose click landed on a zero cell open further. Their openings
+        # grow from the clicked cell a ring of neighbours per step, through unflagged zero
+        # cells, until no board's opening grows.
+        opening = self._zeros[boards, rows, cols]
+        boards, rows, cols = boards[opening], rows[opening], cols[opening]
+        if not len(boards):
+            return
+        passable = self._zeros[boards] & (game[boards] != _FLAG)
+        region = np.zeros(passable.shape, bool)
+        region[np.arange(len(boards)), rows, cols] = True
+        growing = np.arange(len(boards))
+        while len(growing):
+            grown = _dilate(region[growing]) & passable[growing]
+            changed = (grown != region[growing]).any(axis=(1, 2))
+            region[growing] = grown
+            growing = growing[changed]
+
+        # The opening and the cells bordering it are revealed, flags excepted.
+        shown = _dilate(region) & (game[boards] != _FLAG)
+        game[boards] = np.where(shown, self._digits[boards], game[boards])
+
+    def check_win(self):
+        """Checks which games have been won: no unexposed cell left and as many flags as
+        pokemons, as BoardModel.check_win.
+
+        Returns:
+            (np.ndarray): A boolean per board.
+        """
+        game = self._game
+        unexposed = (game == _UNEXPOSED).any(axis=(1, 2))
+        flags = (game == _FLAG).sum(axis=(1, 2))
+        return ~unexposed & (flags == self._num_pokemon)
+
+    def check_loss(self):
+        """Checks which games have been lost: a pokemon is exposed.
+
+        Returns:
+            (np.ndarray): A boolean per board.
+        """
+        return (self._game == _POKEMON).any(axis=(1, 2))
+
+    def count_revealed(self):
+        """Counts the cells revealed with a number on each board.
+
+        Returns:
+            (np.ndarray): An int per board.
+        """
+        game = self._game
+        return ((game >= _DIGITS[0]) & (game <= _DIGITS[-1])).sum(axis=(1, 2))
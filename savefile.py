@@ -0,0 +1,226 @@
+"""Saving and loading games.
+
+Games are saved in a versioned binary format:
+
+    header   magic b'PKMS', format version, flags, grid size, pokemon count,
+             elapsed time (seconds), board seed and first click + 1 (0 for none),
+             little endian
+    cells    2 bits per cell, 4 cells per byte, lowest bits first:
+             0 unexposed, 1 flag, 2 revealed, 3 exposed pokemon
+    pokemons bitmap with 1 bit per cell, 8 cells per byte, lowest bit first, left out
+             when the board can be rebuilt from its board ID (see board_id)
+
+Revealed numbers are not stored, they are recomputed from the pokemons. Loading
+memory-maps the file and unpacks it with bytes.translate and big integer arithmetic, so
+nothing is parsed per cell in Python. Version 1 saves, which have no first click and
+always hold the pokemons, and games saved as text by older versions can still be loaded.
+"""
+import math
+import mmap
+import struct
+
+import board_id
+from board_model import BoardModel, _CELL_BYTES, _FLAG, _FROM_CELL_BYTES, _POKEMON, _UNEXPOSED
+
+MAGIC = b'PKMS'
+VERSION = 2
+HEADER = struct.Struct('<4sHHIIdQI')
+HEADERS = {1: struct.Struct('<4sHHIIdQ'), 2: HEADER}
+HAS_SEED = 1
+POKEMONS_FROM_ID = 2
+
+STATE_UNEXPOSED, STATE_FLAG, STATE_REVEALED, STATE_POKEMON = range(4)
+
+# Cell byte to its 2 bit state.
+_CELL_STATES = bytearray([STATE_REVEALED] * 256)
+_CELL_STATES[_UNEXPOSED] = STATE_UNEXPOSED
+_CELL_STATES[_FLAG] = STATE_FLAG
+_CELL_STATES[_POKEMON] = STATE_POKEMON
+_CELL_STATES = bytes(_CELL_STATES)
+
+# state << 4 | adjacent count to cell byte.
+_STATE_CELLS = bytearray([_UNEXPOSED] * 256)
+for _count in range(9):
+    _STATE_CELLS[STATE_UNEXPOSED << 4 | _count] = _UNEXPOSED
+    _STATE_CELLS[STATE_FLAG << 4 | _count] = _FLAG
+    _STATE_CELLS[STATE_REVEALED << 4 | _count] = _CELL_BYTES[str(_count)]
+    _STATE_CELLS[STATE_POKEMON << 4 | _count] = _POKEMON
+_STATE_CELLS = bytes(_STATE_CELLS)
+
+# One table per field of a packed byte, mapping the byte to that field's value.
+_TWO_BIT_FIELDS = [bytes((byte >> shift) & 3 for byte in range(256)) for shift in (0, 2, 4, 6)]
+_ONE_BIT_FIELDS = [bytes((byte >> shift) & 1 for byte in range(256)) for shift in range(8)]
+
+def _pack(values, bits):
+    """Packs small values into bytes, the first value in the lowest bits.
+
+    Parameters:
+        values (bytes): One value per byte, each below 2 ** bits.
+        bits (int): Bits per value, 1 or 2.
+
+    Returns:
+        (bytes): Packed values.
+    """
+    per_byte = 8 // bits
+    length = -(-len(values) // per_byte)
+    values = bytes(values) + bytes(length * per_byte - len(values))
+    packed = 0
+    # Each field only uses bits of its own byte, so shifting the whole board as one
+    # integer never carries into the next byte.
+    for field in range(per_byte):
+        packed |= int.from_bytes(values[field::per_byte], 'little') << (field * bits)
+    return packed.to_bytes(length, 'little')
+
+def _unpack(packed, bits, count):
+    """Reverses _pack.
+
+    Returns:
+        (bytearray): count values, one per byte.
+    """
+    per_byte = 8 // bits
+    tables = _TWO_BIT_FIELDS if bits == 2 else _ONE_BIT_FIELDS
+    values = bytearray(len(packed) * per_byte)
+    for field in range(per_byte):
+        values[field::per_byte] = packed.translate(tables[field])
+    del values[count:]
+    return values
+
+def pack_cells(model):
+    """Packs the state of every cell of a game at 2 bits per cell.
+
+    Parameters:
+        model (BoardModel): Game to pack.
+
+    Returns:
+        (bytes): Packed cell states.
+    """
+    return _pack(bytes(model._game).translate(_CELL_STATES), 2)
+
+def pack_pokemons(model):
+    """Packs the pokemon locations of a game as a bitmap.
+
+    Parameters:
+        model (BoardModel): Game to pack.
+
+    Returns:
+        (bytes): Packed bitmap.
+    """
+    return _pack(model._pokemons, 1)
+
+def unpack_pokemons(packed, cell_count):
+    """Reverses pack_pokemons.
+
+    Parameters:
+        packed (bytes): Packed bitmap.
+        cell_count (int): Number of cells on the board.
+
+    Returns:
+        (list<int>): Indexes of the pokemons.
+    """
+    pokemons = _unpack(packed, 1, cell_count)
+    pokemon_locations = []
+    index = pokemons.find(1)
+    while index != -1:
+        pokemon_locations.append(index)
+        index = pokemons.find(1, index + 1)
+    return pokemon_locations
+
+def restore_cells(model, packed):
+    """Sets every cell of a game from states packed by pack_cells. Revealed cells get their
+    numbers from the game's pokemons.
+
+    Parameters:
+        model (BoardModel): Game to update, with its pokemons already placed.
+        packed (bytes): Packed cell states.
+    """
+    cell_count = model.get_grid_size() ** 2
+    states = _unpack(packed, 2, cell_count)
+    # Revealed cells show their adjacent count: combine state and count into one byte
+    # per cell (state << 4 | count, never carrying across bytes) and map it to the cell.
+    combined = int.from_bytes(states, 'little') << 4 | int.from_bytes(model._adjacent, 'little')
+    cells = combined.to_bytes(cell_count, 'little').translate(_STATE_CELLS)
+    model.set_game(cells.decode('ascii').translate(_FROM_CELL_BYTES))
+
+def save_game(path, model, elapsed):
+    """Saves a game in the binary format.
+
+    Parameters:
+        path (str): File to write.
+        model (BoardModel): Game to save.
+        elapsed (float): Seconds the game has been going for.
+    """
+    grid_size = model.get_grid_size()
+    seed = model.get_seed()
+    first_click = model.get_first_click()
+    board = board_id.of_model(model)
+    flags = (HAS_SEED if seed is not None else 0) | (POKEMONS_FROM_ID if board is not None else 0)
+    header = HEADER.pack(MAGIC, VERSION, flags, grid_size, model.get_num_pokemon(), elapsed,
+                         seed if seed is not None else 0, 0 if first_click is None else first_click + 1)
+    with open(path, 'wb') as file:
+        file.write(header)
+        file.write(pack_cells(model))
+        if board is None:
+            file.write(pack_pokemons(model))
+
+def load_game(path):
+    """Loads a game saved in the binary format or the old text format.
+
+    Parameters:
+        path (str): File to read.
+
+    Returns:
+        (BoardModel, float): The game and the seconds it had been going for.
+    """
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            return load_text_game(path)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            version = struct.unpack_from('<H', data, len(MAGIC))[0]
+            header = HEADERS.get(version)
+            if header is None:
+                raise ValueError(f"Unsupported save format version {version}")
+            magic, version, flags, grid_size, num_pokemon, elapsed, seed, *first_click = header.unpack_from(data)
+            first_click = first_click[0] - 1 if first_click and first_click[0] else None
+            cell_count = grid_size ** 2
+            cells_start = header.size
+            pokemons_start = cells_start + -(-cell_count // 4)
+            pokemons_end = pokemons_start if flags & POKEMONS_FROM_ID else pokemons_start + -(-cell_count // 8)
+            if len(data) < pokemons_end:
+                raise ValueError("Save file is truncated")
+            cells = data[cells_start:pokemons_start]
+            if flags & POKEMONS_FROM_ID:
+                pokemon_locations = board_id.pokemon_locations(
+                    board_id.BoardId(grid_size, num_pokemon, seed, first_click))
+            else:
+                pokemon_locations = unpack_pokemons(data[pokemons_start:pokemons_end], cell_count)
+
+    if len(pokemon_locations) != num_pokemon:
+        raise ValueError("Save file is corrupt: pokemon count does not match")
+    model = BoardModel(grid_size, num_pokemon, pokemon_locations=())
+    model.set_pokemon_locations(pokemon_locations, seed if flags & HAS_SEED else None, first_click,
+                                seeded=bool(flags & POKEMONS_FROM_ID))
+    restore_cells(model, cells)
+    return model, elapsed
+
+def load_text_game(path):
+    """Loads a game saved as text by older versions: the game string directly followed by
+    the elapsed time on the first line, and comma separated pokemon indexes on the second.
+
+    Parameters:
+        path (str): File to read.
+
+    Returns:
+        (BoardModel, float): The game and the seconds it had been going for.
+    """
+    with open(path, 'r', encoding='utf-8') as saved_game:
+        line = saved_game.readlines()
+
+    pokemon_locations = tuple(map(int, line[1].split(','))) if line[1:] and line[1].strip() else ()
+    first_line = line[0].rstrip('\n')
+    grid_size = math.floor(math.sqrt(len(first_line)))
+    game_string = first_line[:grid_size ** 2]
+    elapsed = int(first_line[grid_size ** 2:])
+
+    model = BoardModel(grid_size, len(pokemon_locations), pokemon_locations=pokemon_locations)
+    model.set_game(game_string)
+    return model, elapsed
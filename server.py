@@ -0,0 +1,275 @@
+"""Asyncio game server hosting many BoardModel sessions over a local socket.
+
+Clients send one JSON object per line and get one JSON object per line back, in order.
+Every request has a "cmd" and may have an "id", which is echoed in its response.
+
+    {"cmd": "create", "grid_size": 10, "num_pokemon": 15, "seed": 1}
+    {"cmd": "create", "board_id": "aefa6-bzyvu"}
+        -> {"ok": true, "session": "...", "grid_size": 10, "num_pokemon": 15, "seed": 1,
+            "board_id": "..."}
+    {"cmd": "reveal", "session": "...", "index": 55}
+    {"cmd": "flag", "session": "...", "index": 3}
+        -> {"ok": true, "cells": [[index, character], ...], "won": false, "lost": false}
+    {"cmd": "diff", "session": "..."}
+        -> the cells changed since the last diff or state, same shape as a move
+    {"cmd": "state", "session": "..."}
+        -> every cell that is not unexposed, plus the cell counts
+    {"cmd": "close", "session": "..."}
+    {"cmd": "stats"}
+
+Cells are sent as [index, character] pairs, never as whole game strings. Errors are
+answered with {"ok": false, "error": "..."}. Sessions idle for longer than the idle timeout
+are evicted, as are the least recently used ones past the session limit.
+
+Usage:
+    python server.py --port 8765
+    python server.py --unix /tmp/pokemon.sock
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+
+import board_id
+from board_model import BoardModel, REVEAL, FLAG_MOVE, UNEXPOSED, check_seed
+
+MAX_LINE = 64 * 1024
+MAX_GRID_SIZE = 1000
+
+class Session:
+    """One game hosted by the server."""
+
+    def __init__(self, model):
+        """Construct a session.
+
+        Parameters:
+            model (BoardModel): Game of the session.
+        """
+        self.model = model
+        self.last_used = time.monotonic()
+
+class GameServer:
+    """Sessions and the commands run on them."""
+
+    def __init__(self, idle_timeout=300.0, max_sessions=100000):
+        """Construct a server with no sessions.
+
+        Parameters:
+            idle_timeout (float): Seconds a session may go unused before it is evicted.
+            max_sessions (int): Sessions kept before the least recently used are evicted.
+        """
+        self._idle_timeout = idle_timeout
+        self._max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._requests = 0
+        self._evicted = 0
+        self._commands = {
+            'create': self.create,
+            'reveal': self.reveal,
+            'flag': self.flag,
+            'diff': self.diff,
+            'state': self.state,
+            'close': self.close,
+            'stats': self.stats,
+        }
+
+    def _session(self, request):
+        """Finds the session of a request and marks it used."""
+        key = request.get('session')
+        session = self._sessions.get(key)
+        if session is None:
+            raise LookupError(f"No session {key!r}")
+        session.last_used = time.monotonic()
+        self._sessions.move_to_end(key)
+        return session
+
+    def _integer(self, request, name, default=None):
+        """Reads an integer field of a request, rejecting strings, floats and booleans
+        before they reach the model."""
+        value = request.get(name, default)
+        if value is not default and (not isinstance(value, int) or isinstance(value, bool)):
+            raise ValueError(f"{name} must be an integer")
+        return value
+
+    def _cells(self, model, indexes):
+        """Lists cells as [index, character] pairs, in index order."""
+        return [[index, model.get_cell(index)] for index in sorted(indexes)]
+
+    def create(self, request):
+        """Starts a new session, on the board of a board ID if one is given. The session is
+        only stored once its whole response is built, so a bad request leaves none behind."""
+        board = board_id.decode(request['board_id']) if 'board_id' in request else None
+        grid_size = board.grid_size if board else self._integer(request, 'grid_size', 10)
+        num_pokemon = board.num_pokemon if board else self._integer(request, 'num_pokemon', 15)
+        seed = self._integer(request, 'seed')
+        check_seed(seed)
+        if not 0 < grid_size <= MAX_GRID_SIZE or not 0 <= num_pokemon < grid_size ** 2:
+            raise ValueError("Invalid grid size or pokemon count")
+        model = board_id.new_model(board) if board else BoardModel(grid_size, num_pokemon, seed=seed)
+        model.drain_dirty()
+        board = board_id.of_model(model)
+        key = uuid.uuid4().hex
+        response = {'session': key, 'grid_size': grid_size, 'num_pokemon': num_pokemon, 'seed': model.get_seed(),
+                    'board_id': board_id.encode(board) if board else None}
+        self._sessions[key] = Session(model)
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+            self._evicted += 1
+        return response
+
+    def _move(self, request, action):
+        """Plays a move and answers with the cells it changed."""
+        model = self._session(request).model
+        index = self._integer(request, 'index')
+        if index is None:
+            raise ValueError("index is required")
+        if not 0 <= index < model.get_grid_size() ** 2:
+            raise ValueError(f"Index {index} is off the board")
+        result = model.apply_moves([(action, index)])
+        return {'cells': self._cells(model, result.changed), 'won': result.won, 'lost': result.lost}
+
+    def reveal(self, request):
+        """Reveals a cell."""
+        return self._move(request, REVEAL)
+
+    def flag(self, request):
+        """Toggles a flag."""
+        return self._move(request, FLAG_MOVE)
+
+    def diff(self, request):
+        """Answers with the cells changed since the last diff or state."""
+        model = self._session(request).model
+        return {'cells': self._cells(model, model.drain_dirty()), 'won': model.check_win(),
+                'lost': model.check_loss()}
+
+    def state(self, request):
+        """Answers with every cell that is not unexposed."""
+        model = self._session(request).model
+        model.drain_dirty()
+        game = model.get_game()
+        cells = [[index, character] for index, character in enumerate(game) if character != UNEXPOSED]
+        return {'cells': cells, 'won': model.check_win(), 'lost': model.check_loss(),
+                'grid_size': model.get_grid_size(), 'num_pokemon': model.get_num_pokemon(),
+                'flags': model.get_num_attempted_catches(), 'unexposed': model.get_num_unexposed()}
+
+    def close(self, request):
+        """Ends a session."""
+        self._session(request)
+        del self._sessions[request['session']]
+        return {}
+
+    def stats(self, request):
+        """Answers with the server's counters."""
+        return {'sessions': len(self._sessions), 'requests': self._requests, 'evicted': self._evicted}
+
+    def evict_idle(self):
+        """Evicts the sessions idle for longer than the idle timeout.
+
+        Returns:
+            (int): Number of sessions evicted.
+        """
+        cutoff = time.monotonic() - self._idle_timeout
+        evicted = 0
+        # Sessions are kept in order of use, so the idle ones are at the front.
+        while self._sessions:
+            key, session = next(iter(self._sessions.items()))
+            if session.last_used > cutoff:
+                break
+            del self._sessions[key]
+            evicted += 1
+        self._evicted += evicted
+        return evicted
+
+    def handle(self, line):
+        """Runs one request line.
+
+        Parameters:
+            line (bytes): A JSON request.
+
+        Returns:
+            (dict): The response.
+        """
+        self._requests += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            command = self._commands.get(request.get('cmd'))
+            if command is None:
+                raise ValueError(f"Unknown command {request.get('cmd')!r}")
+            response = command(request)
+            response['ok'] = True
+        except (LookupError, ValueError, TypeError, AttributeError, OverflowError) as e:
+            response = {'ok': False, 'error': str(e) or type(e).__name__}
+        if request_id is not None:
+            response['id'] = request_id
+        return response
+
+    async def serve_client(self, reader, writer):
+        """Answers the requests of one connection until it closes."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b'{"ok": false, "error": "Request too long"}\n')
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(json.dumps(self.handle(line), separators=(',', ':')).encode() + b'\n')
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def evict_forever(self, interval):
+        """Evicts idle sessions every interval seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+async def start_server(game_server, host='127.0.0.1', port=8765, unix_path=None):
+    """Starts listening on a TCP port, or a Unix socket if a path is given.
+
+    Returns:
+        (asyncio.Server): The listening server.
+    """
+    if unix_path is not None:
+        if os.path.exists(unix_path):
+            os.unlink(unix_path)
+        return await asyncio.start_unix_server(game_server.serve_client, unix_path, limit=MAX_LINE)
+    return await asyncio.start_server(game_server.serve_client, host, port, limit=MAX_LINE)
+
+async def run(host, port, unix_path, idle_timeout, max_sessions):
+    """Runs the server until it is interrupted."""
+    game_server = GameServer(idle_timeout, max_sessions)
+    server = await start_server(game_server, host, port, unix_path)
+    evictor = asyncio.ensure_future(game_server.evict_forever(min(idle_timeout, 30.0)))
+    print("Serving on", unix_path or f"{host}:{port}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        evictor.cancel()
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Host pokemon games over a local socket.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="Unix socket path to listen on instead of TCP")
+    parser.add_argument('--idle-timeout', type=float, default=300.0)
+    parser.add_argument('--max-sessions', type=int, default=100000)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(run(args.host, args.port, args.unix, args.idle_timeout, args.max_sessions))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
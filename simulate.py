@@ -0,0 +1,197 @@
+"""Headless batch simulation of pokemon games. Games are built from seeds, played by a move
+policy and spread over a process pool; aggregate results are streamed as chunks of games
+finish. Only the board model is imported, never tkinter or PIL.
+
+Usage:
+    python simulate.py --grid-size 10 --pokemons 15 --games 10000 --workers 4
+"""
+import argparse
+import json
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import solver
+from board_model import BoardModel, UNEXPOSED, REVEAL, FLAG_MOVE
+
+GameResult = namedtuple('GameResult', ('seed', 'won', 'moves', 'revealed', 'elapsed'))
+
+def random_policy(model, rng):
+    """Reveals a random unexposed cell. Once every unexposed cell left must be a pokemon,
+    they are flagged instead.
+
+    Parameters:
+        model (BoardModel): Game being played.
+        rng (random.Random): Random number generator of the game.
+
+    Returns:
+        (tuple<str, int>): Action and index of the next move, None if there is no move.
+    """
+    cell_count = model.get_grid_size() ** 2
+    unflagged = model.get_num_pokemon() - model.get_num_attempted_catches()
+    flagging = model.get_num_unexposed() <= unflagged
+    # Random picks find an unexposed cell quickly until the board is nearly cleared,
+    # after which the remaining cells are listed.
+    for _ in range(32):
+        index = rng.randrange(cell_count)
+        if model.get_cell(index) == UNEXPOSED:
+            break
+    else:
+        game = model.get_game()
+        unexposed = [index for index in range(cell_count) if game[index] == UNEXPOSED]
+        if not unexposed:
+            return None
+        index = rng.choice(unexposed)
+    return (FLAG_MOVE if flagging else REVEAL, index)
+
+def solver_policy(model, rng):
+    """Plays the solver's hint: a safe cell, else a certain pokemon, else the safest guess.
+
+    Parameters:
+        model (BoardModel): Game being played.
+        rng (random.Random): Unused, the solver is deterministic.
+
+    Returns:
+        (tuple<str, int>): Action and index of the next move, None if there is no move.
+    """
+    move = solver.hint(model.get_game(), model.get_grid_size(), model.get_num_pokemon())
+    return None if move is None else move[:2]
+
+POLICIES = {'random': random_policy, 'solver': solver_policy}
+
+def play_game(grid_size, num_pokemon, seed, policy, max_moves=None):
+    """Plays one game to a win or loss.
+
+    Parameters:
+        grid_size (int): Size of grid.
+        num_pokemon (int): Number of pokemons in game.
+        seed (int): Seed of the board and of the policy's random choices.
+        policy (callable): Takes the model and a random.Random, returns (action, index).
+        max_moves (int): Gives up after this many moves, unlimited if None.
+
+    Returns:
+        (GameResult): Outcome of the game.
+    """
+    start = time.perf_counter()
+    model = BoardModel(grid_size, num_pokemon, seed=seed)
+    # Seeded apart from the board so the policy's picks don't follow the pokemon placement.
+    rng = random.Random(f"{seed}:policy")
+    moves = 0
+    while not (model.check_win() or model.check_loss()):
+        if max_moves is not None and moves >= max_moves:
+            break
+        move = policy(model, rng)
+        if move is None:
+            break
+        model.apply_move(*move)
+        moves += 1
+    return GameResult(seed, model.check_win(), moves, model.get_num_revealed(), time.perf_counter() - start)
+
+def play_chunk(grid_size, num_pokemon, seeds, policy_name, max_moves=None):
+    """Plays a chunk of games, the unit of work sent to each worker process.
+
+    Returns:
+        (list<GameResult>): Outcome of each game.
+    """
+    policy = POLICIES[policy_name]
+    return [play_game(grid_size, num_pokemon, seed, policy, max_moves) for seed in seeds]
+
+class BatchStats:
+    """Running totals over the games of a batch."""
+
+    def __init__(self):
+        """Construct empty totals."""
+        self.games = 0
+        self.wins = 0
+        self.moves = 0
+        self.revealed = 0
+        self.play_time = 0.0
+        self.start = time.perf_counter()
+
+    def add(self, results):
+        """Adds the results of finished games.
+
+        Parameters:
+            results (list<GameResult>): Finished games.
+        """
+        for result in results:
+            self.games += 1
+            self.wins += result.won
+            self.moves += result.moves
+            self.revealed += result.revealed
+            self.play_time += result.elapsed
+
+    def as_dict(self):
+        """Returns the totals and rates so far.
+
+        Returns:
+            (dict): Games, win rate, mean moves and cells revealed per second of play time
+            and of wall time.
+        """
+        wall_time = time.perf_counter() - self.start
+        return {
+            'games': self.games,
+            'wins': self.wins,
+            'win_rate': self.wins / self.games if self.games else 0.0,
+            'mean_moves': self.moves / self.games if self.games else 0.0,
+            'cells_revealed': self.revealed,
+            'revealed_per_second': self.revealed / self.play_time if self.play_time else 0.0,
+            'wall_time': wall_time,
+            'wall_revealed_per_second': self.revealed / wall_time if wall_time else 0.0,
+        }
+
+def run_batch(grid_size, num_pokemon, seeds, policy='random', workers=None, chunk_size=64, max_moves=None):
+    """Plays a game for every seed and yields the running totals each time a chunk finishes.
+
+    Parameters:
+        grid_size (int): Size of grid.
+        num_pokemon (int): Number of pokemons in each game.
+        seeds (iterable<int>): Seed of each game.
+        policy (str): Name of the move policy in POLICIES.
+        workers (int): Worker processes, os.cpu_count() if None. 1 plays in this process.
+        chunk_size (int): Games per unit of work.
+        max_moves (int): Move limit per game, unlimited if None.
+
+    Yields:
+        (BatchStats): Totals over the chunks finished so far.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}, expected one of {', '.join(POLICIES)}")
+    seeds = list(seeds)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    stats = BatchStats()
+    if workers == 1:
+        for chunk in chunks:
+            stats.add(play_chunk(grid_size, num_pokemon, chunk, policy, max_moves))
+            yield stats
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(play_chunk, grid_size, num_pokemon, chunk, policy, max_moves)
+                   for chunk in chunks]
+        for future in as_completed(futures):
+            stats.add(future.result())
+            yield stats
+
+def main(argv=None):
+    """Command line entry point, prints the running totals as one JSON object per line."""
+    parser = argparse.ArgumentParser(description="Play pokemon games headless.")
+    parser.add_argument('--grid-size', type=int, default=10)
+    parser.add_argument('--pokemons', type=int, default=15)
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game, the rest follow on")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='random')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk-size', type=int, default=64)
+    parser.add_argument('--max-moves', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    seeds = range(args.seed, args.seed + args.games)
+    for stats in run_batch(args.grid_size, args.pokemons, seeds, args.policy, args.workers,
+                           args.chunk_size, args.max_moves):
+        print(json.dumps(stats.as_dict()), flush=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+"""Constraint-propagation solver and hint engine working from the numbers revealed in a game
+string (BoardModel.get_game()).
+
+Every revealed number is a constraint: its unknown neighbours hold exactly that many
+pokemons. Cheap rules are applied first (a satisfied number clears its other neighbours,
+a number with as many unknown neighbours as pokemons marks them all, and a constraint
+contained in another splits it). Whatever is left is partitioned into independent groups
+of constraints sharing cells, and each group is solved by exact enumeration. Group
+solutions are memoized, as a click usually leaves most groups unchanged, and enumeration
+stops at a time budget so the solver can run after every click. Flags are the player's
+guesses, so they are treated as unknown cells.
+"""
+import math
+import time
+from collections import OrderedDict
+
+from board_model import FLAG, POKEMON, UNEXPOSED, REVEAL, FLAG_MOVE, neighbour_indexes
+
+# Groups with more cells than this are not enumerated, their probabilities are estimated.
+MAX_ENUMERATION_CELLS = 48
+_CACHE_SIZE = 4096
+_group_cache = OrderedDict()
+
+class OutOfTime(Exception):
+    """Raised when an enumeration runs past the solver's time budget."""
+
+class Solution:
+    """What the solver worked out about the unknown cells of a game."""
+
+    def __init__(self, safe, mines, probabilities, complete):
+        """Construct a solution.
+
+        Parameters:
+            safe (set<int>): Indexes of cells that cannot hold a pokemon.
+            mines (set<int>): Indexes of cells that must hold a pokemon.
+            probabilities (dict<int, float>): Chance of a pokemon in each unknown cell.
+            complete (bool): False if some groups were estimated instead of enumerated.
+        """
+        self.safe = safe
+        self.mines = mines
+        self.probabilities = probabilities
+        self.complete = complete
+
+def _constraints_from_game(game, grid_size):
+    """Reads the constraints given by the revealed numbers.
+
+    Returns:
+        (dict<frozenset<int>, int>, int): Unknown cells next to each number and how many
+        pokemons they hold, and the number of exposed pokemons.
+    """
+    constraints = {}
+    exposed = 0
+    for index, character in enumerate(game):
+        if character == UNEXPOSED or character == FLAG:
+            continue
+        if character == POKEMON:
+            exposed += 1
+            continue
+        count = int(character)
+        cells = []
+        for neighbour in neighbour_indexes(index, grid_size):
+            neighbour_character = game[neighbour]
+            if neighbour_character == UNEXPOSED or neighbour_character == FLAG:
+                cells.append(neighbour)
+            elif neighbour_character == POKEMON:
+                count -= 1
+        if cells:
+            constraints[frozenset(cells)] = count
+    return constraints, exposed
+
+def _reduce(constraints, known):
+    """Removes the known cells from every constraint.
+
+    Returns:
+        (dict<frozenset<int>, int>): Constraints on the cells still unknown.
+    """
+    reduced = {}
+    for cells, count in constraints.items():
+        remaining = [cell for cell in cells if cell not in known]
+        if len(remaining) != len(cells):
+            count -= sum(known[cell] for cell in cells if cell in known)
+            cells = frozenset(remaining)
+        if cells:
+            reduced[cells] = count
+    return reduced
+
+def _propagate(constraints, known, deadline):
+    """Applies the single constraint and subset rules until neither finds anything new.
+
+    Parameters:
+        constraints (dict<frozenset<int>, int>): Constraints, reduced by known cells.
+        known (dict<int, int>): Cells worked out so far, 1 for a pokemon and 0 for safe.
+            Updated in place.
+        deadline (float): perf_counter time to stop at.
+
+    Returns:
+        (dict<frozenset<int>, int>): The constraints left.
+    """
+    while constraints and time.perf_counter() < deadline:
+        found = False
+        for cells, count in constraints.items():
+            if count <= 0 or count >= len(cells):
+                value = 1 if count > 0 else 0
+                for cell in cells:
+                    known[cell] = value
+                found = True
+        if found:
+            constraints = _reduce(constraints, known)
+            continue
+
+        by_cell = {}
+        for cells in constraints:
+            for cell in cells:
+                by_cell.setdefault(cell, []).append(cells)
+        derived = {}
+        for smaller, smaller_count in constraints.items():
+            for larger in by_cell[next(iter(smaller))]:
+                if len(larger) > len(smaller) and smaller < larger:
+                    difference = larger - smaller
+                    if difference not in constraints:
+                        derived[difference] = constraints[larger] - smaller_count
+        if not derived:
+            break
+        constraints.update(derived)
+    return constraints
+
+def _groups(constraints):
+    """Partitions constraints into groups that share no cells.
+
+    Returns:
+        (list<list<tuple<frozenset<int>, int>>>): Constraints of each group.
+    """
+    parent = {}
+
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    for cells in constraints:
+        first = None
+        for cell in cells:
+            parent.setdefault(cell, cell)
+            if first is None:
+                first = find(cell)
+            else:
+                root = find(cell)
+                if root != first:
+                    parent[root] = first
+    groups = {}
+    for cells, count in constraints.items():
+        groups.setdefault(find(next(iter(cells))), []).append((cells, count))
+    return list(groups.values())
+
+def _enumerate(group, deadline):
+    """Counts every assignment of pokemons to the cells of a group that satisfies all its
+    constraints, by backtracking. Results are memoized by the group's constraints.
+
+    Returns:
+        (tuple<int>, dict<int, list>): The group's cells, and for each total number of
+        pokemons the number of solutions and how many of them put a pokemon in each cell.
+    """
+    key = frozenset(group)
+    cached = _group_cache.get(key)
+    if cached is not None:
+        _group_cache.move_to_end(key)
+        return cached
+
+    cells = []
+    position = {}
+    for constraint_cells, _ in group:
+        for cell in sorted(constraint_cells):
+            if cell not in position:
+                position[cell] = len(cells)
+                cells.append(cell)
+    cell_constraints = [[] for _ in cells]
+    need = []
+    left = []
+    for number, (constraint_cells, count) in enumerate(group):
+        need.append(count)
+        left.append(len(constraint_cells))
+        for cell in constraint_cells:
+            cell_constraints[position[cell]].append(number)
+
+    size = len(cells)
+    assignment = [0] * size
+    solutions = {}
+    nodes = [0]
+
+    def assign(i, mines):
+        if i == size:
+            entry = solutions.get(mines)
+            if entry is None:
+                entry = solutions[mines] = [0, [0] * size]
+            entry[0] += 1
+            per_cell = entry[1]
+            for j in range(size):
+                per_cell[j] += assignment[j]
+            return
+        nodes[0] += 1
+        if nodes[0] & 1023 == 0 and time.perf_counter() > deadline:
+            raise OutOfTime()
+        for value in (0, 1):
+            for number in cell_constraints[i]:
+                remaining = need[number] - value
+                if remaining < 0 or remaining > left[number] - 1:
+                    break
+            else:
+                for number in cell_constraints[i]:
+                    need[number] -= value
+                    left[number] -= 1
+                assignment[i] = value
+                assign(i + 1, mines + value)
+                for number in cell_constraints[i]:
+                    need[number] += value
+                    left[number] += 1
+        assignment[i] = 0
+
+    assign(0, 0)
+    result = (tuple(cells), solutions)
+    _group_cache[key] = result
+    if len(_group_cache) > _CACHE_SIZE:
+        _group_cache.popitem(last=False)
+    return result
+
+def _convolve(first, second):
+    """Combines two {pokemons: ways} distributions of independent groups."""
+    combined = {}
+    for first_mines, first_ways in first.items():
+        for second_mines, second_ways in second.items():
+            mines = first_mines + second_mines
+            combined[mines] = combined.get(mines, 0) + first_ways * second_ways
+    return combined
+
+def solve(game, grid_size, num_pokemon, time_budget=0.05):
+    """Works out the safe cells, certain pokemons and pokemon probabilities of a game.
+
+    Parameters:
+        game (str): Game string, as returned by BoardModel.get_game().
+        grid_size (int): Size of grid.
+        num_pokemon (int): Number of pokemons in game.
+        time_budget (float): Seconds to spend before falling back to estimates.
+
+    Returns:
+        (Solution): What is known about the unknown cells.
+    """
+    deadline = time.perf_counter() + time_budget
+    constraints, exposed = _constraints_from_game(game, grid_size)
+    known = {}
+    constraints = _propagate(constraints, known, deadline)
+
+    complete = True
+    enumerated = []
+    estimates = {}
+    for group in _groups(constraints):
+        group_cells = set().union(*(cells for cells, _ in group))
+        result = None
+        if len(group_cells) <= MAX_ENUMERATION_CELLS:
+            try:
+                result = _enumerate(group, deadline)
+            except OutOfTime:
+                pass
+        if result is None or not result[1]:
+            # Too big, out of time or contradictory: estimate each cell from the
+            # density of the constraints on it.
+            complete = False
+            densities = {}
+            for cells, count in group:
+                for cell in cells:
+                    densities.setdefault(cell, []).append(min(max(count / len(cells), 0.0), 1.0))
+            for cell, values in densities.items():
+                estimates[cell] = sum(values) / len(values)
+        else:
+            enumerated.append(result)
+
+    unknown = [index for index, character in enumerate(game) if character == UNEXPOSED or character == FLAG]
+    constrained = set(known).union(estimates, *(cells for cells, _ in enumerated))
+    free_cells = [index for index in unknown if index not in constrained]
+    free = len(free_cells)
+    mines_left = num_pokemon - exposed - sum(known.values()) - round(sum(estimates.values()))
+
+    def weight(group_mines):
+        # Ways to place the pokemons not in groups among the unconstrained cells.
+        rest = mines_left - group_mines
+        return math.comb(free, rest) if 0 <= rest <= free else 0
+
+    distributions = [{mines: entry[0] for mines, entry in solutions.items()} for _, solutions in enumerated]
+    prefix = [{0: 1}]
+    for distribution in distributions:
+        prefix.append(_convolve(prefix[-1], distribution))
+    suffix = [{0: 1}]
+    for distribution in reversed(distributions):
+        suffix.append(_convolve(suffix[-1], distribution))
+    suffix.reverse()
+
+    total = sum(ways * weight(mines) for mines, ways in prefix[-1].items())
+    if total == 0:
+        # The pokemon count can't be met (e.g. a hand edited save), ignore it.
+        complete = False
+        weight = lambda group_mines: 1
+        total = sum(prefix[-1].values())
+
+    probabilities = dict(estimates)
+    safe = {cell for cell, value in known.items() if value == 0}
+    mines = {cell for cell, value in known.items() if value == 1}
+    for cell in known:
+        probabilities[cell] = float(known[cell])
+    for number, (cells, solutions) in enumerate(enumerated):
+        others = _convolve(prefix[number], suffix[number + 1])
+        numerators = [0] * len(cells)
+        for group_mines, (_, per_cell) in solutions.items():
+            ways = sum(other_ways * weight(group_mines + other_mines) for other_mines, other_ways in others.items())
+            if ways:
+                for j, count in enumerate(per_cell):
+                    numerators[j] += count * ways
+        for cell, numerator in zip(cells, numerators):
+            probabilities[cell] = numerator / total
+            if numerator == 0:
+                safe.add(cell)
+            elif numerator == total:
+                mines.add(cell)
+
+    if free:
+        numerator = sum(ways * weight(group_mines) * (mines_left - group_mines)
+                        for group_mines, ways in prefix[-1].items())
+        probability = numerator / (total * free)
+        for cell in free_cells:
+            probabilities[cell] = probability
+        if complete and numerator == 0:
+            safe.update(free_cells)
+        elif complete and numerator == total * free:
+            mines.update(free_cells)
+    return Solution(safe, mines, probabilities, complete)
+
+def hint(game, grid_size, num_pokemon, time_budget=0.05):
+    """Picks the best next move: reveal a safe cell, else flag a certain pokemon, else
+    reveal the unknown cell least likely to hold a pokemon.
+
+    Parameters:
+        game (str): Game string, as returned by BoardModel.get_game().
+        grid_size (int): Size of grid.
+        num_pokemon (int): Number of pokemons in game.
+        time_budget (float): Seconds the solver may spend.
+
+    Returns:
+        (tuple<str, int, float>): Action (REVEAL or FLAG_MOVE), index and the chance of a
+        pokemon there, None if no cell is left to play.
+    """
+    solution = solve(game, grid_size, num_pokemon, time_budget)
+    safe = [cell for cell in solution.safe if game[cell] == UNEXPOSED]
+    if safe:
+        return (REVEAL, min(safe), 0.0)
+    mines = [cell for cell in solution.mines if game[cell] == UNEXPOSED]
+    if mines:
+        return (FLAG_MOVE, min(mines), 1.0)
+    guesses = [(probability, cell) for cell, probability in solution.probabilities.items()
+               if game[cell] == UNEXPOSED]
+    if not guesses:
+        return None
+    probability, cell = min(guesses)
+    return (REVEAL, cell, probability)
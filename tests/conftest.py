@@ -0,0 +1,5 @@
+"""Puts the repository root, where the game modules live, on the import path."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
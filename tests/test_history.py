@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+import history
+from board_model import BoardModel, REVEAL, FLAG_MOVE
+
+def play_random(hist, model, moves, seed=6):
+    """Plays random moves through a history.
+
+    Returns:
+        (list<str>): The game string after each move that changed the board.
+    """
+    rng = random.Random(seed)
+    games = []
+    for _ in range(moves):
+        index = rng.randrange(model.get_grid_size() ** 2)
+        action = FLAG_MOVE if model.is_pokemon(index) or rng.random() < 0.2 else REVEAL
+        if hist.play(action, index).changed:
+            games.append(model.get_game())
+    return games
+
+def test_undo_and_redo_walk_the_moves():
+    model = BoardModel(10, 15, seed=2)
+    hist = history.History(model)
+    start = model.get_game()
+    games = play_random(hist, model, 30)
+    assert hist.get_position() == len(games)
+    for game in reversed([start] + games[:-1]):
+        result = hist.undo()
+        assert model.get_game() == game
+        assert result.changed
+    assert not hist.can_undo() and hist.undo() is None
+    for game in games:
+        hist.redo()
+        assert model.get_game() == game
+    assert not hist.can_redo() and hist.redo() is None
+    assert model.check_counters()
+
+def test_moves_that_change_nothing_are_not_kept():
+    model = BoardModel(4, 1, pokemon_locations=(0,))
+    hist = history.History(model)
+    hist.play(REVEAL, 5)
+    assert not hist.play(REVEAL, 5).changed
+    assert hist.get_position() == 1
+
+def test_a_new_move_drops_the_redo_moves():
+    model = BoardModel(10, 15, seed=2)
+    hist = history.History(model)
+    play_random(hist, model, 10)
+    hist.undo()
+    hist.undo()
+    assert hist.can_redo()
+    play_random(hist, model, 5, seed=8)
+    assert not hist.can_redo()
+
+def test_play_moves_is_one_step():
+    model = BoardModel(5, 2, pokemon_locations=(0, 24))
+    hist = history.History(model)
+    start = model.get_game()
+    hist.play_moves([(FLAG_MOVE, 0), (FLAG_MOVE, 24), (REVEAL, 12)])
+    assert hist.get_position() == 1
+    hist.undo()
+    assert model.get_game() == start
+
+def test_branch_rebuilds_past_positions_without_touching_the_game():
+    model = BoardModel(10, 15, seed=2)
+    hist = history.History(model, snapshot_every=4)
+    start = model.get_game()
+    games = [start] + play_random(hist, model, 40)
+    for position, game in enumerate(games):
+        copy = hist.branch(position)
+        assert copy.get_game() == game
+        assert copy.check_counters()
+    copy = hist.branch()
+    copy.apply_move(FLAG_MOVE, 0)
+    assert model.get_game() == games[-1]
+    with pytest.raises(ValueError):
+        hist.branch(len(games))
+
+def test_limit_forgets_the_oldest_moves():
+    model = BoardModel(10, 15, seed=2)
+    hist = history.History(model, limit=5, snapshot_every=3)
+    games = play_random(hist, model, 40)
+    assert len(games) > 5
+    first = len(games) - 5
+    assert hist.branch(first).get_game() == games[first - 1]
+    with pytest.raises(ValueError):
+        hist.branch(first - 1)
+    for _ in range(5):
+        assert hist.undo() is not None
+    assert hist.undo() is None
+    assert model.get_game() == games[first - 1]
+
+def test_clear_starts_from_the_current_position():
+    model = BoardModel(10, 15, seed=2)
+    hist = history.History(model)
+    play_random(hist, model, 10)
+    hist.clear()
+    assert hist.get_position() == 0 and not hist.can_undo()
+    assert hist.branch(0).get_game() == model.get_game()
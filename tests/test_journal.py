@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+import journal
+from board_model import BoardModel, REVEAL, FLAG_MOVE
+
+def record_game(path, moves=40, checkpoint_every=8, flush_every=5, seed=4):
+    """Plays random moves while journaling them.
+
+    Returns:
+        (list<str>): The game string before any move and after each one.
+    """
+    model = BoardModel(12, 20, seed=seed)
+    writer = journal.JournalWriter(str(path), model, checkpoint_every, flush_every)
+    rng = random.Random(seed)
+    games = [model.get_game()]
+    for _ in range(moves):
+        action = FLAG_MOVE if rng.random() < 0.3 else REVEAL
+        index = rng.randrange(144)
+        if action == REVEAL and model.is_pokemon(index):
+            continue
+        model.apply_move(action, index)
+        writer.record(action, index)
+        games.append(model.get_game())
+    writer.close()
+    return games
+
+def test_board_at_rebuilds_every_position(tmp_path):
+    path = tmp_path / 'game.pkj'
+    games = record_game(path)
+    replay = journal.Replay(str(path))
+    assert len(replay) == len(games) - 1
+    for move, game in enumerate(games):
+        assert replay.board_at(move).get_game() == game
+    assert replay.board_at(len(games) + 10).get_game() == games[-1]
+
+def test_play_yields_each_move_from_a_start(tmp_path):
+    path = tmp_path / 'game.pkj'
+    games = record_game(path)
+    replay = journal.Replay(str(path))
+    played = [(model.get_game(), move[:2]) for model, move in replay.play(start=13)]
+    assert [game for game, _ in played] == games[14:]
+    assert [move for _, move in played] == [move[:2] for move in replay.moves[13:]]
+
+def test_partly_written_tail_is_ignored(tmp_path):
+    path = tmp_path / 'game.pkj'
+    games = record_game(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    replay = journal.Replay(str(path))
+    assert len(replay) == len(games) - 2
+    assert replay.board_at(len(replay)).get_game() == games[-2]
+
+def test_unflushed_moves_are_written_on_close(tmp_path):
+    path = tmp_path / 'game.pkj'
+    model = BoardModel(5, 3, pokemon_locations=(0, 1, 2))
+    writer = journal.JournalWriter(str(path), model, flush_every=100)
+    model.apply_move(FLAG_MOVE, 0)
+    writer.record(FLAG_MOVE, 0)
+    assert len(journal.Replay(str(path))) == 0
+    writer.close()
+    replay = journal.Replay(str(path))
+    assert [move[:2] for move in replay.moves] == [(FLAG_MOVE, 0)]
+    assert replay.board_at(0).get_pokemon_locations() == (0, 1, 2)
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / 'game.pkj'
+    record_game(path, moves=3)
+    data = path.read_bytes()
+    path.write_bytes(b'NOPE' + data[4:])
+    with pytest.raises(ValueError):
+        journal.Replay(str(path))
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+import savefile
+from board_model import BoardModel, REVEAL, FLAG_MOVE, UNEXPOSED
+
+def played_model(grid_size=9, num_pokemon=10, seed=3, moves=12, lose=False):
+    """A game with some cells revealed and flagged, lost if asked."""
+    model = BoardModel(grid_size, num_pokemon, seed=seed)
+    rng = random.Random(seed)
+    for _ in range(moves):
+        index = rng.randrange(grid_size ** 2)
+        if model.is_pokemon(index):
+            model.apply_move(FLAG_MOVE, index)
+        else:
+            model.apply_move(REVEAL, index)
+    if lose:
+        model.apply_move(REVEAL, model.get_pokemon_locations()[0])
+    return model
+
+def assert_same_game(loaded, model):
+    assert loaded.get_grid_size() == model.get_grid_size()
+    assert loaded.get_game() == model.get_game()
+    assert sorted(loaded.get_pokemon_locations()) == sorted(model.get_pokemon_locations())
+    assert loaded.get_seed() == model.get_seed()
+    assert loaded.get_first_click() == model.get_first_click()
+    assert loaded.check_counters()
+    assert loaded.get_num_attempted_catches() == model.get_num_attempted_catches()
+
+@pytest.mark.parametrize('lose', [False, True])
+@pytest.mark.parametrize('grid_size', [1, 7, 8, 30])
+def test_save_and_load_round_trip(tmp_path, grid_size, lose):
+    model = played_model(grid_size, max(1, grid_size ** 2 // 6), lose=lose)
+    path = str(tmp_path / 'game.pkm')
+    savefile.save_game(path, model, 42.5)
+    loaded, elapsed = savefile.load_game(path)
+    assert elapsed == 42.5
+    assert_same_game(loaded, model)
+    assert loaded.check_loss() == lose
+
+def test_locations_without_a_seed_are_stored(tmp_path):
+    model = BoardModel(6, 3, pokemon_locations=(0, 17, 35))
+    model.apply_move(REVEAL, 20)
+    path = str(tmp_path / 'game.pkm')
+    savefile.save_game(path, model, 0)
+    loaded, _ = savefile.load_game(path)
+    assert_same_game(loaded, model)
+    assert loaded.get_seed() is None
+
+def test_seeded_saves_leave_the_pokemons_out(tmp_path):
+    seeded = BoardModel(40, 200, seed=1)
+    placed = BoardModel(40, 200, pokemon_locations=seeded.get_pokemon_locations())
+    seeded_path, placed_path = tmp_path / 'seeded.pkm', tmp_path / 'placed.pkm'
+    savefile.save_game(str(seeded_path), seeded, 0)
+    savefile.save_game(str(placed_path), placed, 0)
+    assert placed_path.stat().st_size - seeded_path.stat().st_size == 40 ** 2 // 8
+
+def test_version_1_saves_still_load(tmp_path):
+    model = played_model()
+    header = savefile.HEADERS[1].pack(savefile.MAGIC, 1, savefile.HAS_SEED, model.get_grid_size(),
+                                      model.get_num_pokemon(), 5.0, model.get_seed())
+    path = tmp_path / 'old.pkm'
+    path.write_bytes(header + savefile.pack_cells(model) + savefile.pack_pokemons(model))
+    loaded, elapsed = savefile.load_game(str(path))
+    assert elapsed == 5.0
+    assert loaded.get_game() == model.get_game()
+    assert loaded.get_first_click() is None
+
+def test_text_saves_still_load(tmp_path):
+    model = BoardModel(3, 1, pokemon_locations=(4,))
+    model.apply_move(REVEAL, 0)
+    path = tmp_path / 'old.txt'
+    path.write_text(model.get_game() + '17\n4\n', encoding='utf-8')
+    loaded, elapsed = savefile.load_game(str(path))
+    assert elapsed == 17
+    assert loaded.get_game() == model.get_game()
+    assert loaded.get_pokemon_locations() == (4,)
+
+def test_truncated_and_unknown_saves_are_rejected(tmp_path):
+    model = BoardModel(20, 40, pokemon_locations=tuple(range(40)))
+    path = tmp_path / 'game.pkm'
+    savefile.save_game(str(path), model, 0)
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+    with pytest.raises(ValueError):
+        savefile.load_game(str(path))
+    path.write_bytes(data[:4] + b'\x63\x00' + data[6:])
+    with pytest.raises(ValueError):
+        savefile.load_game(str(path))
+
+def test_pack_and_unpack_pokemons():
+    model = BoardModel(13, 30, seed=9)
+    packed = savefile.pack_pokemons(model)
+    assert len(packed) == -(-13 ** 2 // 8)
+    assert savefile.unpack_pokemons(packed, 13 ** 2) == sorted(model.get_pokemon_locations())
+
+def test_restore_cells_onto_a_fresh_model():
+    model = played_model(lose=True)
+    fresh = BoardModel(model.get_grid_size(), model.get_num_pokemon(),
+                       pokemon_locations=model.get_pokemon_locations())
+    assert set(fresh.get_game()) == {UNEXPOSED}
+    savefile.restore_cells(fresh, savefile.pack_cells(model))
+    assert fresh.get_game() == model.get_game()
@@ -0,0 +1,78 @@
+import itertools
+import random
+from fractions import Fraction
+
+import pytest
+
+import solver
+from board_model import BoardModel, REVEAL, FLAG_MOVE, UNEXPOSED, FLAG, neighbour_indexes
+
+def brute_force(game, grid_size, num_pokemon):
+    """Chance of a pokemon in each unknown cell, over every placement the numbers allow."""
+    unknown = [index for index, character in enumerate(game) if character in (UNEXPOSED, FLAG)]
+    numbers = [(index, int(character)) for index, character in enumerate(game) if character.isdigit()]
+    counts = dict.fromkeys(unknown, 0)
+    total = 0
+    for pokemons in itertools.combinations(unknown, num_pokemon):
+        placed = set(pokemons)
+        if all(sum(neighbour in placed for neighbour in neighbour_indexes(index, grid_size)) == number
+               for index, number in numbers):
+            total += 1
+            for index in pokemons:
+                counts[index] += 1
+    return {index: Fraction(count, total) for index, count in counts.items()}
+
+def played_games(count, seed=1):
+    """Small games with a few safe cells revealed."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        grid_size = rng.choice((3, 4, 5))
+        num_pokemon = rng.randint(1, grid_size ** 2 // 3)
+        model = BoardModel(grid_size, num_pokemon, seed=rng.getrandbits(32))
+        for _ in range(rng.randint(1, 4)):
+            cells = [index for index in range(grid_size ** 2)
+                     if model.get_cell(index) == UNEXPOSED and not model.is_pokemon(index)]
+            if cells:
+                model.apply_move(REVEAL, rng.choice(cells))
+        if UNEXPOSED in model.get_game():
+            yield model
+
+@pytest.mark.parametrize('model', list(played_games(60)), ids=lambda model: model.get_game())
+def test_solve_matches_brute_force(model):
+    game, grid_size, num_pokemon = model.get_game(), model.get_grid_size(), model.get_num_pokemon()
+    expected = brute_force(game, grid_size, num_pokemon)
+    solution = solver.solve(game, grid_size, num_pokemon, time_budget=5)
+    assert solution.complete
+    assert solution.safe == {index for index, chance in expected.items() if chance == 0}
+    assert solution.mines == {index for index, chance in expected.items() if chance == 1}
+    for index, chance in solution.probabilities.items():
+        assert chance == pytest.approx(float(expected[index]))
+
+def test_certain_cells_are_right():
+    for model in played_games(100, seed=2):
+        solution = solver.solve(model.get_game(), model.get_grid_size(), model.get_num_pokemon())
+        assert not any(model.is_pokemon(index) for index in solution.safe)
+        assert all(model.is_pokemon(index) for index in solution.mines)
+
+def test_flags_are_treated_as_unknown():
+    # A flag is a guess: the flagged cell is as likely as any other to be the one pokemon
+    # next to the 1.
+    model = BoardModel(3, 1, pokemon_locations=(0,))
+    model.apply_move(REVEAL, 4)
+    model.apply_move(FLAG_MOVE, 8)
+    solution = solver.solve(model.get_game(), 3, 1, time_budget=5)
+    assert not solution.safe and not solution.mines
+    assert solution.probabilities[8] == pytest.approx(1 / 8)
+    assert solution.probabilities[0] == pytest.approx(1 / 8)
+
+def test_hint_plays_a_safe_cell_first():
+    # Revealing 2 shows 1, 2 and 1 around the opening; the 2 in the middle then leaves
+    # 6 as the only cell that can't hold a pokemon.
+    model = BoardModel(3, 2, pokemon_locations=(0, 8))
+    model.apply_move(REVEAL, 2)
+    assert solver.hint(model.get_game(), 3, 2) == (REVEAL, 6, 0.0)
+
+def test_hint_has_nothing_to_play_on_a_cleared_board():
+    model = BoardModel(2, 0, pokemon_locations=())
+    model.apply_move(REVEAL, 0)
+    assert solver.hint(model.get_game(), 2, 0) is None
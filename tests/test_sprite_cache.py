@@ -0,0 +1,59 @@
+import threading
+import time
+
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+pytest.importorskip('tkinter')
+import gui
+
+@pytest.fixture
+def images(tmp_path, monkeypatch):
+    """An images directory holding a 4 by 4 sprite and a file that isn't an image."""
+    Image.new('RGB', (4, 4), 'red').save(tmp_path / 'sprite.png')
+    (tmp_path / 'broken.png').write_bytes(b'not an image')
+    (tmp_path / 'sprites').mkdir()
+    for name in ('b.png', 'a.png'):
+        Image.new('RGB', (2, 2)).save(tmp_path / 'sprites' / name)
+    monkeypatch.setattr(gui, 'IMAGES_PATH', str(tmp_path))
+    return tmp_path
+
+def wait_for(cache, keys, timeout=5):
+    """Requests images until every one is cached, as when_ready polls."""
+    deadline = time.monotonic() + timeout
+    while not all([cache.request(*key) for key in keys]):
+        assert time.monotonic() < deadline, "sprite cache never finished"
+        time.sleep(0.01)
+
+def test_images_are_decoded_and_resized_in_the_background(images):
+    cache = gui.SpriteCache()
+    assert not cache.request('sprite.png', 8)
+    wait_for(cache, [('sprite.png', 8), ('sprite.png', None)])
+    assert cache.image('sprite.png', 8).size == (8, 8)
+    assert cache.image('sprite.png', None).size == (4, 4)
+    assert cache._worker is not threading.current_thread()
+
+def test_failures_are_cached_and_the_worker_keeps_going(images):
+    cache = gui.SpriteCache()
+    # Missing files raise OSError, a zero width ValueError; neither may stop the worker.
+    keys = [('missing.png', 8), ('broken.png', 8), ('sprite.png', 0), ('sprite.png', 6)]
+    for key in keys:
+        cache.request(*key)
+    wait_for(cache, keys)
+    assert [cache.image(*key) for key in keys[:3]] == [None, None, None]
+    assert cache.image('sprite.png', 6).size == (6, 6)
+    assert cache._worker.is_alive()
+
+def test_least_recently_used_images_are_evicted(images):
+    cache = gui.SpriteCache(max_size=2)
+    wait_for(cache, [('sprite.png', 1)])
+    wait_for(cache, [('sprite.png', 2)])
+    cache.request('sprite.png', 1)
+    wait_for(cache, [('sprite.png', 3)])
+    assert cache.image('sprite.png', 1) is not None
+    assert cache.image('sprite.png', 2) is None
+
+def test_list_assets(images):
+    cache = gui.SpriteCache()
+    assert cache.list_assets('sprites') == ('sprites/a.png', 'sprites/b.png')
+    assert cache.list_assets('nowhere') == ()